@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Job Market Analytics
+
+Salary distributions and posting trends across every posting the toolkit
+has fetched: all archived job boards and JobSpy searches (see
+payload_archive.py), plus any saved result files you pass in.
+
+The archive is flattened into a columnar corpus once and cached; later
+runs only ingest new snapshots, and every statistic is a vectorized
+pandas group-by, so analysis stays interactive at 100k+ postings.
+
+Usage:
+    python analyze.py                          # salary percentiles by title family
+    python analyze.py --by company --top 30
+    python analyze.py --by location --since 2026-01-01
+    python analyze.py job_search_20260121.json matches.ndjson --by company
+    python analyze.py --config ../../profile.json   # compare against your targets
+    python analyze.py --json > market.json
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    print("Required packages not installed. Run:")
+    print("  pip install pandas")
+    sys.exit(1)
+
+import payload_archive
+from ats_sources import ADAPTERS
+from greenhouse_search import html_to_text
+from local_cache import CACHE_DIR
+from locations import parse_location
+from salaries import backfill_salaries
+
+CORPUS_DIR = CACHE_DIR / "corpus"
+CORPUS_COLUMNS = ["source", "company", "title", "location", "min_salary", "max_salary",
+                  "posted", "first_seen", "url"]
+
+PERCENTILES = [0.1, 0.25, 0.5, 0.75, 0.9]
+
+# First match wins, so more specific families come first
+TITLE_FAMILIES = [
+    ("Data Scientist", r"data scien|analytics|\banalyst\b"),
+    ("Research Scientist", r"research (?:scientist|engineer)|\bscientist\b"),
+    ("ML / AI Engineer", r"machine learning|\bml\b|\bai\b|deep learning|\bllm|computer vision|\bnlp\b"),
+    ("Data Engineer", r"data engineer|data platform|\betl\b"),
+    ("Engineering Manager", r"engineering manager|manager, engineering|director of engineering|head of engineering"),
+    ("Infrastructure / SRE", r"infrastructure|\bsre\b|site reliability|devops|platform engineer|security engineer"),
+    ("Software Engineer", r"software|engineer|developer|\bswe\b|programmer"),
+    ("Product Manager", r"product manager|\bpm\b|product lead"),
+    ("Design", r"design"),
+    ("Sales / GTM", r"sales|account exec|business development|solutions|customer success|partnership"),
+    ("Operations", r"operations|recruit|people|finance|legal|accounting"),
+]
+
+
+# ============================================================
+# CORPUS
+# ============================================================
+
+def _empty_columns() -> dict:
+    return {column: [] for column in CORPUS_COLUMNS + ["description"]}
+
+
+def _add_board(columns: dict, jobs: list, source: str, board: str, fetched: str):
+    """Add Greenhouse-shaped jobs (any ATS, see ats_sources.py)."""
+    for job in jobs:
+        columns["source"].append(source)
+        columns["company"].append(board)
+        columns["title"].append(job.get("title") or "")
+        columns["location"].append((job.get("location") or {}).get("name") or "")
+        columns["min_salary"].append(np.nan)
+        columns["max_salary"].append(np.nan)
+        columns["posted"].append(job.get("updated_at"))
+        columns["first_seen"].append(fetched)
+        columns["url"].append(job.get("absolute_url") or f"{source}:{board}:{job.get('id')}")
+        columns["description"].append(html_to_text(job.get("content") or ""))
+
+
+def _add_jobspy(columns: dict, records: list, fetched: str):
+    for job in records:
+        columns["source"].append(job.get("site") or "jobspy")
+        columns["company"].append(job.get("company") or "")
+        columns["title"].append(job.get("title") or "")
+        columns["location"].append(job.get("location") or "")
+        columns["min_salary"].append(job.get("min_amount"))
+        columns["max_salary"].append(job.get("max_amount"))
+        columns["posted"].append(job.get("date_posted"))
+        columns["first_seen"].append(fetched)
+        columns["url"].append(job.get("job_url") or "")
+        columns["description"].append(job.get("description"))
+
+
+def _to_frame(columns: dict) -> pd.DataFrame:
+    """Columns -> corpus DataFrame, with salaries backfilled from descriptions."""
+    frame = pd.DataFrame(columns)
+    if frame.empty:
+        return frame.drop(columns="description").astype({"min_salary": float, "max_salary": float})
+
+    # backfill_salaries works on JobSpy's column names
+    frame = frame.rename(columns={"min_salary": "min_amount", "max_salary": "max_amount"})
+    frame = backfill_salaries(frame)
+    frame = frame.rename(columns={"min_amount": "min_salary", "max_amount": "max_salary"})
+
+    frame["posted"] = pd.to_datetime(frame["posted"], errors="coerce", utc=True, format="mixed")
+    frame["first_seen"] = pd.to_datetime(frame["first_seen"], errors="coerce", utc=True, format="mixed")
+    for column in ("source", "company", "location"):
+        frame[column] = frame[column].astype("category")
+    return frame[CORPUS_COLUMNS]
+
+
+def _dedupe(frame: pd.DataFrame) -> pd.DataFrame:
+    """One row per posting, keeping the first time it was seen."""
+    frame = frame.sort_values("first_seen", kind="stable")
+    return frame.drop_duplicates(subset=["source", "url"], keep="first").reset_index(drop=True)
+
+
+def load_corpus(rebuild: bool = False) -> pd.DataFrame:
+    """
+    Load every archived posting as a DataFrame (cached between runs).
+
+    Only snapshots not yet in the cached corpus are decompressed and
+    parsed; `rebuild` starts over from the raw archive.
+    """
+    corpus_path = CORPUS_DIR / "corpus.pkl"
+    ingested_path = CORPUS_DIR / "ingested.txt"
+
+    corpus = None
+    ingested = set()
+    if not rebuild and corpus_path.exists() and ingested_path.exists():
+        corpus = pd.read_pickle(corpus_path)
+        ingested = set(ingested_path.read_text().split())
+
+    columns = _empty_columns()
+    new_snapshots = []
+    for date in payload_archive.archived_dates():
+        for entry in payload_archive.iter_index(date):
+            if entry.sha256 in ingested or (entry.source not in ADAPTERS and entry.source != "jobspy"):
+                continue
+            try:
+                payload = payload_archive.load_payload(entry)
+            except (OSError, RuntimeError) as e:
+                print(f"Skipping snapshot {entry.sha256[:12]}: {e}", file=sys.stderr)
+                continue
+            if entry.source == "jobspy":
+                _add_jobspy(columns, json.loads(payload), entry.fetched_at)
+            else:
+                jobs = ADAPTERS[entry.source].parse(payload)["jobs"]
+                _add_board(columns, jobs, entry.source, entry.key, entry.fetched_at)
+            ingested.add(entry.sha256)
+            new_snapshots.append(entry.sha256)
+
+    if corpus is not None and not new_snapshots:
+        return corpus
+
+    frames = [frame for frame in (corpus, _to_frame(columns)) if frame is not None and not frame.empty]
+    corpus = _dedupe(pd.concat(frames, ignore_index=True)) if frames else _to_frame(_empty_columns())
+    for column in ("source", "company", "location"):
+        corpus[column] = corpus[column].astype("category")
+
+    CORPUS_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = corpus_path.with_suffix(".tmp")
+    corpus.to_pickle(tmp)
+    os.replace(tmp, corpus_path)
+    ingested_path.write_text("\n".join(sorted(ingested)))
+    return corpus
+
+
+def load_result_file(path: str) -> pd.DataFrame:
+    """Load a saved result file (job_search JSON/CSV, greenhouse JSON/NDJSON)."""
+    path = Path(path)
+    fetched = datetime.fromtimestamp(path.stat().st_mtime).isoformat()
+    if path.suffix == ".csv":
+        records = json.loads(pd.read_csv(path).to_json(orient="records"))
+    else:
+        text = path.read_text(encoding="utf-8")
+        if path.suffix in (".ndjson", ".jsonl"):
+            records = [json.loads(line) for line in text.splitlines() if line.strip()]
+        else:
+            records = json.loads(text)
+
+    # greenhouse_search output carries the board in "_company"
+    by_board: dict[tuple, list] = {}
+    others = []
+    for record in records:
+        if "absolute_url" in record:
+            board = (record.get("source", "greenhouse"), record.get("_company", ""))
+            by_board.setdefault(board, []).append(record)
+        else:
+            others.append(record)
+
+    columns = _empty_columns()
+    for (source, board), jobs in by_board.items():
+        _add_board(columns, jobs, source, board, fetched)
+    _add_jobspy(columns, others, fetched)
+    return _to_frame(columns)
+
+
+# ============================================================
+# ANALYSIS (all vectorized)
+# ============================================================
+
+def add_dimensions(corpus: pd.DataFrame) -> pd.DataFrame:
+    """Add title_family, metro (canonical location) and salary midpoint columns."""
+    corpus = corpus.copy()
+
+    # Titles repeat heavily, so classify each distinct title once
+    codes, titles = pd.factorize(corpus["title"].astype(str).str.lower())
+    titles = pd.Series(titles)
+    conditions = [titles.str.contains(pattern, regex=True).to_numpy() for _, pattern in TITLE_FAMILIES]
+    families = np.select(conditions, [name for name, _ in TITLE_FAMILIES], default="Other")
+    corpus["title_family"] = pd.Categorical(families[codes])
+
+    # Parse each distinct location string once
+    def canonical(text: str) -> str:
+        places = parse_location(text)
+        if not places:
+            return text or "Unknown"
+        place = places[0]
+        if place.remote:
+            return f"Remote ({place.country})" if place.country else "Remote"
+        return place.metro or place.city or place.state or place.country or "Unknown"
+
+    locations = corpus["location"].astype(str)
+    corpus["metro"] = locations.map({loc: canonical(loc) for loc in locations.unique()}).astype("category")
+
+    corpus["salary"] = corpus[["min_salary", "max_salary"]].mean(axis=1)
+    return corpus
+
+
+def salary_table(corpus: pd.DataFrame, by: str, min_count: int = 5) -> pd.DataFrame:
+    """Posting counts and salary percentiles per group, sorted by median salary."""
+    grouped = corpus.groupby(by, observed=True)
+    counts = grouped.size().rename("postings")
+    with_salary = corpus[corpus["salary"].notna()].groupby(by, observed=True)["salary"]
+    quantiles = with_salary.quantile(PERCENTILES).unstack()
+    quantiles.columns = [f"p{int(q * 100)}" for q in PERCENTILES]
+
+    table = pd.concat([counts, with_salary.size().rename("with_salary"), quantiles], axis=1)
+    table["with_salary"] = table["with_salary"].fillna(0).astype(int)
+    table = table[table["with_salary"] >= min_count]
+    return table.sort_values("p50", ascending=False)
+
+
+def weekly_trend(corpus: pd.DataFrame, weeks: int = 8) -> pd.DataFrame:
+    """New postings per week (by first-seen date) with week-over-week change."""
+    seen = corpus["first_seen"].dropna()
+    if seen.empty:
+        return pd.DataFrame(columns=["new_postings", "wow_change"])
+    week = seen.dt.tz_localize(None).dt.to_period("W").dt.start_time
+    counts = week.value_counts().sort_index()
+    counts = counts.reindex(pd.date_range(counts.index.min(), counts.index.max(), freq="7D"), fill_value=0)
+    trend = pd.DataFrame({"new_postings": counts})
+    trend["wow_change"] = trend["new_postings"].pct_change().replace([np.inf, -np.inf], np.nan)
+    trend.index.name = "week"
+    return trend.tail(weeks)
+
+
+def profile_position(corpus: pd.DataFrame, profile: dict) -> dict:
+    """Where the profile's min_salary sits among postings for its target titles."""
+    job_search = profile.get("job_search", {})
+    titles = [t.lower() for t in job_search.get("target_titles", [])]
+    min_salary = job_search.get("min_salary")
+    if not titles:
+        return {}
+
+    lowered = corpus["title"].astype(str).str.lower()
+    mask = np.logical_or.reduce([lowered.str.contains(t, regex=False) for t in titles])
+    salaries = corpus.loc[mask, "salary"].dropna()
+    result = {"target_titles": job_search.get("target_titles"), "postings": int(mask.sum()),
+              "with_salary": int(len(salaries))}
+    if len(salaries):
+        result.update({f"p{int(q * 100)}": float(salaries.quantile(q)) for q in PERCENTILES})
+        if min_salary:
+            result["min_salary"] = min_salary
+            result["min_salary_percentile"] = float((salaries < min_salary).mean() * 100)
+    return result
+
+
+def _money(value) -> str:
+    return f"${value / 1000:,.0f}k" if pd.notna(value) else "-"
+
+
+def format_report(table: pd.DataFrame, by_label: str, trend: pd.DataFrame,
+                  total: int, position: dict = None) -> str:
+    lines = [f"\n{'=' * 80}", f"Salary by {by_label} ({total:,} postings)", f"{'=' * 80}"]
+    lines.append(f"{by_label:<32} {'posts':>6} {'w/ $':>6} " +
+                 " ".join(f"{c:>7}" for c in ["p10", "p25", "p50", "p75", "p90"]))
+    for name, row in table.iterrows():
+        lines.append(f"{str(name)[:32]:<32} {int(row['postings']):>6} {int(row['with_salary']):>6} " +
+                     " ".join(f"{_money(row[c]):>7}" for c in ["p10", "p25", "p50", "p75", "p90"]))
+
+    lines.append(f"\nNew postings per week")
+    lines.append("-" * 40)
+    for week, row in trend.iterrows():
+        change = f"{row['wow_change']:+.0%}" if pd.notna(row["wow_change"]) else ""
+        lines.append(f"  {week:%Y-%m-%d}  {int(row['new_postings']):>6}  {change}")
+
+    if position and position.get("with_salary"):
+        lines.append(f"\nYour targets ({', '.join(position['target_titles'])}): "
+                     f"{position['with_salary']} postings with salary")
+        lines.append("  " + "  ".join(f"p{int(q * 100)} {_money(position[f'p{int(q * 100)}'])}"
+                                      for q in PERCENTILES))
+        if "min_salary_percentile" in position:
+            lines.append(f"  Your min_salary {_money(position['min_salary'])} is above "
+                         f"{position['min_salary_percentile']:.0f}% of them")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Salary and market analytics over fetched postings")
+    parser.add_argument("files", nargs="*", help="Extra result files (JSON, NDJSON, CSV) to include")
+    parser.add_argument("--by", choices=["family", "company", "location", "source"], default="family",
+                        help="Group salaries by (default: family)")
+    parser.add_argument("--since", help="Only postings first seen on/after DATE (YYYY-MM-DD)")
+    parser.add_argument("--min-count", type=int, default=5, help="Minimum postings with salary per group")
+    parser.add_argument("--top", type=int, default=25, help="Rows to show")
+    parser.add_argument("--weeks", type=int, default=8, help="Weeks of posting trend to show")
+    parser.add_argument("--config", "-c", help="profile.json: compare min_salary against target titles")
+    parser.add_argument("--no-archive", action="store_true", help="Only analyze the given files")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the cached corpus from the archive")
+    parser.add_argument("--json", "-j", action="store_true", help="Output as JSON")
+
+    args = parser.parse_args()
+
+    frames = [] if args.no_archive else [load_corpus(rebuild=args.rebuild)]
+    frames.extend(load_result_file(path) for path in args.files)
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        parser.error("No postings found: run some searches first or pass result files")
+    corpus = _dedupe(pd.concat(frames, ignore_index=True)) if len(frames) > 1 else frames[0]
+
+    if args.since:
+        since = pd.Timestamp(args.since, tz="UTC")
+        corpus = corpus[corpus["first_seen"] >= since]
+
+    corpus = add_dimensions(corpus)
+    by = {"family": "title_family", "location": "metro"}.get(args.by, args.by)
+    table = salary_table(corpus, by, min_count=args.min_count).head(args.top)
+    trend = weekly_trend(corpus, weeks=args.weeks)
+
+    position = None
+    if args.config:
+        with open(args.config) as f:
+            position = profile_position(corpus, json.load(f))
+
+    if args.json:
+        result = {
+            "postings": int(len(corpus)),
+            "by": args.by,
+            "groups": json.loads(table.reset_index().rename(columns={by: args.by})
+                                 .to_json(orient="records")),
+            "weekly": json.loads(trend.reset_index().to_json(orient="records", date_format="iso")),
+            "profile": position,
+        }
+        print(json.dumps(result, indent=2))
+    else:
+        print(format_report(table, args.by, trend, len(corpus), position))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+ATS Source Adapters
+
+Public job-board APIs (Greenhouse, Lever, Ashby) behind one interface.
+Each adapter knows its board URL and how to turn a raw payload into
+Greenhouse-shaped job dicts:
+
+    id, title, absolute_url, location {"name"}, departments [{"name"}],
+    updated_at (ISO-8601), content (description HTML), source
+
+so greenhouse_search's filters and formatting work on every source.
+
+Fetching is shared: every request goes through one per-host rate limiter,
+raw payloads are archived (see payload_archive.py) and cached, and
+fetch_concurrently() sweeps boards from any mix of sources in parallel.
+
+Board specs pick a source with a prefix ("lever:palantir",
+"ashby:linear"); bare names use the default source (Greenhouse).
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Iterator, Optional
+from urllib.parse import urlparse
+
+import requests
+
+import local_cache
+import payload_archive
+
+# Boards fetched in parallel during a sweep
+DEFAULT_WORKERS = 8
+
+# Requests per second allowed per API host (bursts up to the same count)
+HOST_RATES = {
+    "boards-api.greenhouse.io": 10,
+    "api.lever.co": 5,
+    "api.ashbyhq.com": 5,
+}
+DEFAULT_RATE = 5
+
+# Retries after HTTP 429 before giving up
+MAX_RETRIES = 3
+
+# Interactive searches reuse boards fetched this recently (seconds); see prewarm.py
+BOARD_CACHE_TTL = 12 * 3600
+
+
+# ============================================================
+# SHARED FETCHING
+# ============================================================
+
+class RateLimiter:
+    """Token bucket shared by all threads: `rate` requests/second, bursts up to `burst`."""
+
+    def __init__(self, rate: float, burst: int = None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be made."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+_LIMITERS: dict[str, RateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def _limiter(host: str) -> RateLimiter:
+    with _LIMITERS_LOCK:
+        if host not in _LIMITERS:
+            _LIMITERS[host] = RateLimiter(HOST_RATES.get(host, DEFAULT_RATE))
+        return _LIMITERS[host]
+
+
+def rate_limited_get(url: str, **kwargs) -> requests.Response:
+    """
+    requests.get, throttled per host and retried on HTTP 429.
+
+    Every ATS request should go through here so parallel sweeps stay
+    within each API's limits.
+    """
+    limiter = _limiter(urlparse(url).netloc)
+    for attempt in range(MAX_RETRIES + 1):
+        limiter.acquire()
+        response = requests.get(url, **kwargs)
+        if response.status_code != 429 or attempt == MAX_RETRIES:
+            return response
+        try:
+            delay = float(response.headers.get("Retry-After", 1))
+        except ValueError:
+            delay = 1.0
+        # Release the connection (streamed bodies are never read) before waiting
+        response.close()
+        time.sleep(min(delay, 30))
+    return response
+
+
+def fetch_concurrently(fetch: Callable, boards: Iterable, max_workers: int = DEFAULT_WORKERS,
+                       ordered: bool = True) -> Iterator:
+    """
+    Call `fetch(board)` for every board in parallel.
+
+    Yields (board, result) in input order, each as soon as it and every
+    board before it are done, so output stays in a stable order while
+    the network work overlaps. With `ordered=False` each result is
+    yielded the moment its board finishes (lowest time to first result).
+    Stopping early cancels boards that haven't started.
+    """
+    boards = list(boards)
+    pool = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    try:
+        futures = {pool.submit(fetch, board): i for i, board in enumerate(boards)}
+        for future in (futures if ordered else as_completed(futures)):
+            yield boards[futures[future]], future.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+# ============================================================
+# ADAPTERS
+# ============================================================
+
+class SourceAdapter:
+    """One job-board API: where a board lives and how to read its payload."""
+
+    name = ""
+    params: dict = {}
+    archive = True  # Archive fetched payloads (full boards only)
+
+    def board_url(self, token: str) -> str:
+        raise NotImplementedError
+
+    def board_token(self, name: str) -> str:
+        """Board token for a company name."""
+        return name.strip().lower().replace(" ", "")
+
+    def parse(self, payload: bytes) -> dict:
+        """
+        Raw API response -> {"jobs": [Greenhouse-shaped dicts]}.
+
+        Raises ValueError for payloads that aren't a job board.
+        """
+        raise NotImplementedError
+
+
+class GreenhouseAdapter(SourceAdapter):
+    """boards-api.greenhouse.io (already the normalized shape)."""
+
+    name = "greenhouse"
+
+    def __init__(self, content: bool = True):
+        self.params = {"content": "true"} if content else {}
+        self.archive = content
+
+    def board_url(self, token: str) -> str:
+        return f"https://boards-api.greenhouse.io/v1/boards/{token}/jobs"
+
+    def board_token(self, name: str) -> str:
+        return name.lower().replace(" ", "").replace("-", "")
+
+    def parse(self, payload: bytes) -> dict:
+        data = json.loads(payload)
+        if not isinstance(data, dict) or "jobs" not in data:
+            raise ValueError("response has no 'jobs' list")
+        return data
+
+
+def _from_epoch_ms(value) -> Optional[str]:
+    if not value:
+        return None
+    return datetime.fromtimestamp(value / 1000, tz=timezone.utc).isoformat()
+
+
+class LeverAdapter(SourceAdapter):
+    """api.lever.co/v0/postings/{company}?mode=json"""
+
+    name = "lever"
+    params = {"mode": "json"}
+
+    def board_url(self, token: str) -> str:
+        return f"https://api.lever.co/v0/postings/{token}"
+
+    def parse(self, payload: bytes) -> dict:
+        postings = json.loads(payload)
+        if not isinstance(postings, list):
+            # Errors come back as {"ok": false, "error": "..."}
+            raise ValueError(postings.get("error", "unexpected response") if isinstance(postings, dict)
+                             else "unexpected response")
+        return {"jobs": [self.normalize(posting) for posting in postings]}
+
+    def normalize(self, posting: dict) -> dict:
+        categories = posting.get("categories") or {}
+
+        sections = [posting.get("description") or ""]
+        for section in posting.get("lists") or []:
+            sections.append(f"<h3>{section.get('text', '')}</h3><ul>{section.get('content', '')}</ul>")
+        sections.append(posting.get("additional") or "")
+        sections.append(posting.get("salaryDescription") or "")
+        salary = posting.get("salaryRange") or {}
+        # Hourly ranges would be misread as annual "k" amounts, so only yearly ones
+        if salary.get("min") and salary.get("max") and "year" in (salary.get("interval") or "per-year"):
+            sections.append(f"<p>Salary: ${salary['min']:,} - ${salary['max']:,} "
+                            f"{salary.get('currency', '')}</p>")
+
+        locations = categories.get("allLocations") or [categories.get("location")]
+        department = categories.get("department") or categories.get("team")
+        return {
+            "id": posting.get("id"),
+            "title": posting.get("text") or "",
+            "absolute_url": posting.get("hostedUrl") or "",
+            "location": {"name": "; ".join(loc for loc in locations if loc)},
+            "departments": [{"name": department}] if department else [],
+            "updated_at": _from_epoch_ms(posting.get("createdAt")),
+            "content": "".join(sections),
+            "source": self.name,
+        }
+
+
+class AshbyAdapter(SourceAdapter):
+    """api.ashbyhq.com/posting-api/job-board/{name}"""
+
+    name = "ashby"
+    params = {"includeCompensation": "true"}
+
+    def board_url(self, token: str) -> str:
+        return f"https://api.ashbyhq.com/posting-api/job-board/{token}"
+
+    def board_token(self, name: str) -> str:
+        return name.strip().replace(" ", "")
+
+    def parse(self, payload: bytes) -> dict:
+        data = json.loads(payload)
+        if not isinstance(data, dict) or "jobs" not in data:
+            raise ValueError("response has no 'jobs' list")
+        return {"jobs": [self.normalize(job) for job in data["jobs"] if job.get("isListed", True)]}
+
+    def normalize(self, job: dict) -> dict:
+        locations = [job.get("location") or ""]
+        locations += [loc.get("location", "") for loc in job.get("secondaryLocations") or []]
+        location = "; ".join(loc for loc in locations if loc)
+        if job.get("isRemote") and "remote" not in location.lower():
+            location = f"{location}; Remote" if location else "Remote"
+
+        content = job.get("descriptionHtml") or ""
+        compensation = job.get("compensation") or {}
+        summary = (compensation.get("scrapeableCompensationSalarySummary")
+                   or compensation.get("compensationTierSummary"))
+        if summary:
+            content += f"<p>Compensation: {summary}</p>"
+
+        department = job.get("department") or job.get("team")
+        return {
+            "id": job.get("id"),
+            "title": job.get("title") or "",
+            "absolute_url": job.get("jobUrl") or "",
+            "location": {"name": location},
+            "departments": [{"name": department}] if department else [],
+            "updated_at": job.get("publishedAt"),
+            "content": content,
+            "source": self.name,
+        }
+
+
+ADAPTERS = {
+    "greenhouse": GreenhouseAdapter(),
+    "lever": LeverAdapter(),
+    "ashby": AshbyAdapter(),
+}
+
+
+def split_spec(spec: str, default_source: str = "greenhouse") -> tuple[SourceAdapter, str]:
+    """'lever:palantir' -> (LeverAdapter, 'palantir'); bare names use `default_source`."""
+    source, sep, name = spec.partition(":")
+    if sep and source.lower() in ADAPTERS:
+        return ADAPTERS[source.lower()], name
+    return ADAPTERS[default_source], spec
+
+
+def board_key(adapter: SourceAdapter, token: str) -> str:
+    """Stable name for a board (checkpoints, replay): bare token for Greenhouse."""
+    return token if adapter.name == "greenhouse" else f"{adapter.name}:{token}"
+
+
+def _cache_key(adapter: SourceAdapter, token: str) -> dict:
+    return {"source": adapter.name, "token": token, "params": adapter.params}
+
+
+def cached_board(adapter: SourceAdapter, token: str, max_age: float = BOARD_CACHE_TTL) -> Optional[dict]:
+    """The board as last fetched, if that was at most `max_age` seconds ago."""
+    cached = local_cache.load_cached("ats_boards", _cache_key(adapter, token), max_age=max_age)
+    if cached is None:
+        return None
+    try:
+        return adapter.parse(cached)
+    except ValueError:
+        return None  # Unreadable entry: fetch the board again
+
+
+def board_cache_age(adapter: SourceAdapter, token: str) -> Optional[float]:
+    """Seconds since the board was last fetched (None if never cached)."""
+    return local_cache.cache_age("ats_boards", _cache_key(adapter, token))
+
+
+def fetch_board(adapter: SourceAdapter, token: str, max_age: Optional[float] = None) -> dict:
+    """
+    Fetch and normalize one board.
+
+    With `max_age` (seconds), a payload cached at most that long ago is
+    used instead of the network; None always fetches. Every live fetch
+    refreshes the cache and (for full boards) the archive.
+
+    Returns {"jobs": [...]} or {"error": ..., "jobs": []}.
+    """
+    if max_age is not None:
+        cached = cached_board(adapter, token, max_age)
+        if cached is not None:
+            return cached
+
+    try:
+        response = rate_limited_get(adapter.board_url(token), params=adapter.params, timeout=30)
+        if response.status_code == 404:
+            return {"error": f"Board '{token}' not found on {adapter.name}", "jobs": []}
+        response.raise_for_status()
+        data = adapter.parse(response.content)
+    except requests.exceptions.RequestException as e:
+        return {"error": str(e), "jobs": []}
+    except ValueError as e:
+        return {"error": f"Unreadable {adapter.name} response for '{token}': {e}", "jobs": []}
+
+    local_cache.store_cached("ats_boards", _cache_key(adapter, token), response.content)
+    if adapter.archive:
+        payload_archive.archive_payload(adapter.name, token, response.content)
+    return data
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Sweep Checkpoints
+
+Long sweeps (150 Greenhouse boards, every JobSpy site) save each unit's
+results as soon as that unit finishes, so an interrupted run can pick up
+where it stopped with --resume instead of redoing finished network work.
+
+Checkpoints are grouped by the sweep's parameters (filters, query), so
+resuming with different filters starts fresh rather than mixing results.
+"""
+
+import hashlib
+import json
+import re
+import shutil
+from pathlib import Path
+from typing import Iterator, Optional
+
+from local_cache import CACHE_DIR, atomic_write_bytes
+
+
+class SweepCheckpoint:
+    """Per-unit results of one sweep, written atomically as each unit finishes."""
+
+    def __init__(self, kind: str, params: dict):
+        digest = hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+        self.kind = kind
+        self.params = params
+        self.dir = CACHE_DIR / "checkpoints" / kind / digest[:16]
+
+    def _path(self, unit: str) -> Path:
+        slug = re.sub(r"[^A-Za-z0-9._-]+", "_", unit)[:60]
+        digest = hashlib.sha1(unit.encode("utf-8")).hexdigest()[:8]
+        return self.dir / f"{slug}-{digest}.json"
+
+    def is_done(self, unit: str) -> bool:
+        return self._path(unit).exists()
+
+    def load(self, unit: str) -> Optional[dict]:
+        """Saved payload for a finished unit, or None."""
+        try:
+            with open(self._path(unit), encoding="utf-8") as f:
+                return json.load(f)["payload"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return None
+
+    def save(self, unit: str, payload):
+        """Mark `unit` finished with a JSON-serializable payload."""
+        data = json.dumps({"unit": unit, "payload": payload}, default=str)
+        atomic_write_bytes(self._path(unit), data.encode("utf-8"))
+
+    def completed(self) -> Iterator[tuple[str, object]]:
+        """Yield (unit, payload) for every finished unit."""
+        if not self.dir.exists():
+            return
+        for path in sorted(self.dir.glob("*.json")):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    saved = json.load(f)
+                yield saved["unit"], saved["payload"]
+            except (json.JSONDecodeError, KeyError):
+                continue
+
+    def clear(self):
+        """Forget all finished units (start the sweep from scratch)."""
+        shutil.rmtree(self.dir, ignore_errors=True)
@@ -1,265 +1,537 @@
-#!/usr/bin/env python3
-"""
-Email Pattern Finder
-
-Given a name and company domain, generates likely email addresses
-and optionally verifies them via Hunter.io API.
-
-Usage:
-    python email_finder.py "John Smith" company.com
-    python email_finder.py "Jane Doe" anthropic.com --verify
-    python email_finder.py --domain stripe.com --pattern  # Just show pattern
-"""
-
-import argparse
-import os
-import re
-import json
-import sys
-from pathlib import Path
-from typing import Optional
-
-try:
-    import requests
-except ImportError:
-    print("Required: pip install requests")
-    sys.exit(1)
-
-
-def load_env():
-    """Load environment variables from .env file if it exists."""
-    env_paths = [
-        Path(__file__).parent.parent / ".env",  # toolkit/.env
-        Path(__file__).parent / ".env",          # scripts/.env
-        Path.cwd() / ".env",                     # current directory
-    ]
-    for env_path in env_paths:
-        if env_path.exists():
-            with open(env_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, value = line.split("=", 1)
-                        os.environ.setdefault(key.strip(), value.strip())
-            break
-
-
-# Load .env on import
-load_env()
-
-
-# Common email patterns (ordered by frequency)
-PATTERNS = [
-    "{first}.{last}",      # john.smith@
-    "{first}{last}",       # johnsmith@
-    "{first}",             # john@
-    "{f}{last}",           # jsmith@
-    "{first}{l}",          # johns@ (OpenAI pattern)
-    "{first}_{last}",      # john_smith@
-    "{last}.{first}",      # smith.john@
-    "{f}.{last}",          # j.smith@
-    "{first}.{l}",         # john.s@
-    "{last}",              # smith@
-    "{first}-{last}",      # john-smith@
-]
-
-
-def normalize_name(name: str) -> tuple[str, str]:
-    """Extract first and last name, handle edge cases."""
-    parts = name.strip().split()
-    if len(parts) == 1:
-        return parts[0].lower(), ""
-    # Handle "Dr. John Smith" or "John Smith Jr."
-    # Take first non-title and last non-suffix
-    titles = {"dr", "mr", "ms", "mrs", "prof"}
-    suffixes = {"jr", "sr", "ii", "iii", "iv", "phd", "md"}
-
-    clean_parts = [p for p in parts if p.lower().rstrip(".") not in titles
-                   and p.lower().rstrip(".") not in suffixes]
-
-    if len(clean_parts) >= 2:
-        return clean_parts[0].lower(), clean_parts[-1].lower()
-    elif len(clean_parts) == 1:
-        return clean_parts[0].lower(), ""
-    else:
-        return parts[0].lower(), parts[-1].lower()
-
-
-def generate_emails(first: str, last: str, domain: str) -> list[str]:
-    """Generate all likely email permutations."""
-    if not first:
-        return []
-
-    emails = []
-    f = first[0]  # First initial
-    l = last[0] if last else ""  # Last initial
-
-    for pattern in PATTERNS:
-        try:
-            email = pattern.format(
-                first=first,
-                last=last,
-                f=f,
-                l=l
-            )
-            # Skip patterns that need last name if we don't have one
-            if not last and "{last}" in pattern:
-                continue
-            emails.append(f"{email}@{domain}")
-        except (KeyError, IndexError):
-            continue
-
-    return emails
-
-
-def verify_with_hunter(email: str, api_key: str) -> dict:
-    """Verify email using Hunter.io API."""
-    url = "https://api.hunter.io/v2/email-verifier"
-    params = {"email": email, "api_key": api_key}
-
-    try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        return response.json().get("data", {})
-    except requests.exceptions.RequestException as e:
-        return {"error": str(e)}
-
-
-def get_domain_pattern(domain: str, api_key: str) -> Optional[str]:
-    """Get email pattern for a domain using Hunter.io."""
-    url = "https://api.hunter.io/v2/domain-search"
-    params = {"domain": domain, "api_key": api_key}
-
-    try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json().get("data", {})
-        return data.get("pattern")
-    except requests.exceptions.RequestException as e:
-        return None
-
-
-def format_output(name: str, domain: str, emails: list[str],
-                  verified: dict = None, pattern: str = None) -> str:
-    """Format results for display."""
-    lines = [
-        f"\n{'='*60}",
-        f"Email Finder Results",
-        f"{'='*60}",
-        f"Name: {name}",
-        f"Domain: {domain}",
-    ]
-
-    if pattern:
-        lines.append(f"Known Pattern: {pattern}")
-
-    lines.append(f"\nLikely Email Addresses (in order of probability):")
-    lines.append("-" * 40)
-
-    for i, email in enumerate(emails[:10], 1):
-        status = ""
-        if verified and email in verified:
-            v = verified[email]
-            if v.get("error"):
-                status = f" [Error: {v['error']}]"
-            elif v.get("result") == "deliverable":
-                status = " ✓ VERIFIED"
-            elif v.get("result") == "undeliverable":
-                status = " ✗ Invalid"
-            else:
-                status = f" [{v.get('result', 'unknown')}]"
-
-        lines.append(f"  {i}. {email}{status}")
-
-    lines.append("")
-    return "\n".join(lines)
-
-
-def main():
-    parser = argparse.ArgumentParser(description="Find email addresses for a person at a company")
-    parser.add_argument("name", nargs="?", help="Person's full name (e.g., 'John Smith')")
-    parser.add_argument("domain", nargs="?", help="Company domain (e.g., 'company.com')")
-    parser.add_argument("--verify", "-v", action="store_true",
-                        help="Verify emails with Hunter.io (requires HUNTER_API_KEY env var)")
-    parser.add_argument("--pattern", "-p", action="store_true",
-                        help="Look up domain's email pattern only (domain as first positional arg)")
-    parser.add_argument("--json", "-j", action="store_true",
-                        help="Output as JSON")
-
-    args = parser.parse_args()
-
-    # Get Hunter.io API key if needed
-    api_key = os.environ.get("HUNTER_API_KEY")
-
-    # For --pattern, use 'name' arg as domain if domain not provided
-    if args.pattern and args.name and not args.domain:
-        args.domain = args.name
-        args.name = None
-
-    if args.pattern and args.domain:
-        if not api_key:
-            print("Error: HUNTER_API_KEY environment variable required for --pattern")
-            print("Get a free key at https://hunter.io/")
-            sys.exit(1)
-
-        pattern = get_domain_pattern(args.domain, api_key)
-        if pattern:
-            print(f"Email pattern for {args.domain}: {pattern}")
-        else:
-            print(f"Could not determine pattern for {args.domain}")
-        return
-
-    if not args.name or not args.domain:
-        parser.error("name and domain are required")
-
-    # Generate emails
-    first, last = normalize_name(args.name)
-    emails = generate_emails(first, last, args.domain)
-
-    # Get pattern if API key available
-    pattern = None
-    if api_key:
-        pattern = get_domain_pattern(args.domain, api_key)
-
-        # If we know the pattern, prioritize that format
-        if pattern:
-            pattern_email = pattern.format(
-                first=first, last=last, f=first[0], l=last[0] if last else ""
-            ) + f"@{args.domain}"
-            if pattern_email in emails:
-                emails.remove(pattern_email)
-            emails.insert(0, pattern_email)
-
-    # Verify if requested
-    verified = {}
-    if args.verify:
-        if not api_key:
-            print("Error: HUNTER_API_KEY environment variable required for --verify")
-            print("Get a free key at https://hunter.io/")
-            sys.exit(1)
-
-        print("Verifying emails (this may take a moment)...")
-        # Only verify top 3 to conserve API calls
-        for email in emails[:3]:
-            verified[email] = verify_with_hunter(email, api_key)
-
-    # Output
-    if args.json:
-        result = {
-            "name": args.name,
-            "domain": args.domain,
-            "pattern": pattern,
-            "emails": emails[:10],
-            "verified": verified if verified else None
-        }
-        print(json.dumps(result, indent=2))
-    else:
-        print(format_output(args.name, args.domain, emails, verified, pattern))
-
-        if not api_key:
-            print("Tip: Set HUNTER_API_KEY for pattern detection and verification")
-            print("     Get a free key at https://hunter.io/")
-
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+"""
+Email Pattern Finder
+
+Given a name and company domain, generates likely email addresses
+and optionally verifies them via Hunter.io API.
+
+Usage:
+    python email_finder.py "John Smith" company.com
+    python email_finder.py "Jane Doe" anthropic.com --verify
+    python email_finder.py --domain stripe.com --pattern  # Just show pattern
+    python email_finder.py --bulk crm_export.csv -o candidates.csv
+
+Domain patterns are cached for 30 days (see prewarm.py); --refresh
+looks them up again.
+"""
+
+import argparse
+import csv
+import os
+import re
+import json
+import string
+import sys
+import unicodedata
+from contextlib import nullcontext
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+try:
+    import requests
+except ImportError:
+    print("Required: pip install requests")
+    sys.exit(1)
+
+import local_cache
+
+
+def load_env():
+    """Load environment variables from .env file if it exists."""
+    env_paths = [
+        Path(__file__).parent.parent / ".env",  # toolkit/.env
+        Path(__file__).parent / ".env",          # scripts/.env
+        Path.cwd() / ".env",                     # current directory
+    ]
+    for env_path in env_paths:
+        if env_path.exists():
+            with open(env_path) as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith("#") and "=" in line:
+                        key, value = line.split("=", 1)
+                        os.environ.setdefault(key.strip(), value.strip())
+            break
+
+
+# Load .env on import
+load_env()
+
+
+# Common email patterns (ordered by frequency)
+PATTERNS = [
+    "{first}.{last}",      # john.smith@
+    "{first}{last}",       # johnsmith@
+    "{first}",             # john@
+    "{f}{last}",           # jsmith@
+    "{first}{l}",          # johns@ (OpenAI pattern)
+    "{first}_{last}",      # john_smith@
+    "{last}.{first}",      # smith.john@
+    "{f}.{last}",          # j.smith@
+    "{first}.{l}",         # john.s@
+    "{last}",              # smith@
+    "{first}-{last}",      # john-smith@
+]
+
+
+def _emitter(pattern: str) -> Callable[[str, str, str, str], str]:
+    """Pattern parsed once into a function of (first, last, f, l)."""
+    pieces = [(literal, field) for literal, field, _, _ in string.Formatter().parse(pattern)]
+
+    def emit(first: str, last: str, f: str, l: str) -> str:
+        values = {"first": first, "last": last, "f": f, "l": l}
+        return "".join(literal + (values[field] if field else "") for literal, field in pieces)
+
+    return emit
+
+
+_EMITTERS = [(pattern, "{last}" in pattern, _emitter(pattern)) for pattern in PATTERNS]
+
+# Company email patterns rarely change; Hunter domain searches are quota-limited
+PATTERN_CACHE_TTL = 30 * 24 * 3600
+
+TITLES = {"dr", "mr", "ms", "mrs", "prof"}
+SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "phd", "md"}
+
+# Lowercase surname particles ("de la Cruz", "van Dyke", "bin Salman")
+PARTICLES = {"van", "von", "der", "den", "de", "del", "della", "di", "da", "dos", "das",
+             "du", "la", "le", "ter", "ten", "st", "bin", "al", "el"}
+
+# Letters NFKD doesn't decompose into ASCII
+_TRANSLITERATE = str.maketrans({
+    "ß": "ss", "æ": "ae", "Æ": "AE", "ø": "o", "Ø": "O", "œ": "oe", "Œ": "OE",
+    "ł": "l", "Ł": "L", "đ": "d", "Đ": "D", "ð": "d", "Ð": "D", "þ": "th", "Þ": "TH", "ı": "i",
+})
+_LOCAL_PART_RE = re.compile(r"[^a-z0-9-]")
+
+
+@lru_cache(maxsize=65536)
+def ascii_fold(text: str) -> str:
+    """Transliterate to lowercase ASCII: "José Núñez" -> "jose nunez"."""
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text.translate(_TRANSLITERATE))
+    return decomposed.encode("ascii", "ignore").decode("ascii").lower()
+
+
+def normalize_name(name: str) -> tuple[str, str]:
+    """Extract first and last name, handle edge cases."""
+    # Scripts with no ASCII transliteration ("Анна", "张伟") are kept as typed
+    parts = [ascii_fold(part) or part.lower() for part in name.split()]
+    if len(parts) == 1:
+        return parts[0], ""
+    # Handle "Dr. John Smith" or "John Smith Jr."
+    # Take first non-title and last non-suffix
+    clean_parts = [p for p in parts if p.rstrip(".") not in TITLES
+                   and p.rstrip(".") not in SUFFIXES]
+
+    if len(clean_parts) >= 2:
+        return clean_parts[0].lower(), clean_parts[-1].lower()
+    elif len(clean_parts) == 1:
+        return clean_parts[0].lower(), ""
+    else:
+        return parts[0].lower(), parts[-1].lower()
+
+
+def generate_emails(first: str, last: str, domain: str) -> list[str]:
+    """Generate all likely email permutations."""
+    if not first:
+        return []
+
+    emails = []
+    f = first[0]  # First initial
+    l = last[0] if last else ""  # Last initial
+
+    for _, needs_last, emit in _EMITTERS:
+        # Skip patterns that need last name if we don't have one
+        if not last and needs_last:
+            continue
+        emails.append(f"{emit(first, last, f, l)}@{domain}")
+
+    return emails
+
+
+def _local_part(token: str) -> str:
+    token = token.replace("'", "").replace("’", "")
+    folded = _LOCAL_PART_RE.sub("", ascii_fold(token))
+    if folded.strip("-"):
+        return folded
+    # Scripts with no ASCII transliteration ("Анна", "张伟") are kept as typed
+    return "".join(c for c in token.lower() if c.isalnum() or c == "-")
+
+
+@lru_cache(maxsize=131072)
+def name_variants(name: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Likely spellings of a person's first and last name in email addresses.
+
+    Handles "Last, First" order, titles/suffixes, non-ASCII letters,
+    apostrophes, hyphenated and two-part surnames and surname particles.
+    Names with no ASCII transliteration are kept as typed. The most
+    likely spelling comes first:
+
+        "José de la Cruz"        -> (jose,), (delacruz, cruz)
+        "Mary Smith-Jones"       -> (mary,), (smithjones, smith-jones, smith, jones)
+        "Jean-Luc Picard"        -> (jeanluc, jean-luc), (picard,)
+        "Gabriel García Márquez" -> (gabriel,), (marquez, garciamarquez, garcia)
+        "Анна Иванова"           -> (анна,), (иванова,)
+    """
+    name = name.strip()
+    if "," in name:
+        head, _, tail = name.partition(",")
+        if ascii_fold(tail.strip()).rstrip(".") not in SUFFIXES:
+            name = f"{tail} {head}"  # "Smith, John" -> "John Smith"
+
+    tokens = [_local_part(t) for t in name.split()
+              if ascii_fold(t).rstrip(".") not in TITLES
+              and ascii_fold(t).rstrip(".").strip(",") not in SUFFIXES]
+    tokens = [t for t in tokens if t.strip("-")]
+    if not tokens:
+        return (), ()
+
+    def spellings(token: str) -> list[str]:
+        token = token.strip("-")
+        joined = token.replace("-", "")
+        return [joined, token] if "-" in token else [joined]
+
+    firsts = tuple(spellings(tokens[0]))
+    if len(tokens) == 1:
+        return firsts, ()
+
+    # Surname = last token plus any particles right before it
+    start = len(tokens) - 1
+    while start > 1 and tokens[start - 1] in PARTICLES:
+        start -= 1
+    surname = tokens[start:]
+
+    lasts = ["".join(t.replace("-", "") for t in surname)]
+    if "-" in surname[-1].strip("-"):
+        lasts.append("".join(surname[:-1]) + surname[-1].strip("-"))
+        lasts.extend(part for part in surname[-1].split("-") if part)
+    elif len(surname) > 1:
+        lasts.append(surname[-1])
+    if start > 1:
+        # A token between first name and surname may be a first surname
+        # ("García Márquez"), or just a middle name, so it comes last
+        middle = tokens[start - 1].strip("-").replace("-", "")
+        lasts.extend([middle + lasts[0], middle])
+    return firsts, tuple(dict.fromkeys(lasts))
+
+
+def candidate_emails(name: str, domain: str, pattern: str = None) -> list[str]:
+    """
+    Deduplicated email candidates for a full name, most likely first.
+
+    Every pattern is tried with the primary spelling; alternate spellings
+    (see name_variants) follow. A known company `pattern` goes first.
+    """
+    firsts, lasts = name_variants(name)
+    if not firsts:
+        return []
+    domain = domain.strip().lower()
+    suffix = "@" + domain
+
+    candidates = {}
+    if pattern:
+        last = lasts[0] if lasts else ""
+        if last or ("{last}" not in pattern and "{l}" not in pattern):
+            try:
+                emit = pattern.format(first=firsts[0], last=last, f=firsts[0][0], l=last[:1])
+                candidates[emit + suffix] = None
+            except (KeyError, IndexError):
+                pass
+
+    for i, first in enumerate(firsts):
+        f = first[0]
+        for j, last in enumerate(lasts or ("",)):
+            l = last[:1]
+            for pattern_text, needs_last, emit in _EMITTERS:
+                if not last and (needs_last or "{l}" in pattern_text):
+                    continue
+                if (i or j) and not needs_last and last:
+                    continue  # First-name-only patterns were covered by the primary spelling
+                candidates[emit(first, last, f, l) + suffix] = None
+    return list(candidates)
+
+
+def bulk_generate(
+    pairs: Iterable[tuple[str, str]],
+    pattern_for: Callable[[str], Optional[str]] = None,
+) -> Iterator[tuple[str, str, list[str]]]:
+    """
+    Stream (name, domain, candidates) for many (name, domain) pairs.
+
+    Results are yielded one row at a time, so arbitrarily large CRM
+    exports run in constant memory. `pattern_for(domain)` may return the
+    domain's known email pattern, whose address then goes first.
+    """
+    for name, domain in pairs:
+        domain = domain.strip().lower()
+        pattern = pattern_for(domain) if pattern_for else None
+        yield name, domain, candidate_emails(name, domain, pattern)
+
+
+_NAME_COLUMNS = ("name", "full name", "full_name", "contact name")
+_FIRST_COLUMNS = ("first name", "first_name", "firstname", "given name")
+_LAST_COLUMNS = ("last name", "last_name", "lastname", "surname", "family name")
+_DOMAIN_COLUMNS = ("domain", "company domain", "email domain", "website", "company website")
+
+
+def clean_domain(value: str) -> str:
+    """ "https://www.Acme.com/about" -> "acme.com" """
+    domain = value.strip().lower()
+    domain = re.sub(r"^[a-z]+://", "", domain).split("/")[0].split("@")[-1]
+    return domain[4:] if domain.startswith("www.") else domain
+
+
+def read_contacts(f) -> Iterator[tuple[str, str]]:
+    """
+    (name, domain) pairs from a CSV export, read one row at a time.
+
+    Uses name (or first/last name) and domain/website columns when the
+    header has them; otherwise the first two columns are name, domain.
+    """
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is None:
+        return
+    lowered = [h.strip().lower() for h in header]
+
+    def column(options):
+        return next((lowered.index(o) for o in options if o in lowered), None)
+
+    name_i, first_i, last_i = column(_NAME_COLUMNS), column(_FIRST_COLUMNS), column(_LAST_COLUMNS)
+    domain_i = column(_DOMAIN_COLUMNS)
+    if domain_i is None or (name_i is None and first_i is None):
+        rows = [header]  # No recognizable header: it's data
+        name_i, first_i, last_i, domain_i = 0, None, None, 1
+    else:
+        rows = []
+
+    for rows in (rows, reader):
+        for row in rows:
+            if len(row) <= domain_i:
+                continue
+            if name_i is not None:
+                name = row[name_i]
+            else:
+                name = f"{row[first_i]} {row[last_i] if last_i is not None and last_i < len(row) else ''}"
+            domain = clean_domain(row[domain_i])
+            if name.strip() and domain:
+                yield name, domain
+
+
+def verify_with_hunter(email: str, api_key: str) -> dict:
+    """Verify email using Hunter.io API."""
+    url = "https://api.hunter.io/v2/email-verifier"
+    params = {"email": email, "api_key": api_key}
+
+    try:
+        response = requests.get(url, params=params, timeout=10)
+        response.raise_for_status()
+        return response.json().get("data", {})
+    except requests.exceptions.RequestException as e:
+        return {"error": str(e)}
+
+
+def cached_domain_pattern(domain: str) -> Optional[dict]:
+    """
+    Cached Hunter.io lookup for a domain, as {"pattern": ...}.
+
+    Returns None if the domain hasn't been looked up in the last 30 days
+    ({"pattern": None} means Hunter knew no pattern).
+    """
+    cached = local_cache.load_cached("hunter_patterns", domain.lower(), max_age=PATTERN_CACHE_TTL)
+    return json.loads(cached) if cached is not None else None
+
+
+def get_domain_pattern(domain: str, api_key: str, refresh: bool = False) -> Optional[str]:
+    """Get email pattern for a domain using Hunter.io (cached for 30 days)."""
+    if not refresh:
+        cached = cached_domain_pattern(domain)
+        if cached is not None:
+            return cached.get("pattern")
+
+    url = "https://api.hunter.io/v2/domain-search"
+    params = {"domain": domain, "api_key": api_key}
+
+    try:
+        response = requests.get(url, params=params, timeout=10)
+        response.raise_for_status()
+        data = response.json().get("data", {})
+    except requests.exceptions.RequestException as e:
+        return None
+
+    pattern = data.get("pattern")
+    local_cache.store_cached("hunter_patterns", domain.lower(), json.dumps({"pattern": pattern}).encode())
+    return pattern
+
+
+def format_output(name: str, domain: str, emails: list[str],
+                  verified: dict = None, pattern: str = None) -> str:
+    """Format results for display."""
+    lines = [
+        f"\n{'='*60}",
+        f"Email Finder Results",
+        f"{'='*60}",
+        f"Name: {name}",
+        f"Domain: {domain}",
+    ]
+
+    if pattern:
+        lines.append(f"Known Pattern: {pattern}")
+
+    lines.append(f"\nLikely Email Addresses (in order of probability):")
+    lines.append("-" * 40)
+
+    for i, email in enumerate(emails[:10], 1):
+        status = ""
+        if verified and email in verified:
+            v = verified[email]
+            if v.get("error"):
+                status = f" [Error: {v['error']}]"
+            elif v.get("result") == "deliverable":
+                status = " ✓ VERIFIED"
+            elif v.get("result") == "undeliverable":
+                status = " ✗ Invalid"
+            else:
+                status = f" [{v.get('result', 'unknown')}]"
+
+        lines.append(f"  {i}. {email}{status}")
+
+    lines.append("")
+    return "\n".join(lines)
+
+
+def run_bulk(path: str, output: str = None, top: int = 10, as_json: bool = False):
+    """
+    Write candidates for every contact in a CSV (streamed row by row).
+
+    Known patterns come from the local cache only (see prewarm.py), so a
+    bulk run never spends Hunter quota.
+    """
+    pattern_for = lru_cache(maxsize=None)(
+        lambda domain: (cached_domain_pattern(domain) or {}).get("pattern"))
+
+    out = open(output, "w", newline="", encoding="utf-8") if output else nullcontext(sys.stdout)
+    with open(path, newline="", encoding="utf-8-sig") as f_in, out as f_out:
+        writer = None if as_json else csv.writer(f_out)
+        if writer:
+            writer.writerow(["name", "domain", "pattern", "candidates"])
+        count = 0
+        for name, domain, emails in bulk_generate(read_contacts(f_in), pattern_for):
+            if as_json:
+                f_out.write(json.dumps({"name": name, "domain": domain, "pattern": pattern_for(domain),
+                                        "emails": emails[:top]}) + "\n")
+            else:
+                writer.writerow([name, domain, pattern_for(domain) or "", ";".join(emails[:top])])
+            count += 1
+
+    if output:
+        print(f"{count} contacts -> {output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find email addresses for a person at a company")
+    parser.add_argument("name", nargs="?", help="Person's full name (e.g., 'John Smith')")
+    parser.add_argument("domain", nargs="?", help="Company domain (e.g., 'company.com')")
+    parser.add_argument("--verify", "-v", action="store_true",
+                        help="Verify emails with Hunter.io (requires HUNTER_API_KEY env var)")
+    parser.add_argument("--pattern", "-p", action="store_true",
+                        help="Look up domain's email pattern only (domain as first positional arg)")
+    parser.add_argument("--json", "-j", action="store_true",
+                        help="Output as JSON")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Look up the domain pattern again instead of using the cache")
+    parser.add_argument("--bulk", metavar="CSV",
+                        help="Generate candidates for every contact in a CSV export (name/domain columns)")
+    parser.add_argument("--output", "-o", help="Output file for --bulk (default: stdout)")
+    parser.add_argument("--top", type=int, default=10, help="Candidates per contact for --bulk (default: 10)")
+
+    args = parser.parse_args()
+
+    if args.bulk:
+        run_bulk(args.bulk, args.output, top=args.top, as_json=args.json)
+        return
+
+    # Get Hunter.io API key if needed
+    api_key = os.environ.get("HUNTER_API_KEY")
+
+    # For --pattern, use 'name' arg as domain if domain not provided
+    if args.pattern and args.name and not args.domain:
+        args.domain = args.name
+        args.name = None
+
+    if args.pattern and args.domain:
+        cached = None if args.refresh else cached_domain_pattern(args.domain)
+        if cached is not None:
+            pattern = cached.get("pattern")
+        elif not api_key:
+            print("Error: HUNTER_API_KEY environment variable required for --pattern")
+            print("Get a free key at https://hunter.io/")
+            sys.exit(1)
+        else:
+            pattern = get_domain_pattern(args.domain, api_key, refresh=args.refresh)
+        if pattern:
+            print(f"Email pattern for {args.domain}: {pattern}")
+        else:
+            print(f"Could not determine pattern for {args.domain}")
+        return
+
+    if not args.name or not args.domain:
+        parser.error("name and domain are required")
+
+    # Generate emails
+    first, last = normalize_name(args.name)
+    emails = generate_emails(first, last, args.domain)
+
+    # Get pattern if API key available (or already cached)
+    pattern = None
+    if api_key:
+        pattern = get_domain_pattern(args.domain, api_key, refresh=args.refresh)
+    elif not args.refresh:
+        pattern = (cached_domain_pattern(args.domain) or {}).get("pattern")
+
+    # If we know the pattern, prioritize that format
+    if pattern:
+        pattern_email = pattern.format(
+            first=first, last=last, f=first[0], l=last[0] if last else ""
+        ) + f"@{args.domain}"
+        if pattern_email in emails:
+            emails.remove(pattern_email)
+        emails.insert(0, pattern_email)
+
+    # Verify if requested
+    verified = {}
+    if args.verify:
+        if not api_key:
+            print("Error: HUNTER_API_KEY environment variable required for --verify")
+            print("Get a free key at https://hunter.io/")
+            sys.exit(1)
+
+        print("Verifying emails (this may take a moment)...")
+        # Only verify top 3 to conserve API calls
+        for email in emails[:3]:
+            verified[email] = verify_with_hunter(email, api_key)
+
+    # Output
+    if args.json:
+        result = {
+            "name": args.name,
+            "domain": args.domain,
+            "pattern": pattern,
+            "emails": emails[:10],
+            "verified": verified if verified else None
+        }
+        print(json.dumps(result, indent=2))
+    else:
+        print(format_output(args.name, args.domain, emails, verified, pattern))
+
+        if not api_key:
+            print("Tip: Set HUNTER_API_KEY for pattern detection and verification")
+            print("     Get a free key at https://hunter.io/")
+
+
+if __name__ == "__main__":
+    main()
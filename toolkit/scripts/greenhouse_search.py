@@ -1,303 +1,1149 @@
-#!/usr/bin/env python3
-"""
-Greenhouse Job Board API Search
-
-Directly query company job boards hosted on Greenhouse.
-No authentication required for public job listings.
-
-Usage:
-    python greenhouse_search.py anthropic --keyword "engineer"
-    python greenhouse_search.py stripe openai databricks --min-salary 200000
-    python greenhouse_search.py --companies-file target_companies.txt
-"""
-
-import argparse
-import json
-import re
-import sys
-from typing import Optional
-from urllib.parse import urljoin
-import requests
-
-# Known company board tokens (add more as discovered)
-KNOWN_BOARDS = {
-    # AI/ML
-    "anthropic": "anthropic",
-    "openai": "openai",
-    "deepmind": "deepmind",
-    "cohere": "cohere",
-    "huggingface": "huggingface",
-    "scale": "scaleai",
-    "runway": "runwayml",
-    "stability": "stability",
-    "midjourney": "midjourney",
-    "replicate": "replicate",
-
-    # Big Tech
-    "stripe": "stripe",
-    "databricks": "databricks",
-    "figma": "figma",
-    "notion": "notion",
-    "airtable": "airtable",
-    "linear": "linear",
-    "vercel": "vercel",
-    "supabase": "supabase",
-    "planetscale": "planetscale",
-
-    # Biotech/Science
-    "insitro": "insitro",
-    "recursion": "recursionpharma",
-    "tempus": "tempus",
-    "grail": "grail",
-    "color": "color",
-    "benchling": "benchling",
-
-    # CZ Initiative / Biohub
-    "chanzuckerberg": "chanzuckerberginitiative",
-    "czi": "chanzuckerberginitiative",
-    "biohub": "biohub",
-    "czbiohub": "biohub",
-}
-
-
-def get_board_token(company: str) -> str:
-    """Get Greenhouse board token for a company."""
-    company_lower = company.lower().replace(" ", "").replace("-", "")
-    return KNOWN_BOARDS.get(company_lower, company_lower)
-
-
-def fetch_greenhouse_jobs(board_token: str, content: bool = True) -> dict:
-    """
-    Fetch all jobs from a Greenhouse job board.
-
-    Args:
-        board_token: Company's Greenhouse board identifier
-        content: Include full job descriptions
-
-    Returns:
-        Dict with 'jobs' list and metadata
-    """
-    url = f"https://boards-api.greenhouse.io/v1/boards/{board_token}/jobs"
-    params = {"content": "true"} if content else {}
-
-    try:
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.HTTPError as e:
-        if response.status_code == 404:
-            return {"error": f"Board '{board_token}' not found", "jobs": []}
-        raise
-    except requests.exceptions.RequestException as e:
-        return {"error": str(e), "jobs": []}
-
-
-def extract_salary_from_description(description: str) -> tuple[Optional[int], Optional[int]]:
-    """
-    Extract salary range from job description text.
-
-    Returns (min_salary, max_salary) or (None, None) if not found.
-    """
-    if not description:
-        return None, None
-
-    # Common patterns: "$150,000 - $200,000", "$150k-200k", "150,000 to 200,000"
-    patterns = [
-        r'\$?([\d,]+)k?\s*[-–to]+\s*\$?([\d,]+)k?(?:\s*(?:USD|usd|per year|annually|/yr|/year))?',
-        r'salary[:\s]+\$?([\d,]+)k?\s*[-–to]+\s*\$?([\d,]+)k?',
-        r'compensation[:\s]+\$?([\d,]+)k?\s*[-–to]+\s*\$?([\d,]+)k?',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, description, re.IGNORECASE)
-        if match:
-            min_str = match.group(1).replace(",", "")
-            max_str = match.group(2).replace(",", "")
-
-            min_val = int(min_str)
-            max_val = int(max_str)
-
-            # Handle "k" notation (150 -> 150000)
-            if min_val < 1000:
-                min_val *= 1000
-            if max_val < 1000:
-                max_val *= 1000
-
-            return min_val, max_val
-
-    return None, None
-
-
-def filter_jobs(
-    jobs: list,
-    keyword: str = None,
-    min_salary: int = None,
-    location: str = None,
-    department: str = None,
-) -> list:
-    """Filter jobs by various criteria."""
-    filtered = []
-
-    for job in jobs:
-        # Keyword filter (title or description)
-        if keyword:
-            keyword_lower = keyword.lower()
-            title = job.get("title", "").lower()
-            description = job.get("content", "").lower() if job.get("content") else ""
-            if keyword_lower not in title and keyword_lower not in description:
-                continue
-
-        # Location filter
-        if location:
-            job_location = job.get("location", {}).get("name", "").lower()
-            if location.lower() not in job_location:
-                continue
-
-        # Department filter
-        if department:
-            job_depts = [d.get("name", "").lower() for d in job.get("departments", [])]
-            if not any(department.lower() in d for d in job_depts):
-                continue
-
-        # Salary filter (extract from description)
-        if min_salary:
-            description = job.get("content", "")
-            min_sal, max_sal = extract_salary_from_description(description)
-            if min_sal and min_sal < min_salary:
-                continue
-            # If no salary info found, include the job (don't filter out)
-
-        filtered.append(job)
-
-    return filtered
-
-
-def format_job(job: dict, company: str, verbose: bool = False) -> str:
-    """Format a single job for display."""
-    lines = []
-
-    title = job.get("title", "Unknown")
-    location = job.get("location", {}).get("name", "Unknown Location")
-    url = job.get("absolute_url", "")
-    departments = [d.get("name") for d in job.get("departments", [])]
-
-    lines.append(f"\n[GREENHOUSE] {title}")
-    lines.append(f"  Company: {company}")
-    lines.append(f"  Location: {location}")
-    if departments:
-        lines.append(f"  Department: {', '.join(departments)}")
-
-    # Try to extract salary
-    description = job.get("content", "")
-    min_sal, max_sal = extract_salary_from_description(description)
-    if min_sal and max_sal:
-        lines.append(f"  Salary: ${min_sal:,} - ${max_sal:,}")
-
-    lines.append(f"  URL: {url}")
-
-    if verbose and description:
-        # Strip HTML and truncate
-        clean_desc = re.sub(r'<[^>]+>', ' ', description)
-        clean_desc = re.sub(r'\s+', ' ', clean_desc).strip()
-        if len(clean_desc) > 300:
-            clean_desc = clean_desc[:300] + "..."
-        lines.append(f"  Description: {clean_desc}")
-
-    lines.append("-" * 40)
-    return "\n".join(lines)
-
-
-def search_companies(
-    companies: list[str],
-    keyword: str = None,
-    min_salary: int = None,
-    location: str = None,
-    verbose: bool = False,
-) -> tuple[list, list]:
-    """
-    Search multiple companies for matching jobs.
-
-    Returns (all_jobs, output_lines)
-    """
-    all_jobs = []
-    output_lines = []
-
-    for company in companies:
-        board_token = get_board_token(company)
-        output_lines.append(f"\nSearching {company} (board: {board_token})...")
-
-        data = fetch_greenhouse_jobs(board_token)
-
-        if data.get("error"):
-            output_lines.append(f"  Error: {data['error']}")
-            continue
-
-        jobs = data.get("jobs", [])
-        output_lines.append(f"  Found {len(jobs)} total jobs")
-
-        # Apply filters
-        filtered = filter_jobs(jobs, keyword=keyword, min_salary=min_salary, location=location)
-
-        if keyword or min_salary or location:
-            output_lines.append(f"  {len(filtered)} jobs match filters")
-
-        for job in filtered:
-            job["_company"] = company  # Tag with company name
-            all_jobs.append(job)
-            output_lines.append(format_job(job, company, verbose=verbose))
-
-    return all_jobs, output_lines
-
-
-def main():
-    parser = argparse.ArgumentParser(description="Search Greenhouse job boards directly")
-    parser.add_argument("companies", nargs="*", help="Company names or board tokens to search")
-    parser.add_argument("--companies-file", "-f", help="File with company names (one per line)")
-    parser.add_argument("--keyword", "-k", help="Keyword to filter by (searches title and description)")
-    parser.add_argument("--min-salary", "-s", type=int, help="Minimum salary filter")
-    parser.add_argument("--location", "-l", help="Location filter")
-    parser.add_argument("--output", "-o", help="Output JSON file")
-    parser.add_argument("--verbose", "-v", action="store_true", help="Show descriptions")
-    parser.add_argument("--list-known", action="store_true", help="List known company board tokens")
-
-    args = parser.parse_args()
-
-    if args.list_known:
-        print("Known Greenhouse board tokens:")
-        for name, token in sorted(KNOWN_BOARDS.items()):
-            print(f"  {name}: {token}")
-        return
-
-    # Gather company list
-    companies = list(args.companies) if args.companies else []
-
-    if args.companies_file:
-        with open(args.companies_file) as f:
-            companies.extend(line.strip() for line in f if line.strip())
-
-    if not companies:
-        parser.error("Provide company names or --companies-file")
-
-    # Search
-    all_jobs, output_lines = search_companies(
-        companies,
-        keyword=args.keyword,
-        min_salary=args.min_salary,
-        location=args.location,
-        verbose=args.verbose,
-    )
-
-    # Print output
-    print("\n".join(output_lines))
-    print(f"\n{'=' * 80}")
-    print(f"Total: {len(all_jobs)} matching jobs across {len(companies)} companies")
-
-    # Save if requested
-    if args.output and all_jobs:
-        with open(args.output, 'w') as f:
-            json.dump(all_jobs, f, indent=2, default=str)
-        print(f"Saved to: {args.output}")
-
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+"""
+Greenhouse Job Board API Search
+
+Directly query company job boards hosted on Greenhouse, Lever or Ashby
+(see ats_sources.py). No authentication required for public job listings.
+
+Usage:
+    python greenhouse_search.py anthropic --keyword "engineer"
+    python greenhouse_search.py stripe openai databricks --min-salary 200000
+    python greenhouse_search.py anthropic lever:palantir ashby:linear -k research
+    python greenhouse_search.py --source lever palantir spotify
+    python greenhouse_search.py --companies-file target_companies.txt
+    python greenhouse_search.py --companies-file big_list.txt --stream -o matches.ndjson
+    python greenhouse_search.py --replay 2026-01-21 --keyword "research"  # offline
+    python greenhouse_search.py -f big_list.txt -k research --resume  # continue an interrupted sweep
+"""
+
+import argparse
+import codecs
+import hashlib
+import html
+import json
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional
+from urllib.parse import urlencode, urljoin
+import requests
+
+import ats_sources
+import local_cache
+import payload_archive
+from ats_sources import SourceAdapter, board_key, fetch_board
+from checkpoints import SweepCheckpoint
+from job_records import JobRecord
+from locations import location_matches
+from progress import ProgressLine
+
+# Known company board tokens (add more as discovered)
+KNOWN_BOARDS = {
+    # AI/ML
+    "anthropic": "anthropic",
+    "openai": "openai",
+    "deepmind": "deepmind",
+    "cohere": "cohere",
+    "huggingface": "huggingface",
+    "scale": "scaleai",
+    "runway": "runwayml",
+    "stability": "stability",
+    "midjourney": "midjourney",
+    "replicate": "replicate",
+
+    # Big Tech
+    "stripe": "stripe",
+    "databricks": "databricks",
+    "figma": "figma",
+    "notion": "notion",
+    "airtable": "airtable",
+    "linear": "linear",
+    "vercel": "vercel",
+    "supabase": "supabase",
+    "planetscale": "planetscale",
+
+    # Biotech/Science
+    "insitro": "insitro",
+    "recursion": "recursionpharma",
+    "tempus": "tempus",
+    "grail": "grail",
+    "color": "color",
+    "benchling": "benchling",
+
+    # CZ Initiative / Biohub
+    "chanzuckerberg": "chanzuckerberginitiative",
+    "czi": "chanzuckerberginitiative",
+    "biohub": "biohub",
+    "czbiohub": "biohub",
+}
+
+
+def get_board_token(company: str) -> str:
+    """Get Greenhouse board token for a company."""
+    company_lower = company.lower().replace(" ", "").replace("-", "")
+    return KNOWN_BOARDS.get(company_lower, company_lower)
+
+
+def resolve_board(company: str, source: str = "greenhouse") -> tuple[SourceAdapter, str]:
+    """
+    Adapter and board token for a company name or board spec.
+
+    "lever:palantir" / "ashby:linear" pick the source explicitly; other
+    names use `source`. Greenhouse names go through KNOWN_BOARDS.
+    """
+    adapter, name = ats_sources.split_spec(company, default_source=source)
+    if adapter.name == "greenhouse":
+        return adapter, get_board_token(name)
+    return adapter, adapter.board_token(name)
+
+
+# Cleaned description text, keyed by SHA-1 of the raw Greenhouse content.
+# Bounded (oldest entries evicted first); --stream bypasses it entirely.
+# Shared by the sweep's worker threads, so updates take the lock.
+_TEXT_CACHE: dict[str, str] = {}
+_TEXT_CACHE_SIZE = 4096
+_TEXT_CACHE_LOCK = threading.Lock()
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+
+def html_to_text(content: str, cache: bool = True) -> str:
+    """
+    Convert Greenhouse job content to plain text.
+
+    The API returns entity-encoded HTML ("&lt;p&gt;..."), so the content is
+    unescaped, stripped of tags, unescaped again (for &amp;nbsp; and friends)
+    and whitespace-collapsed. Results are cached by content hash, so boards
+    that share boilerplate descriptions are only cleaned once; `cache=False`
+    neither reads nor fills the cache.
+    """
+    if not content:
+        return ""
+
+    if cache:
+        key = hashlib.sha1(content.encode("utf-8")).hexdigest()
+        text = _TEXT_CACHE.get(key)
+        if text is not None:
+            return text
+
+    text = html.unescape(content)
+    text = _TAG_RE.sub(" ", text)
+    text = html.unescape(text)
+    text = _WS_RE.sub(" ", text).strip()
+    if cache:
+        with _TEXT_CACHE_LOCK:
+            while len(_TEXT_CACHE) >= _TEXT_CACHE_SIZE:
+                _TEXT_CACHE.pop(next(iter(_TEXT_CACHE)), None)
+            _TEXT_CACHE[key] = text
+    return text
+
+
+def normalize_job(job: dict, cache: bool = True) -> dict:
+    """Attach the cleaned description text to a job as `_text` (once)."""
+    if "_text" not in job:
+        job["_text"] = html_to_text(job.get("content") or "", cache=cache)
+    return job
+
+
+def job_text(job: dict) -> str:
+    """Cleaned description text for a job, normalizing it if needed."""
+    return normalize_job(job)["_text"]
+
+
+def fetch_greenhouse_jobs(board_token: str, content: bool = True) -> dict:
+    """
+    Fetch all jobs from a Greenhouse job board.
+
+    Args:
+        board_token: Company's Greenhouse board identifier
+        content: Include full job descriptions
+
+    Returns:
+        Dict with 'jobs' list and metadata
+    """
+    adapter = ats_sources.ADAPTERS["greenhouse"] if content else ats_sources.GreenhouseAdapter(content=False)
+    return fetch_board(adapter, board_token)
+
+
+def iter_json_array(chunks: Iterable[str], key: str) -> Iterator:
+    """
+    Incrementally parse the top-level array stored under `key`.
+
+    Yields one element at a time as soon as it is complete, so only the
+    element being decoded (plus one network chunk) is held in memory.
+    Assumes `key` appears before any nested value with the same name,
+    which holds for Greenhouse's {"jobs": [...], "meta": {...}} layout.
+    """
+    decoder = json.JSONDecoder()
+    chunks = iter(chunks)
+    marker = f'"{key}"'
+    buf = ""
+
+    # Skip ahead to the opening bracket of the array
+    while True:
+        idx = buf.find(marker)
+        if idx >= 0:
+            bracket = buf.find("[", idx + len(marker))
+            if bracket >= 0:
+                pos = bracket + 1
+                break
+        chunk = next(chunks, None)
+        if chunk is None:
+            return
+        buf += chunk
+
+    while True:
+        while pos < len(buf) and buf[pos] in " \t\r\n,":
+            pos += 1
+
+        if pos < len(buf):
+            if buf[pos] == "]":
+                return
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                pass  # Element not fully downloaded yet
+            else:
+                yield item
+                buf, pos = buf[end:], 0
+                continue
+
+        chunk = next(chunks, None)
+        if chunk is None:
+            raise ValueError(f"Truncated JSON: '{key}' array was never closed")
+        buf, pos = buf[pos:] + chunk, 0
+
+
+def iter_greenhouse_jobs(
+    board_token: str,
+    content: bool = True,
+    chunk_size: int = 64 * 1024,
+) -> Iterator[dict]:
+    """
+    Stream jobs from a Greenhouse job board one at a time.
+
+    Unlike fetch_greenhouse_jobs, the response body is never held in
+    memory as a whole. Raises requests.exceptions.RequestException on
+    network errors (HTTPError with status 404 for unknown boards).
+    """
+    url = f"https://boards-api.greenhouse.io/v1/boards/{board_token}/jobs"
+    params = {"content": "true"} if content else {}
+
+    with ats_sources.rate_limited_get(url, params=params, timeout=30, stream=True) as response:
+        response.raise_for_status()
+
+        # Tee the raw bytes into the archive; only a fully read board is kept
+        archive = None
+        if content and payload_archive.ENABLED:
+            archive = payload_archive.ArchiveWriter("greenhouse", board_token)
+
+        def tee_chunks():
+            for raw in response.iter_content(chunk_size):
+                if archive is not None:
+                    archive.write(raw)
+                yield raw
+
+        raw_chunks = tee_chunks()
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        chunks = (decoder.decode(raw) for raw in raw_chunks)
+        try:
+            yield from iter_json_array(chunks, "jobs")
+            if archive is not None:
+                for _ in raw_chunks:  # Drain anything after the array ("meta")
+                    pass
+                archive.commit()
+                archive = None
+        finally:
+            if archive is not None:
+                archive.discard()
+
+
+def parse_timestamp(value: str) -> Optional[datetime]:
+    """Parse a Greenhouse ISO-8601 timestamp (e.g. updated_at) to an aware datetime."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.astimezone()
+
+
+def is_fresh(job: dict, since: datetime) -> bool:
+    """True if the job was updated at or after `since` (undated jobs are kept)."""
+    updated = parse_timestamp(job.get("updated_at"))
+    return updated is None or updated >= since
+
+
+def recent_jobs(jobs: list, since: datetime) -> list:
+    """
+    Jobs updated at or after `since`, newest first.
+
+    Sorts once by timestamp and stops at the first stale job, so the
+    stale majority of a board is never inspected further.
+    """
+    undated = datetime.max.replace(tzinfo=timezone.utc)  # Kept, like is_fresh
+    stamped = sorted(
+        ((parse_timestamp(job.get("updated_at")) or undated, job) for job in jobs),
+        key=lambda pair: pair[0],
+        reverse=True,
+    )
+    recent = []
+    for updated, job in stamped:
+        if updated < since:
+            break
+        recent.append(job)
+    return recent
+
+
+# Department/office trees are cached this long (seconds)
+METADATA_TTL = 3600
+
+# Fetch jobs one by one only while that is clearly cheaper than the whole board
+TARGETED_FETCH_MAX_FRACTION = 0.5
+
+# Archive source for department/location selections: the job IDs the board's
+# trees resolved to, plus the jobs themselves when they were fetched one by one
+PARTIAL_ARCHIVE_SOURCE = "greenhouse-partial"
+
+
+def fetch_board_metadata(board_token: str, kind: str, refresh: bool = False) -> list:
+    """
+    Fetch (and cache) a board's "departments" or "offices" tree.
+
+    Each node carries id, name, parent_id and child_ids, plus job stubs
+    (id, title, location, no description). `refresh` ignores the cache.
+    Raises requests.exceptions.RequestException on network errors.
+    """
+    key = {"board": board_token, "kind": kind}
+    if not refresh:
+        cached = local_cache.load_cached("greenhouse_metadata", key, max_age=METADATA_TTL)
+        if cached is not None:
+            return json.loads(cached)
+
+    url = f"https://boards-api.greenhouse.io/v1/boards/{board_token}/{kind}"
+    response = ats_sources.rate_limited_get(url, timeout=30)
+    response.raise_for_status()
+    nodes = response.json().get(kind, [])
+    local_cache.store_cached("greenhouse_metadata", key, json.dumps(nodes).encode())
+    return nodes
+
+
+def _matching_subtree(nodes: list, matches: Callable[[dict], bool]) -> set:
+    """IDs of nodes for which `matches(node)` holds, plus all their descendants."""
+    children = {node["id"]: node.get("child_ids") or [] for node in nodes}
+    pending = [node["id"] for node in nodes if matches(node)]
+    selected = set()
+    while pending:
+        node_id = pending.pop()
+        if node_id not in selected:
+            selected.add(node_id)
+            pending.extend(children.get(node_id, []))
+    return selected
+
+
+def select_job_ids(board_token: str, department: str = None, location: str = None,
+                   since: datetime = None, refresh: bool = False) -> tuple[set, int]:
+    """
+    Resolve department/location/freshness filters to job IDs.
+
+    A department matches by name, including all child departments. A
+    location matches offices by name or location (again with children),
+    or a job's own listed location. `since` keeps jobs updated at or
+    after that time, using the board's description-free job list.
+    `refresh` refetches the department/office trees even if cached.
+    Returns (job_ids, total_jobs_on_board).
+    """
+    job_ids = None
+    total = 0
+
+    if since:
+        listing = fetch_greenhouse_jobs(board_token, content=False)
+        if listing.get("error"):
+            raise requests.exceptions.RequestException(listing["error"])
+        total = len(listing.get("jobs", []))
+        job_ids = {job["id"] for job in recent_jobs(listing.get("jobs", []), since)}
+
+    if department:
+        departments = fetch_board_metadata(board_token, "departments", refresh=refresh)
+        department_lower = department.lower()
+        dept_ids = _matching_subtree(
+            departments, lambda node: department_lower in (node.get("name") or "").lower())
+        all_ids = {job["id"] for d in departments for job in d.get("jobs", [])}
+        total = max(total, len(all_ids))
+        in_dept = {job["id"] for d in departments if d["id"] in dept_ids for job in d.get("jobs", [])}
+        job_ids = in_dept if job_ids is None else job_ids & in_dept
+
+    if location:
+        offices = fetch_board_metadata(board_token, "offices", refresh=refresh)
+        office_ids = _matching_subtree(
+            offices,
+            lambda node: location_matches(location, node.get("name") or "")
+            or location_matches(location, node.get("location") or ""),
+        )
+        stubs = [
+            (office["id"], job)
+            for office in offices
+            for dept in office.get("departments", [])
+            for job in dept.get("jobs", [])
+        ]
+        total = max(total, len({job["id"] for _, job in stubs}))
+        located = {
+            job["id"] for office_id, job in stubs
+            if office_id in office_ids
+            or location_matches(location, (job.get("location") or {}).get("name", ""))
+        }
+        job_ids = located if job_ids is None else job_ids & located
+
+    return job_ids or set(), total
+
+
+def fetch_greenhouse_job(board_token: str, job_id: int) -> Optional[dict]:
+    """Fetch one job (with description); None if it no longer exists."""
+    url = f"https://boards-api.greenhouse.io/v1/boards/{board_token}/jobs/{job_id}"
+    response = ats_sources.rate_limited_get(url, timeout=30)
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    return response.json()
+
+
+def fetch_targeted_jobs(board_token: str, department: str = None, location: str = None,
+                        since: datetime = None, refresh: bool = False) -> dict:
+    """
+    Fetch only the jobs matching department/location/freshness filters.
+
+    The filters are resolved against the cached department/office trees
+    and the lightweight job list first (see select_job_ids), so
+    descriptions are downloaded only for matching jobs. Falls
+    back to the whole board (filtered by ID) when most jobs match, and to
+    a plain fetch_greenhouse_jobs if the trees are unavailable.
+
+    The selected job IDs are archived (see archive_selection), so
+    --replay selects the same jobs without the trees.
+
+    Returns the fetch_greenhouse_jobs dict plus "selected_from" (the
+    board's job count) when the filters were resolved here.
+    """
+    try:
+        job_ids, total = select_job_ids(board_token, department=department,
+                                        location=location, since=since, refresh=refresh)
+    except requests.exceptions.HTTPError as e:
+        if e.response is not None and e.response.status_code == 404:
+            return {"error": f"Board '{board_token}' not found", "jobs": []}
+        return fetch_greenhouse_jobs(board_token)
+    except (requests.exceptions.RequestException, ValueError):
+        return fetch_greenhouse_jobs(board_token)
+
+    if total and len(job_ids) > total * TARGETED_FETCH_MAX_FRACTION:
+        data = fetch_greenhouse_jobs(board_token)
+        if not data.get("error"):
+            data["jobs"] = [job for job in data.get("jobs", []) if job.get("id") in job_ids]
+            data["selected_from"] = total
+            archive_selection(board_token, job_ids, total, department, location, since)
+        return data
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            jobs = list(pool.map(lambda job_id: fetch_greenhouse_job(board_token, job_id),
+                                 sorted(job_ids)))
+    except requests.exceptions.RequestException as e:
+        return {"error": str(e), "jobs": []}
+    except ValueError as e:
+        return {"error": f"Unreadable job for '{board_token}': {e}", "jobs": []}
+    data = {"jobs": [job for job in jobs if job is not None], "selected_from": total}
+    archive_selection(board_token, job_ids, total, department, location, since, jobs=data["jobs"])
+    return data
+
+
+def select_cached_jobs(board_token: str, data: dict, department: str = None, location: str = None,
+                       refresh: bool = False) -> dict:
+    """
+    Apply department/location filters to a cached board as a live search would.
+
+    The filters are resolved through the board's department/office trees
+    (see select_job_ids), so child departments and office matches are kept,
+    and the selection is archived for --replay. If the trees are
+    unavailable, `data` is returned as is for the plain filters.
+    """
+    try:
+        job_ids, total = select_job_ids(board_token, department=department,
+                                        location=location, refresh=refresh)
+    except (requests.exceptions.RequestException, ValueError):
+        return data
+    archive_selection(board_token, job_ids, total, department, location)
+    jobs = data.get("jobs", [])
+    return dict(data, jobs=[job for job in jobs if job.get("id") in job_ids], selected_from=len(jobs))
+
+
+def _selection_key(board_token: str, department: str = None, location: str = None) -> str:
+    """Archive key of a selection: the board token plus its (case-folded) department/location filters."""
+    filters = {name: " ".join(value.lower().split())
+               for name, value in (("department", department), ("location", location)) if value}
+    return f"{board_token}?{urlencode(filters)}" if filters else board_token
+
+
+def archive_selection(board_token: str, job_ids: set, total: int, department: str = None,
+                      location: str = None, since: datetime = None, jobs: list = None):
+    """
+    Archive the job IDs department/location/freshness filters selected.
+
+    `jobs` are the selected jobs when they were fetched one by one (the
+    full board then never is). See load_archived_jobs.
+    """
+    filters = {"department": department, "location": location,
+               "since": since.isoformat(timespec="minutes") if since else None}
+    snapshot = {
+        "job_ids": sorted(job_ids),
+        "selected_from": total,
+        "filters": {name: value for name, value in filters.items() if value},
+    }
+    if jobs is not None:
+        snapshot["jobs"] = jobs
+    payload_archive.archive_payload(PARTIAL_ARCHIVE_SOURCE, _selection_key(board_token, department, location),
+                                    json.dumps(snapshot).encode())
+
+
+def load_archived_jobs(date: str, department: str = None, location: str = None) -> Callable[[str], dict]:
+    """
+    Build a fetch function that serves boards from the archive for `date`.
+
+    The returned callable maps a board key (see ats_sources.board_key) to
+    the same dict fetch_greenhouse_jobs returns, so search_companies can
+    run unchanged against archived snapshots from every source.
+
+    Greenhouse searches with --department/--location resolved those
+    filters through the board's trees, and archived the job IDs they
+    selected (see archive_selection). Replaying with the same filters
+    selects those IDs again ("selected_from" is set, so the filters are
+    not re-applied by name). Boards that were only fetched in part and
+    have no matching selection are served as they were, with a "note"
+    naming the filters they were fetched with.
+    """
+    boards = {}
+    for adapter in ats_sources.ADAPTERS.values():
+        for token, entry in payload_archive.latest_entries(date, adapter.name).items():
+            boards[board_key(adapter, token)] = (adapter, entry)
+
+    wanted = _selection_key("", department, location)
+    selections = {}  # Board key -> selection made with these filters
+    partials = {}    # Board key -> latest selection with any filters
+    for key, entry in payload_archive.latest_entries(date, PARTIAL_ARCHIVE_SOURCE).items():
+        token, _, query = key.partition("?")
+        if (department or location) and f"?{query}" == wanted:
+            selections[token] = entry
+        if token not in partials or entry.fetched_at >= partials[token].fetched_at:
+            partials[token] = entry
+
+    def load_selection(entry: payload_archive.ArchiveEntry) -> dict:
+        return json.loads(payload_archive.load_payload(entry))
+
+    def fetch(key: str) -> dict:
+        selection = load_selection(selections[key]) if key in selections else None
+        if selection is not None and "jobs" in selection:
+            data = {"jobs": selection["jobs"], "selected_from": selection["selected_from"]}
+        elif key in boards:
+            adapter, entry = boards[key]
+            data = adapter.parse(payload_archive.load_payload(entry))
+            if selection is None:
+                return data
+            job_ids = set(selection["job_ids"])
+            data = {"jobs": [job for job in data["jobs"] if job.get("id") in job_ids],
+                    "selected_from": selection["selected_from"]}
+        elif key in partials and "jobs" in (snapshot := load_selection(partials[key])):
+            filters = ", ".join(f"{name}={value}" for name, value in snapshot["filters"].items())
+            return {"jobs": snapshot["jobs"],
+                    "note": f"partial snapshot: only jobs matching {filters or 'the filters'} were fetched"}
+        else:
+            return {"error": f"No archived snapshot of '{key}' for {date}", "jobs": []}
+
+        if selection["filters"].get("since"):
+            data["note"] = f"selection was also limited to jobs updated since {selection['filters']['since']}"
+        return data
+
+    fetch.boards = sorted(set(boards) | set(partials))
+    return fetch
+
+
+def extract_salary_from_description(description: str) -> tuple[Optional[int], Optional[int]]:
+    """
+    Extract salary range from job description text.
+
+    Returns (min_salary, max_salary) or (None, None) if not found.
+    """
+    if not description:
+        return None, None
+
+    # Common patterns: "$150,000 - $200,000", "$150k-200k", "150,000 to 200,000"
+    patterns = [
+        r'\$?([\d,]+)k?\s*[-–to]+\s*\$?([\d,]+)k?(?:\s*(?:USD|usd|per year|annually|/yr|/year))?',
+        r'salary[:\s]+\$?([\d,]+)k?\s*[-–to]+\s*\$?([\d,]+)k?',
+        r'compensation[:\s]+\$?([\d,]+)k?\s*[-–to]+\s*\$?([\d,]+)k?',
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, description, re.IGNORECASE)
+        if match:
+            min_str = match.group(1).replace(",", "")
+            max_str = match.group(2).replace(",", "")
+
+            min_val = int(min_str)
+            max_val = int(max_str)
+
+            # Handle "k" notation (150 -> 150000)
+            if min_val < 1000:
+                min_val *= 1000
+            if max_val < 1000:
+                max_val *= 1000
+
+            return min_val, max_val
+
+    return None, None
+
+
+def filter_jobs(
+    jobs: list,
+    keyword: str = None,
+    min_salary: int = None,
+    location: str = None,
+    department: str = None,
+    since: datetime = None,
+) -> list:
+    """Filter jobs by various criteria."""
+    filtered = []
+
+    for job in jobs:
+        # Freshness filter first: it needs no description processing
+        if since and not is_fresh(job, since):
+            continue
+
+        # Keyword filter (title or description)
+        if keyword:
+            keyword_lower = keyword.lower()
+            title = job.get("title", "").lower()
+            description = job_text(job).lower()
+            if keyword_lower not in title and keyword_lower not in description:
+                continue
+
+        # Location filter (parsed, so "SF" matches "San Francisco, CA")
+        if location:
+            job_location = job.get("location", {}).get("name", "")
+            if not location_matches(location, job_location):
+                continue
+
+        # Department filter
+        if department:
+            job_depts = [d.get("name", "").lower() for d in job.get("departments", [])]
+            if not any(department.lower() in d for d in job_depts):
+                continue
+
+        # Salary filter (extract from description)
+        if min_salary:
+            min_sal, max_sal = extract_salary_from_description(job_text(job))
+            if min_sal and min_sal < min_salary:
+                continue
+            # If no salary info found, include the job (don't filter out)
+
+        filtered.append(job)
+
+    return filtered
+
+
+def format_job(job: dict, company: str, verbose: bool = False) -> str:
+    """Format a single job for display."""
+    lines = []
+
+    title = job.get("title", "Unknown")
+    location = job.get("location", {}).get("name", "Unknown Location")
+    url = job.get("absolute_url", "")
+    departments = [d.get("name") for d in job.get("departments", [])]
+
+    lines.append(f"\n[{job.get('source', 'greenhouse').upper()}] {title}")
+    lines.append(f"  Company: {company}")
+    lines.append(f"  Location: {location}")
+    if departments:
+        lines.append(f"  Department: {', '.join(departments)}")
+
+    # Try to extract salary
+    clean_desc = job_text(job)
+    min_sal, max_sal = extract_salary_from_description(clean_desc)
+    if min_sal and max_sal:
+        lines.append(f"  Salary: ${min_sal:,} - ${max_sal:,}")
+
+    lines.append(f"  URL: {url}")
+
+    if verbose and clean_desc:
+        # Truncate long descriptions
+        if len(clean_desc) > 300:
+            clean_desc = clean_desc[:300] + "..."
+        lines.append(f"  Description: {clean_desc}")
+
+    lines.append("-" * 40)
+    return "\n".join(lines)
+
+
+class BoardResult(NamedTuple):
+    """One board's outcome in a sweep (see iter_search_companies)."""
+    index: int            # Position in the companies list
+    company: str
+    key: str              # Board key (see ats_sources.board_key)
+    lines: list           # Formatted output for this board
+    jobs: list            # Matching JobRecords
+    error: Optional[str] = None
+    restored: bool = False  # Served from a checkpoint
+
+
+def iter_search_companies(
+    companies: list[str],
+    keyword: str = None,
+    min_salary: int = None,
+    location: str = None,
+    verbose: bool = False,
+    fetch: Callable[[str], dict] = None,
+    checkpoint: SweepCheckpoint = None,
+    department: str = None,
+    since: datetime = None,
+    source: str = "greenhouse",
+    workers: int = ats_sources.DEFAULT_WORKERS,
+    max_age: Optional[float] = None,
+    refresh: bool = False,
+) -> Iterator[BoardResult]:
+    """
+    Search companies concurrently, yielding each board as soon as it is done.
+
+    Fetching, filtering and formatting run on `workers` threads; results
+    arrive in completion order, so the first matches can be shown while
+    slow boards are still downloading. Companies may be on any supported
+    ATS (see resolve_board). Matches are kept as compact JobRecords
+    (descriptions spilled to disk); use `record.to_dict()` for the
+    original job dict. `fetch` maps a board key to a board payload (see
+    load_archived_jobs for replays); by default boards are fetched live,
+    and Greenhouse department/location filters are resolved through the
+    board's department/office trees so only matching descriptions are
+    downloaded (see fetch_targeted_jobs).
+    With `max_age`, boards cached at most that many seconds ago (e.g. by
+    prewarm.py) are used without any network, except with `since`: a
+    cached board can miss postings newer than itself. Department/location
+    filters on a cached Greenhouse board are still resolved through its
+    trees (see select_cached_jobs). `refresh` also refetches cached
+    department/office trees.
+    `since` drops jobs not updated since then before any description
+    is processed.
+    With a `checkpoint`, each board's results are saved as soon as it is
+    done, and boards already in the checkpoint are not fetched again.
+    """
+    def search_board(item: tuple[int, str]) -> BoardResult:
+        index, spec = item
+        adapter, token = resolve_board(spec, source)
+        key = board_key(adapter, token)
+        company = ats_sources.split_spec(spec)[1]
+
+        saved = checkpoint.load(key) if checkpoint else None
+        if saved is not None:
+            return BoardResult(index, company, key, saved["lines"] + ["  (restored from checkpoint)"],
+                               saved["jobs"], restored=True)
+
+        board_lines = [f"\nSearching {company} (board: {key})..."]
+        cached = None
+        if fetch is None and max_age is not None and not since:
+            cached = ats_sources.cached_board(adapter, token, max_age)
+
+        if fetch is not None:
+            data = fetch(key)
+        elif cached is not None:
+            data = cached
+            age = ats_sources.board_cache_age(adapter, token) or 0
+            board_lines.append(f"  (cached {age / 3600:.1f}h ago; --refresh to fetch live)")
+            if adapter.name == "greenhouse" and (department or location):
+                data = select_cached_jobs(token, data, department=department, location=location,
+                                          refresh=refresh)
+        elif adapter.name == "greenhouse" and (department or location or since):
+            data = fetch_targeted_jobs(token, department=department, location=location,
+                                       since=since, refresh=refresh)
+        else:
+            data = fetch_board(adapter, token)
+
+        if data.get("error"):
+            board_lines.append(f"  Error: {data['error']}")
+            return BoardResult(index, company, key, board_lines, [], error=data["error"])
+
+        if data.get("note"):
+            board_lines.append(f"  Note: {data['note']}")
+        jobs = data.get("jobs", [])
+        total = data.get("selected_from", len(jobs))
+        if since:
+            jobs = recent_jobs(jobs, since)
+
+        # Normalize descriptions once; filters and formatting share `_text`
+        jobs = [normalize_job(job) for job in jobs]
+        if "selected_from" in data:
+            # Department/location already resolved against the board's trees
+            board_lines.append(f"  Selected {len(jobs)} of {total} jobs via board index")
+            filtered = filter_jobs(jobs, keyword=keyword, min_salary=min_salary)
+        else:
+            board_lines.append(f"  Found {total} total jobs")
+            if since:
+                board_lines.append(f"  {len(jobs)} updated since {since:%Y-%m-%d %H:%M}")
+            filtered = filter_jobs(jobs, keyword=keyword, min_salary=min_salary,
+                                   location=location, department=department)
+
+        if keyword or min_salary or location or department or since:
+            board_lines.append(f"  {len(filtered)} jobs match filters")
+        board_lines.extend(format_job(job, company, verbose=verbose) for job in filtered)
+        return BoardResult(index, company, key, board_lines, filtered)
+
+    def search_board_or_error(item: tuple[int, str]) -> BoardResult:
+        # One unreadable board or archive entry is that board's error, not the sweep's
+        try:
+            return search_board(item)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            index, spec = item
+            key = board_key(*resolve_board(spec, source))
+            company = ats_sources.split_spec(spec)[1]
+            return BoardResult(index, company, key, [f"\nSearching {company} (board: {key})...", f"  Error: {e}"],
+                               [], error=str(e))
+
+    boards = list(enumerate(companies))
+    for _, result in ats_sources.fetch_concurrently(search_board_or_error, boards, max_workers=workers,
+                                                    ordered=False):
+        # JobRecords share one description store, so they're built on this thread
+        if result.restored:
+            records = [JobRecord.from_dict(job) for job in result.jobs]
+        else:
+            records = [JobRecord.from_dict(job, company=result.company) for job in result.jobs]
+            if checkpoint and not result.error:
+                checkpoint.save(result.key, {
+                    "lines": result.lines,
+                    "jobs": [job.to_dict() for job in records],
+                })
+        yield result._replace(jobs=records)
+
+
+def search_companies(companies: list[str], **kwargs) -> tuple[list, list]:
+    """
+    Search multiple companies for matching jobs (see iter_search_companies).
+
+    Collects every board, in the order given.
+
+    Returns (all_jobs, output_lines)
+    """
+    all_jobs = []
+    output_lines = []
+    for result in sorted(iter_search_companies(companies, **kwargs), key=lambda r: r.index):
+        output_lines.extend(result.lines)
+        all_jobs.extend(result.jobs)
+    return all_jobs, output_lines
+
+
+def stream_search_companies(
+    companies: list[str],
+    keyword: str = None,
+    min_salary: int = None,
+    location: str = None,
+    verbose: bool = False,
+    output_file=None,
+    checkpoint: SweepCheckpoint = None,
+    department: str = None,
+    since: datetime = None,
+    source: str = "greenhouse",
+    progress: ProgressLine = None,
+) -> int:
+    """
+    Search companies without buffering boards or results.
+
+    Each job is parsed, filtered and printed as it arrives; matches are
+    written to `output_file` (if given) as NDJSON. Descriptions are
+    cleaned without the shared text cache (see html_to_text), so peak
+    memory is one job plus one network chunk, regardless of how many
+    boards are swept. (Lever and Ashby return boards in a shape that
+    can't be parsed incrementally, so those are held one board at a time.)
+
+    With a `checkpoint`, finished boards are recorded along with the
+    output file's size at that point (see resume_stream_output), and
+    boards already recorded are skipped.
+
+    A `progress` line (see progress.py) is advanced once per board.
+
+    Returns the number of matching jobs.
+    """
+    total_matches = 0
+
+    for spec in companies:
+        adapter, board_token = resolve_board(spec, source)
+        key = board_key(adapter, board_token)
+        company = ats_sources.split_spec(spec)[1]
+
+        saved = checkpoint.load(key) if checkpoint else None
+        if saved is not None:
+            print(f"\nSkipping {company} (board: {key}): "
+                  f"{saved['matched']} matches restored from checkpoint")
+            total_matches += saved["matched"]
+            if progress:
+                progress.update(saved["matched"])
+            continue
+
+        print(f"\nSearching {company} (board: {key})...")
+
+        if adapter.name == "greenhouse":
+            jobs = iter_greenhouse_jobs(board_token)
+        else:
+            data = fetch_board(adapter, board_token)
+            if data.get("error"):
+                print(f"  Error: {data['error']}")
+                if progress:
+                    progress.update()
+                continue
+            jobs = data["jobs"]
+
+        # Where this board's matches start, so a board that fails midway
+        # can take its partial output back out (it is fetched again on --resume)
+        start = None
+        if output_file is not None:
+            output_file.flush()
+            start = output_file.tell()
+
+        seen = matched = 0
+        try:
+            for job in jobs:
+                seen += 1
+                # Description-free filters first, so most jobs are never cleaned
+                if not filter_jobs([job], location=location, department=department, since=since):
+                    continue
+                normalize_job(job, cache=False)
+                if not filter_jobs([job], keyword=keyword, min_salary=min_salary):
+                    continue
+
+                matched += 1
+                job["_company"] = company
+                print(format_job(job, company, verbose=verbose))
+                if output_file is not None:
+                    record = {k: v for k, v in job.items() if k != "_text"}
+                    output_file.write(json.dumps(record, default=str) + "\n")
+        except (requests.exceptions.RequestException, ValueError) as e:
+            if (isinstance(e, requests.exceptions.HTTPError) and e.response is not None
+                    and e.response.status_code == 404):
+                print(f"  Error: Board '{board_token}' not found")
+            else:
+                print(f"  Error: {e}")
+            if start is not None and matched:
+                output_file.truncate(start)
+                output_file.seek(start)
+                print(f"  ({matched} partial matches removed from output)")
+            if progress:
+                progress.update()
+            continue
+
+        print(f"  Found {seen} total jobs")
+        if keyword or min_salary or location or department or since:
+            print(f"  {matched} jobs match filters")
+        total_matches += matched
+
+        if checkpoint:
+            offset = None
+            if output_file is not None:
+                output_file.flush()
+                offset = output_file.tell()
+            checkpoint.save(key, {"matched": matched, "offset": offset})
+        if progress:
+            progress.update(matched)
+
+    return total_matches
+
+
+def resume_stream_output(path: str, checkpoint: SweepCheckpoint):
+    """
+    Reopen a streaming sweep's NDJSON output for appending after a crash.
+
+    Matches written for a board that never finished are cut off (the file
+    is truncated to the size recorded with the last finished board), so
+    resuming doesn't duplicate them.
+    """
+    offsets = [saved.get("offset") or 0 for _, saved in checkpoint.completed()]
+    try:
+        output_file = open(path, 'r+')
+    except FileNotFoundError:
+        return open(path, 'w')
+    output_file.truncate(max(offsets, default=0))
+    output_file.seek(0, 2)
+    return output_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search Greenhouse, Lever and Ashby job boards directly")
+    parser.add_argument("companies", nargs="*",
+                        help="Company names or board tokens to search (prefix lever:/ashby: for other ATSs)")
+    parser.add_argument("--source", choices=sorted(ats_sources.ADAPTERS), default="greenhouse",
+                        help="ATS for names without a prefix (default: greenhouse)")
+    parser.add_argument("--companies-file", "-f", help="File with company names (one per line)")
+    parser.add_argument("--keyword", "-k", help="Keyword to filter by (searches title and description)")
+    parser.add_argument("--min-salary", "-s", type=int, help="Minimum salary filter")
+    parser.add_argument("--location", "-l", help="Location filter")
+    parser.add_argument("--department", "-d", help="Department filter (includes sub-departments)")
+    freshness = parser.add_mutually_exclusive_group()
+    freshness.add_argument("--hours", type=int, help="Only jobs updated within N hours")
+    freshness.add_argument("--since", help="Only jobs updated since DATE (YYYY-MM-DD or ISO timestamp)")
+    parser.add_argument("--output", "-o", help="Output JSON file (NDJSON with --stream)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Parse boards incrementally and write matches as they arrive (bounded memory)")
+    parser.add_argument("--workers", type=int, default=ats_sources.DEFAULT_WORKERS,
+                        help=f"Boards fetched in parallel (default: {ats_sources.DEFAULT_WORKERS})")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Show descriptions")
+    parser.add_argument("--list-known", action="store_true", help="List known company board tokens")
+    parser.add_argument("--replay", metavar="DATE",
+                        help="Re-run filters against boards archived on DATE (YYYY-MM-DD), offline")
+    parser.add_argument("--no-archive", action="store_true", help="Don't archive fetched board payloads")
+    parser.add_argument("--refresh", action="store_true",
+                        help=f"Ignore boards cached in the last {ats_sources.BOARD_CACHE_TTL // 3600} hours "
+                             f"(see prewarm.py) and department/office trees; fetch live")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue an interrupted sweep with the same filters, skipping finished boards")
+
+    args = parser.parse_args()
+
+    if args.list_known:
+        print("Known Greenhouse board tokens:")
+        for name, token in sorted(KNOWN_BOARDS.items()):
+            print(f"  {name}: {token}")
+        return
+
+    # Gather company list
+    companies = list(args.companies) if args.companies else []
+
+    if args.companies_file:
+        with open(args.companies_file) as f:
+            companies.extend(line.strip() for line in f if line.strip())
+
+    if args.no_archive:
+        payload_archive.ENABLED = False
+
+    since = None
+    if args.hours:
+        since = datetime.now(timezone.utc) - timedelta(hours=args.hours)
+    elif args.since:
+        since = parse_timestamp(args.since)
+        if since is None:
+            parser.error(f"--since: can't parse '{args.since}' (use YYYY-MM-DD or an ISO timestamp)")
+
+    fetch = None  # Live
+    if args.replay:
+        fetch = load_archived_jobs(args.replay, department=args.department, location=args.location)
+        if not fetch.boards:
+            parser.error(f"No archived job boards for {args.replay} "
+                         f"(available: {', '.join(payload_archive.archived_dates()) or 'none'})")
+        if not companies:
+            companies = fetch.boards
+        if args.stream:
+            parser.error("--stream fetches live boards; drop it for --replay")
+
+    if not companies:
+        parser.error("Provide company names or --companies-file")
+
+    # Live sweeps checkpoint every board; a plain run starts from scratch
+    checkpoint = None
+    if not args.replay:
+        checkpoint = SweepCheckpoint("greenhouse", {
+            "keyword": args.keyword,
+            "min_salary": args.min_salary,
+            "location": args.location,
+            "department": args.department,
+            "since": since.isoformat(timespec="minutes") if args.since else args.hours,
+            "verbose": args.verbose,
+            "stream_output": args.output if args.stream else None,
+            "source": args.source,
+        })
+        if not args.resume:
+            checkpoint.clear()
+
+    if args.stream:
+        if args.output and args.resume:
+            output_file = resume_stream_output(args.output, checkpoint)
+        else:
+            output_file = open(args.output, 'w') if args.output else None
+        try:
+            with ProgressLine(len(companies), unit="boards") as progress:
+                total = stream_search_companies(
+                    companies,
+                    keyword=args.keyword,
+                    min_salary=args.min_salary,
+                    location=args.location,
+                    verbose=args.verbose,
+                    output_file=output_file,
+                    checkpoint=checkpoint,
+                    department=args.department,
+                    since=since,
+                    source=args.source,
+                    progress=progress,
+                )
+        finally:
+            if output_file is not None:
+                output_file.close()
+
+        print(f"\n{'=' * 80}")
+        print(f"Total: {total} matching jobs across {len(companies)} companies")
+        if args.output:
+            print(f"Saved to: {args.output}")
+        return
+
+    # Search: each board is printed the moment it finishes. The -o file is
+    # written as boards complete too, but in input order, so it matches what
+    # json.dump of the whole list would produce.
+    total = 0
+    output_file = None
+    pending = {}  # Board index -> matches, for boards that finished early
+    next_index = 0
+
+    def write_jobs(jobs: list):
+        nonlocal output_file
+        for job in jobs:
+            if output_file is None:
+                output_file = open(args.output, 'w')
+                output_file.write("[\n")
+            else:
+                output_file.write(",\n")
+            element = json.dumps(job.to_dict(), indent=2, default=str)
+            output_file.write("  " + element.replace("\n", "\n  "))
+
+    try:
+        with ProgressLine(len(companies), unit="boards") as progress:
+            for result in iter_search_companies(
+                companies,
+                keyword=args.keyword,
+                min_salary=args.min_salary,
+                location=args.location,
+                verbose=args.verbose,
+                fetch=fetch,
+                checkpoint=checkpoint,
+                department=args.department,
+                since=since,
+                source=args.source,
+                workers=args.workers,
+                max_age=None if args.refresh else ats_sources.BOARD_CACHE_TTL,
+                refresh=args.refresh,
+            ):
+                print("\n".join(result.lines))
+                total += len(result.jobs)
+                progress.update(len(result.jobs))
+                if args.output:
+                    pending[result.index] = result.jobs
+                    while next_index in pending:
+                        write_jobs(pending.pop(next_index))
+                        next_index += 1
+    finally:
+        # Interrupted: keep what finished
+        for index in sorted(pending):
+            write_jobs(pending[index])
+        if output_file is not None:
+            output_file.write("\n]")
+            output_file.close()
+
+    print(f"\n{'=' * 80}")
+    print(f"Total: {total} matching jobs across {len(companies)} companies")
+    if output_file is not None:
+        print(f"Saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
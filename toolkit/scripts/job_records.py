@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Compact Job Records
+
+Greenhouse returns each job as a nested dict with full HTML content.
+Keeping thousands of those around (plus a `_company` tag) duplicates the
+same company, location and department objects over and over and keeps
+every description resident.
+
+JobRecord stores the common fields in __slots__, shares identical
+categorical values (location, departments, offices, metadata, ...)
+between records, and spills descriptions to a temporary file that is
+only read back when `content` is accessed. `to_dict()` rebuilds the
+original dict (same keys, same order), so JSON output is unchanged.
+
+Usage:
+    store = DescriptionStore()
+    record = JobRecord.from_dict(job, company="anthropic", store=store)
+    record.title, record.location_name, record.content
+    json.dump([r.to_dict() for r in records], f)
+"""
+
+import json
+import sys
+import tempfile
+from typing import Optional
+
+# Keys held in dedicated slots; everything else goes to `_extra`
+_SLOT_KEYS = ("id", "title", "absolute_url", "updated_at", "location", "departments", "offices")
+
+# Shared (interned) values and key layouts. Containers are keyed by their
+# JSON, key order included, so sharing never reorders a record's fields.
+# Bounded (oldest entries evicted first); an evicted value just stops
+# being shared with records built later.
+_SHARED: dict[str, object] = {}
+_SHARED_SIZE = 4096
+_LAYOUTS: dict[tuple, tuple] = {}
+
+
+def _share(value):
+    """Return a shared instance of `value` (strings interned, containers deduplicated)."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, (dict, list)):
+        key = json.dumps(value, default=str)
+        shared = _SHARED.get(key)
+        if shared is None:
+            while len(_SHARED) >= _SHARED_SIZE:
+                _SHARED.pop(next(iter(_SHARED)))
+            shared = _SHARED[key] = value
+        return shared
+    return value
+
+
+class DescriptionStore:
+    """Append-only spill file for job descriptions, read back on demand."""
+
+    def __init__(self):
+        self._file = tempfile.TemporaryFile()
+        self._end = 0
+
+    def put(self, text: str) -> tuple[int, int]:
+        """Store text, returning its (offset, length) handle."""
+        data = text.encode("utf-8")
+        self._file.seek(self._end)
+        self._file.write(data)
+        offset = self._end
+        self._end += len(data)
+        return offset, len(data)
+
+    def get(self, handle: tuple[int, int]) -> str:
+        """Read back text stored under `handle`."""
+        offset, length = handle
+        self._file.seek(offset)
+        return self._file.read(length).decode("utf-8")
+
+    def close(self):
+        self._file.close()
+
+
+_default_store: Optional[DescriptionStore] = None
+
+
+def default_store() -> DescriptionStore:
+    """Process-wide description store, created on first use."""
+    global _default_store
+    if _default_store is None:
+        _default_store = DescriptionStore()
+    return _default_store
+
+
+class JobRecord:
+    """A retained job with shared categorical fields and a lazily loaded description."""
+
+    __slots__ = (
+        "company", "id", "title", "absolute_url", "updated_at",
+        "location", "departments", "offices",
+        "_layout", "_extra", "_store", "_content",
+    )
+
+    @classmethod
+    def from_dict(cls, job: dict, company: str = None,
+                  store: DescriptionStore = None) -> "JobRecord":
+        """
+        Build a record from a raw Greenhouse job dict.
+
+        `company` defaults to the job's `_company` tag. The derived `_text`
+        field is dropped; everything else survives the round trip.
+        """
+        record = cls()
+        if company is None:
+            company = job.get("_company")
+        record.company = _share(company) if company is not None else None
+
+        layout = tuple(key for key in job if key not in ("_text", "_company"))
+        if company is not None:
+            layout += ("_company",)
+        record._layout = _LAYOUTS.setdefault(layout, layout)
+
+        for key in _SLOT_KEYS:
+            setattr(record, key, _share(job.get(key)))
+
+        extra = [_share(job[key]) for key in layout
+                 if key not in _SLOT_KEYS and key not in ("content", "_company")]
+        record._extra = tuple(extra) if extra else ()
+
+        content = job.get("content")
+        if content:
+            record._store = store if store is not None else default_store()
+            record._content = record._store.put(content)
+        else:
+            record._store = None
+            record._content = content  # None or "" - kept as-is
+        return record
+
+    @property
+    def content(self) -> Optional[str]:
+        """Raw description, loaded from the description store on access."""
+        if self._store is None:
+            return self._content
+        return self._store.get(self._content)
+
+    @property
+    def location_name(self) -> str:
+        return (self.location or {}).get("name", "")
+
+    @property
+    def department_names(self) -> list[str]:
+        return [d.get("name") for d in self.departments or []]
+
+    def to_dict(self) -> dict:
+        """Rebuild the original job dict (including `_company`)."""
+        out = {}
+        extra = iter(self._extra)
+        for key in self._layout:
+            if key in _SLOT_KEYS:
+                out[key] = getattr(self, key)
+            elif key == "content":
+                out[key] = self.content
+            elif key == "_company":
+                out[key] = self.company
+            else:
+                out[key] = next(extra)
+        return out
+
+    def __repr__(self) -> str:
+        return f"JobRecord({self.company!r}, {self.title!r}, id={self.id!r})"
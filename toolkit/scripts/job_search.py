@@ -1,212 +1,450 @@
-#!/usr/bin/env python3
-"""
-Job Search Script - Bulk search across multiple job boards
-
-Uses JobSpy library to search Indeed, LinkedIn, Glassdoor, Google, ZipRecruiter
-
-Usage:
-    python job_search.py "software engineer" --location "San Francisco, CA" --min-salary 150000
-    python job_search.py "ML engineer" --remote --hours 72
-    python job_search.py --config ../profile.json  # Use profile for search terms
-"""
-
-import argparse
-import json
-import sys
-from pathlib import Path
-from datetime import datetime
-
-try:
-    from jobspy import scrape_jobs
-    import pandas as pd
-except ImportError:
-    print("Required packages not installed. Run:")
-    print("  pip install python-jobspy pandas")
-    sys.exit(1)
-
-
-def load_profile(profile_path: str) -> dict:
-    """Load user profile for search parameters."""
-    with open(profile_path) as f:
-        return json.load(f)
-
-
-def search_jobs(
-    search_term: str,
-    location: str = None,
-    remote: bool = False,
-    min_salary: int = None,
-    hours_old: int = 72,
-    results_per_site: int = 25,
-    sites: list = None,
-) -> pd.DataFrame:
-    """
-    Search for jobs across multiple boards.
-
-    Returns DataFrame with columns:
-    - site, title, company, location, job_url, description
-    - date_posted, job_type, salary_min, salary_max, salary_currency
-    """
-    if sites is None:
-        sites = ["indeed", "linkedin", "glassdoor", "google", "zip_recruiter"]
-
-    print(f"Searching for '{search_term}'...")
-    if location:
-        print(f"  Location: {location}")
-    if remote:
-        print(f"  Remote: Yes")
-    if min_salary:
-        print(f"  Min salary: ${min_salary:,}")
-    print(f"  Sites: {', '.join(sites)}")
-    print(f"  Posted within: {hours_old} hours")
-    print()
-
-    try:
-        jobs = scrape_jobs(
-            site_name=sites,
-            search_term=search_term,
-            location=location or "",
-            is_remote=remote,
-            results_wanted=results_per_site,
-            hours_old=hours_old,
-            country_indeed='USA',
-            enforce_annual_salary=True,  # Normalize all salaries to annual
-        )
-    except Exception as e:
-        print(f"Error during search: {e}")
-        return pd.DataFrame()
-
-    # Filter by minimum salary if specified
-    if min_salary and 'min_amount' in jobs.columns:
-        before = len(jobs)
-        jobs = jobs[
-            (jobs['min_amount'].isna()) |  # Keep jobs without salary info
-            (jobs['min_amount'] >= min_salary)
-        ]
-        after = len(jobs)
-        if before != after:
-            print(f"Filtered {before - after} jobs below ${min_salary:,} salary")
-
-    return jobs
-
-
-def format_results(jobs: pd.DataFrame, verbose: bool = False) -> str:
-    """Format job results for display."""
-    if jobs.empty:
-        return "No jobs found matching criteria."
-
-    lines = [f"Found {len(jobs)} jobs:\n"]
-    lines.append("=" * 80)
-
-    for idx, job in jobs.iterrows():
-        title = job.get('title', 'Unknown Title')
-        company = job.get('company', 'Unknown Company')
-        location = job.get('location', '')
-        url = job.get('job_url', '')
-        site = job.get('site', '')
-
-        # Format salary if available
-        salary_str = ""
-        min_sal = job.get('min_amount')
-        max_sal = job.get('max_amount')
-        if pd.notna(min_sal) or pd.notna(max_sal):
-            if pd.notna(min_sal) and pd.notna(max_sal):
-                salary_str = f"${int(min_sal):,} - ${int(max_sal):,}"
-            elif pd.notna(min_sal):
-                salary_str = f"${int(min_sal):,}+"
-            else:
-                salary_str = f"Up to ${int(max_sal):,}"
-
-        lines.append(f"\n[{site.upper()}] {title}")
-        lines.append(f"  Company: {company}")
-        if location:
-            lines.append(f"  Location: {location}")
-        if salary_str:
-            lines.append(f"  Salary: {salary_str}")
-        lines.append(f"  URL: {url}")
-
-        if verbose and job.get('description'):
-            desc = str(job['description'])[:300] + "..." if len(str(job.get('description', ''))) > 300 else job.get('description', '')
-            lines.append(f"  Description: {desc}")
-
-        lines.append("-" * 40)
-
-    return "\n".join(lines)
-
-
-def save_results(jobs: pd.DataFrame, output_path: str):
-    """Save results to CSV and JSON."""
-    if jobs.empty:
-        print("No results to save.")
-        return
-
-    # Save CSV
-    csv_path = output_path.replace('.json', '.csv')
-    jobs.to_csv(csv_path, index=False)
-    print(f"Saved CSV: {csv_path}")
-
-    # Save JSON (more detailed)
-    json_path = output_path if output_path.endswith('.json') else output_path + '.json'
-    jobs.to_json(json_path, orient='records', indent=2)
-    print(f"Saved JSON: {json_path}")
-
-
-def main():
-    parser = argparse.ArgumentParser(description="Search for jobs across multiple boards")
-    parser.add_argument("search_term", nargs="?", help="Job title or keywords to search")
-    parser.add_argument("--location", "-l", help="Location to search (city, state)")
-    parser.add_argument("--remote", "-r", action="store_true", help="Search for remote jobs only")
-    parser.add_argument("--min-salary", "-s", type=int, help="Minimum salary filter")
-    parser.add_argument("--hours", type=int, default=72, help="Jobs posted within N hours (default: 72)")
-    parser.add_argument("--results", "-n", type=int, default=25, help="Results per site (default: 25)")
-    parser.add_argument("--sites", nargs="+", help="Sites to search (indeed, linkedin, glassdoor, google, zip_recruiter)")
-    parser.add_argument("--config", "-c", help="Path to profile.json for search parameters")
-    parser.add_argument("--output", "-o", help="Output file path (saves CSV and JSON)")
-    parser.add_argument("--verbose", "-v", action="store_true", help="Show job descriptions")
-
-    args = parser.parse_args()
-
-    # Load from config if provided
-    search_term = args.search_term
-    location = args.location
-    min_salary = args.min_salary
-
-    if args.config:
-        profile = load_profile(args.config)
-        job_search = profile.get('job_search', {})
-        if not search_term and job_search.get('target_titles'):
-            search_term = " OR ".join(job_search['target_titles'])
-        if not location and job_search.get('preferred_locations'):
-            location = job_search['preferred_locations'][0]
-        if not min_salary:
-            min_salary = job_search.get('min_salary')
-
-    if not search_term:
-        parser.error("search_term is required (or provide --config with target_titles)")
-
-    # Run search
-    jobs = search_jobs(
-        search_term=search_term,
-        location=location,
-        remote=args.remote,
-        min_salary=min_salary,
-        hours_old=args.hours,
-        results_per_site=args.results,
-        sites=args.sites,
-    )
-
-    # Display results
-    print(format_results(jobs, verbose=args.verbose))
-
-    # Save if output specified
-    if args.output:
-        save_results(jobs, args.output)
-    elif not jobs.empty:
-        # Default output path
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        default_output = f"job_search_{timestamp}.json"
-        save_results(jobs, default_output)
-
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+"""
+Job Search Script - Bulk search across multiple job boards
+
+Uses JobSpy library to search Indeed, LinkedIn, Glassdoor, Google, ZipRecruiter
+
+Usage:
+    python job_search.py "software engineer" --location "San Francisco, CA" --min-salary 150000
+    python job_search.py "ML engineer" --remote --hours 72
+    python job_search.py --config ../profile.json  # Use profile for search terms
+    python job_search.py --replay 2026-01-21 --min-salary 180000  # Offline, archived results
+"""
+
+import argparse
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from io import StringIO
+from pathlib import Path
+from datetime import datetime
+from typing import Iterator
+
+try:
+    from jobspy import scrape_jobs
+    import pandas as pd
+except ImportError:
+    print("Required packages not installed. Run:")
+    print("  pip install python-jobspy pandas")
+    sys.exit(1)
+
+import local_cache
+import payload_archive
+from checkpoints import SweepCheckpoint
+from locations import LocationMatcher
+from progress import ProgressLine
+from salaries import backfill_salaries
+
+
+def load_profile(profile_path: str) -> dict:
+    """Load user profile for search parameters."""
+    with open(profile_path) as f:
+        return json.load(f)
+
+
+# Cached results never outlive this, however wide the --hours window
+QUERY_CACHE_MAX_TTL = 3600
+
+
+def query_cache_ttl(hours_old: int) -> int:
+    """Seconds a cached search stays fresh: 1/24 of the posting window, capped at an hour."""
+    return min(QUERY_CACHE_MAX_TTL, hours_old * 3600 // 24)
+
+
+def query_cache_key(search_term: str, location: str, remote: bool,
+                    hours_old: int, results_per_site: int, site: str) -> dict:
+    """Normalized search parameters identifying one site's cached results."""
+    return {
+        "search_term": " ".join(search_term.lower().split()),
+        "location": " ".join((location or "").lower().split()),
+        "remote": bool(remote),
+        "hours_old": hours_old,
+        "results_per_site": results_per_site,
+        "site": site,
+    }
+
+
+def iter_site_results(
+    search_term: str,
+    location: str = None,
+    remote: bool = False,
+    min_salary: int = None,
+    hours_old: int = 72,
+    results_per_site: int = 25,
+    sites: list = None,
+    refresh: bool = False,
+    checkpoint: SweepCheckpoint = None,
+) -> Iterator[tuple[str, pd.DataFrame]]:
+    """
+    Yield (site, raw results) for each site as soon as they're available.
+
+    Checkpointed and cached sites come first; the rest are scraped
+    concurrently and yielded in the order they finish, so the first
+    results can be shown while slower sites are still being scraped.
+    Sites that fail are reported and yield an empty frame.
+
+    Per-site results are cached (see query_cache_ttl), so repeating a
+    search only scrapes sites whose cached results have expired.
+    `refresh` ignores the cache. With a `checkpoint`, each site is saved
+    as it finishes and sites already in the checkpoint are reused
+    regardless of cache age.
+    """
+    if sites is None:
+        sites = ["indeed", "linkedin", "glassdoor", "google", "zip_recruiter"]
+
+    print(f"Searching for '{search_term}'...")
+    if location:
+        print(f"  Location: {location}")
+    if remote:
+        print(f"  Remote: Yes")
+    if min_salary:
+        print(f"  Min salary: ${min_salary:,}")
+    print(f"  Sites: {', '.join(sites)}")
+    print(f"  Posted within: {hours_old} hours")
+    print()
+
+    # Serve each site from a checkpoint or the query cache when possible
+    stale_sites = []
+    ttl = query_cache_ttl(hours_old)
+    for site in sites:
+        saved = checkpoint.load(site) if checkpoint else None
+        if saved is not None:
+            print(f"  {site}: restored from checkpoint")
+            yield site, pd.DataFrame.from_records(saved)
+            continue
+        key = query_cache_key(search_term, location, remote, hours_old, results_per_site, site)
+        cached = None if refresh else local_cache.load_cached("jobspy_queries", key, max_age=ttl)
+        if cached is None:
+            stale_sites.append(site)
+        else:
+            print(f"  {site}: using cached results (--refresh to re-scrape)")
+            # dtype=False: don't re-guess types ("01234" would become 1234)
+            yield site, pd.read_json(StringIO(cached.decode("utf-8")), orient='records', dtype=False)
+
+    # Scrape the remaining sites concurrently, saving each as soon as it finishes
+    if not stale_sites:
+        return
+    with ThreadPoolExecutor(max_workers=len(stale_sites)) as pool:
+        futures = {
+            pool.submit(
+                scrape_jobs,
+                site_name=[site],
+                search_term=search_term,
+                location=location or "",
+                is_remote=remote,
+                results_wanted=results_per_site,
+                hours_old=hours_old,
+                country_indeed='USA',
+                enforce_annual_salary=True,  # Normalize all salaries to annual
+            ): site
+            for site in stale_sites
+        }
+        for future in as_completed(futures):
+            site = futures[future]
+            try:
+                site_jobs = future.result()
+            except Exception as e:
+                print(f"Error searching {site}: {e}")
+                yield site, pd.DataFrame()
+                continue
+
+            records = site_jobs.to_json(orient='records', date_format='iso')
+            query = {
+                "search_term": search_term, "location": location or "", "remote": remote,
+                "hours_old": hours_old, "results_per_site": results_per_site, "sites": [site],
+            }
+            payload_archive.archive_payload("jobspy", json.dumps(query, sort_keys=True),
+                                            records.encode())
+            key = query_cache_key(search_term, location, remote, hours_old, results_per_site, site)
+            local_cache.store_cached("jobspy_queries", key, records.encode())
+            if checkpoint:
+                checkpoint.save(site, json.loads(records))
+            yield site, site_jobs
+
+
+def search_jobs(
+    search_term: str,
+    location: str = None,
+    remote: bool = False,
+    min_salary: int = None,
+    hours_old: int = 72,
+    results_per_site: int = 25,
+    sites: list = None,
+    require_salary: bool = False,
+    refresh: bool = False,
+    checkpoint: SweepCheckpoint = None,
+) -> pd.DataFrame:
+    """
+    Search for jobs across multiple boards.
+
+    Collects every site from iter_site_results (which see for caching
+    and checkpointing), then backfills and filters salaries.
+
+    Returns DataFrame with columns:
+    - site, title, company, location, job_url, description
+    - date_posted, job_type, min_amount, max_amount, interval, currency
+    - salary_confidence (see backfill_salaries)
+    """
+    frames = [
+        frame for _, frame in iter_site_results(
+            search_term, location=location, remote=remote, min_salary=min_salary,
+            hours_old=hours_old, results_per_site=results_per_site, sites=sites,
+            refresh=refresh, checkpoint=checkpoint,
+        )
+        if not frame.empty
+    ]
+    if not frames:
+        return pd.DataFrame()
+    jobs = pd.concat(frames, ignore_index=True)
+
+    jobs = backfill_salaries(jobs)
+    return filter_by_salary(jobs, min_salary, require_salary=require_salary)
+
+
+def filter_by_salary(
+    jobs: pd.DataFrame,
+    min_salary: int = None,
+    require_salary: bool = False,
+) -> pd.DataFrame:
+    """
+    Drop jobs whose minimum salary is below `min_salary`.
+
+    Run backfill_salaries first so salaries that only appear in the
+    description are filtered too. Jobs with no salary at all are kept
+    (and counted) unless `require_salary` is set.
+    """
+    if min_salary and 'min_amount' in jobs.columns:
+        before = len(jobs)
+        unknown = jobs['min_amount'].isna()
+        jobs = jobs[
+            (unknown & (not require_salary)) |
+            (jobs['min_amount'] >= min_salary)
+        ]
+        after = len(jobs)
+        if before != after:
+            print(f"Filtered {before - after} jobs below ${min_salary:,} salary")
+        kept_unknown = int(jobs['min_amount'].isna().sum())
+        if kept_unknown:
+            print(f"Kept {kept_unknown} jobs with no salary info (--require-salary to drop)")
+
+    return jobs
+
+
+def filter_by_locations(jobs: pd.DataFrame, preferred: list) -> pd.DataFrame:
+    """
+    Keep jobs located in any of the `preferred` locations.
+
+    Preferences and job locations are parsed into canonical places
+    (see locations.py), so "SF" matches "San Francisco, CA" and "Remote"
+    matches "Remote - US" or any row JobSpy flags is_remote. Each distinct
+    location string is parsed once.
+    """
+    if jobs.empty or not preferred or 'location' not in jobs.columns:
+        return jobs
+
+    matcher = LocationMatcher(preferred)
+    locs = jobs['location'].fillna('').astype(str)
+    in_preferred = locs.map({loc: matcher.matches(loc) for loc in locs.unique()})
+    if matcher.accepts_remote and 'is_remote' in jobs.columns:
+        in_preferred |= jobs['is_remote'].fillna(False).astype(bool)
+
+    filtered = jobs[in_preferred]
+    if len(filtered) != len(jobs):
+        print(f"Filtered {len(jobs) - len(filtered)} jobs outside preferred locations")
+    return filtered
+
+
+def load_archived_results(date: str, search_term: str = None) -> pd.DataFrame:
+    """
+    Load JobSpy results archived on `date` (YYYY-MM-DD) without any network.
+
+    Uses the latest snapshot of each query; `search_term` limits the
+    replay to queries with that exact term.
+    """
+    frames = []
+    for key, entry in payload_archive.latest_entries(date, "jobspy").items():
+        if search_term and json.loads(key).get("search_term") != search_term:
+            continue
+        payload = payload_archive.load_payload(entry).decode("utf-8")
+        frames.append(pd.read_json(StringIO(payload), orient='records', dtype=False))
+
+    if not frames:
+        return pd.DataFrame()
+    jobs = pd.concat(frames, ignore_index=True)
+    if 'job_url' in jobs.columns:
+        jobs = jobs.drop_duplicates(subset='job_url')
+    return jobs
+
+
+def format_results(jobs: pd.DataFrame, verbose: bool = False) -> str:
+    """Format job results for display."""
+    if jobs.empty:
+        return "No jobs found matching criteria."
+
+    lines = [f"Found {len(jobs)} jobs:\n"]
+    lines.append("=" * 80)
+
+    for idx, job in jobs.iterrows():
+        title = job.get('title', 'Unknown Title')
+        company = job.get('company', 'Unknown Company')
+        location = job.get('location', '')
+        url = job.get('job_url', '')
+        site = job.get('site', '')
+
+        # Format salary if available
+        salary_str = ""
+        min_sal = job.get('min_amount')
+        max_sal = job.get('max_amount')
+        if pd.notna(min_sal) or pd.notna(max_sal):
+            if pd.notna(min_sal) and pd.notna(max_sal):
+                salary_str = f"${int(min_sal):,} - ${int(max_sal):,}"
+            elif pd.notna(min_sal):
+                salary_str = f"${int(min_sal):,}+"
+            else:
+                salary_str = f"Up to ${int(max_sal):,}"
+            if job.get('salary_confidence', 1.0) < 1.0:
+                salary_str += " (from description)"
+
+        lines.append(f"\n[{site.upper()}] {title}")
+        lines.append(f"  Company: {company}")
+        if location:
+            lines.append(f"  Location: {location}")
+        if salary_str:
+            lines.append(f"  Salary: {salary_str}")
+        lines.append(f"  URL: {url}")
+
+        if verbose and job.get('description'):
+            desc = str(job['description'])[:300] + "..." if len(str(job.get('description', ''))) > 300 else job.get('description', '')
+            lines.append(f"  Description: {desc}")
+
+        lines.append("-" * 40)
+
+    return "\n".join(lines)
+
+
+def save_results(jobs: pd.DataFrame, output_path: str):
+    """Save results to CSV and JSON."""
+    if jobs.empty:
+        print("No results to save.")
+        return
+
+    # Save CSV
+    csv_path = output_path.replace('.json', '.csv')
+    jobs.to_csv(csv_path, index=False)
+    print(f"Saved CSV: {csv_path}")
+
+    # Save JSON (more detailed)
+    json_path = output_path if output_path.endswith('.json') else output_path + '.json'
+    jobs.to_json(json_path, orient='records', indent=2)
+    print(f"Saved JSON: {json_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search for jobs across multiple boards")
+    parser.add_argument("search_term", nargs="?", help="Job title or keywords to search")
+    parser.add_argument("--location", "-l", help="Location to search (city, state)")
+    parser.add_argument("--remote", "-r", action="store_true", help="Search for remote jobs only")
+    parser.add_argument("--min-salary", "-s", type=int, help="Minimum salary filter")
+    parser.add_argument("--require-salary", action="store_true",
+                        help="With --min-salary, drop jobs whose salary can't be determined")
+    parser.add_argument("--hours", type=int, default=72, help="Jobs posted within N hours (default: 72)")
+    parser.add_argument("--results", "-n", type=int, default=25, help="Results per site (default: 25)")
+    parser.add_argument("--sites", nargs="+", help="Sites to search (indeed, linkedin, glassdoor, google, zip_recruiter)")
+    parser.add_argument("--config", "-c", help="Path to profile.json for search parameters")
+    parser.add_argument("--output", "-o", help="Output file path (saves CSV and JSON)")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Show job descriptions")
+    parser.add_argument("--replay", metavar="DATE",
+                        help="Re-run filters/formatting on results archived on DATE (YYYY-MM-DD), offline")
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached search results and re-scrape")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue an interrupted search, reusing sites that already finished")
+    parser.add_argument("--no-archive", action="store_true", help="Don't archive raw search results")
+
+    args = parser.parse_args()
+
+    # Load from config if provided
+    search_term = args.search_term
+    location = args.location
+    min_salary = args.min_salary
+    preferred_locations = []
+
+    if args.config:
+        profile = load_profile(args.config)
+        job_search = profile.get('job_search', {})
+        if not search_term and job_search.get('target_titles'):
+            search_term = " OR ".join(job_search['target_titles'])
+        if not location and job_search.get('preferred_locations'):
+            # Search around the first, then keep results in any of them
+            preferred_locations = job_search['preferred_locations']
+            location = preferred_locations[0]
+        if not min_salary:
+            min_salary = job_search.get('min_salary')
+
+    if args.no_archive:
+        payload_archive.ENABLED = False
+
+    if args.replay:
+        jobs = load_archived_results(args.replay, search_term=args.search_term)
+        if jobs.empty:
+            parser.error(f"No archived JobSpy results for {args.replay} "
+                         f"(available: {', '.join(payload_archive.archived_dates()) or 'none'})")
+        jobs = backfill_salaries(jobs)
+        jobs = filter_by_salary(jobs, min_salary, require_salary=args.require_salary)
+        jobs = filter_by_locations(jobs, preferred_locations)
+        print(format_results(jobs, verbose=args.verbose))
+        if args.output:
+            save_results(jobs, args.output)
+        return
+
+    if not search_term:
+        parser.error("search_term is required (or provide --config with target_titles)")
+
+    # Checkpoint each site; a plain run starts from scratch
+    checkpoint = SweepCheckpoint("jobspy", {
+        "search_term": search_term, "location": location, "remote": args.remote,
+        "hours_old": args.hours, "results_per_site": args.results,
+    })
+    if not args.resume:
+        checkpoint.clear()
+
+    # Show each site's matches as soon as it's done
+    sites = args.sites or ["indeed", "linkedin", "glassdoor", "google", "zip_recruiter"]
+    frames = []
+    with ProgressLine(len(sites), unit="sites") as progress:
+        for site, site_jobs in iter_site_results(
+            search_term=search_term,
+            location=location,
+            remote=args.remote,
+            min_salary=min_salary,
+            hours_old=args.hours,
+            results_per_site=args.results,
+            sites=sites,
+            refresh=args.refresh,
+            checkpoint=checkpoint,
+        ):
+            if site_jobs.empty:
+                progress.update()
+                continue
+            site_jobs = backfill_salaries(site_jobs)
+            site_jobs = filter_by_salary(site_jobs, min_salary, require_salary=args.require_salary)
+            site_jobs = filter_by_locations(site_jobs, preferred_locations)
+            if not site_jobs.empty:
+                print(f"\n{site}: " + format_results(site_jobs, verbose=args.verbose))
+                frames.append(site_jobs)
+            progress.update(len(site_jobs))
+
+    jobs = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    print(f"\nTotal: {len(jobs)} jobs across {len(sites)} sites")
+
+    # Save if output specified
+    if args.output:
+        save_results(jobs, args.output)
+    elif not jobs.empty:
+        # Default output path
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        default_output = f"job_search_{timestamp}.json"
+        save_results(jobs, default_output)
+
+
+if __name__ == "__main__":
+    main()
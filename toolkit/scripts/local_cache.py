@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Local Cache Helpers
+
+Shared location and write helpers for everything the toolkit keeps on
+disk between runs (raw payload archive, query caches, checkpoints).
+
+The cache lives in toolkit/.cache by default; set JOB_COACH_CACHE to
+put it somewhere else.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from typing import Optional
+
+CACHE_DIR = Path(os.environ.get("JOB_COACH_CACHE", Path(__file__).parent.parent / ".cache"))
+
+
+def cache_path(*parts: str) -> Path:
+    """Path inside the cache directory (parent directories are created)."""
+    path = CACHE_DIR.joinpath(*parts)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def atomic_write_bytes(path: Path, data: bytes):
+    """Write `data` to `path` so readers never see a partial file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _entry_path(namespace: str, key) -> Path:
+    if not isinstance(key, str):
+        key = json.dumps(key, sort_keys=True, default=str)
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return CACHE_DIR / namespace / f"{digest}.gz"
+
+
+def load_cached(namespace: str, key, max_age: Optional[float] = None) -> Optional[bytes]:
+    """
+    Return bytes stored under `key`, or None if missing or older than `max_age` seconds.
+
+    `key` is any string or JSON-serializable value (e.g. a dict of query params).
+    """
+    path = _entry_path(namespace, key)
+    try:
+        if max_age is not None and time.time() - path.stat().st_mtime > max_age:
+            return None
+        with open(path, "rb") as f:
+            return gzip.decompress(f.read())
+    except FileNotFoundError:
+        return None
+    except (EOFError, gzip.BadGzipFile, zlib.error):
+        return None  # Damaged entry: treat as missing, the next store replaces it
+
+
+def cache_age(namespace: str, key) -> Optional[float]:
+    """Seconds since `key` was stored, or None if it isn't cached."""
+    try:
+        return time.time() - _entry_path(namespace, key).stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
+def store_cached(namespace: str, key, data: bytes):
+    """Store bytes under `key` (gzip-compressed, written atomically)."""
+    atomic_write_bytes(_entry_path(namespace, key), gzip.compress(data, compresslevel=6))
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Location Normalization
+
+Job boards describe places inconsistently: "SF", "San Francisco Bay Area",
+"Remote - US", "New York or Remote". Substring matching misses some of
+these and over-matches others ("york" in "New York", "CA" in "Chicago").
+
+parse_location() turns a free-text location into structured Places
+(city, state, country, metro, remote) using the small offline gazetteer
+below; results are memoized per distinct string. LocationMatcher turns a
+list of preferred locations into a set of keys, so checking a job is a
+set intersection instead of repeated substring scans.
+
+Usage:
+    parse_location("SF / Remote (US)")
+    matcher = LocationMatcher(["Remote", "San Francisco, CA", "New York, NY"])
+    matcher.matches("Oakland, CA")       # True (SF Bay Area)
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, NamedTuple, Optional
+
+
+class Place(NamedTuple):
+    city: Optional[str] = None      # Canonical city name
+    state: Optional[str] = None     # US state / Canadian province code
+    country: Optional[str] = None   # ISO 3166 alpha-2
+    metro: Optional[str] = None     # Metro area the city belongs to
+    remote: bool = False
+
+
+# ============================================================
+# GAZETTEER (offline; extend as needed)
+# ============================================================
+
+US_STATES = {
+    "AL": "alabama", "AK": "alaska", "AZ": "arizona", "AR": "arkansas", "CA": "california",
+    "CO": "colorado", "CT": "connecticut", "DE": "delaware", "DC": "district of columbia",
+    "FL": "florida", "GA": "georgia", "HI": "hawaii", "ID": "idaho", "IL": "illinois",
+    "IN": "indiana", "IA": "iowa", "KS": "kansas", "KY": "kentucky", "LA": "louisiana",
+    "ME": "maine", "MD": "maryland", "MA": "massachusetts", "MI": "michigan", "MN": "minnesota",
+    "MS": "mississippi", "MO": "missouri", "MT": "montana", "NE": "nebraska", "NV": "nevada",
+    "NH": "new hampshire", "NJ": "new jersey", "NM": "new mexico", "NY": "new york",
+    "NC": "north carolina", "ND": "north dakota", "OH": "ohio", "OK": "oklahoma",
+    "OR": "oregon", "PA": "pennsylvania", "RI": "rhode island", "SC": "south carolina",
+    "SD": "south dakota", "TN": "tennessee", "TX": "texas", "UT": "utah", "VT": "vermont",
+    "VA": "virginia", "WA": "washington", "WV": "west virginia", "WI": "wisconsin", "WY": "wyoming",
+}
+
+CA_PROVINCES = {"ON": "ontario", "BC": "british columbia", "QC": "quebec", "AB": "alberta"}
+
+COUNTRIES = {
+    "US": ["united states", "united states of america", "usa", "us", "u.s.", "u.s.a.", "america"],
+    "CA": ["canada"],
+    "GB": ["united kingdom", "uk", "u.k.", "great britain", "england", "scotland"],
+    "IE": ["ireland"],
+    "DE": ["germany", "deutschland"],
+    "FR": ["france"],
+    "NL": ["netherlands", "the netherlands"],
+    "CH": ["switzerland"],
+    "ES": ["spain"],
+    "PL": ["poland"],
+    "IL": ["israel"],
+    "IN": ["india"],
+    "SG": ["singapore"],
+    "JP": ["japan"],
+    "KR": ["south korea", "korea"],
+    "AU": ["australia"],
+    "BR": ["brazil"],
+    "MX": ["mexico"],
+}
+
+# Canonical city -> (state, country, metro, aliases)
+CITIES = {
+    "San Francisco": ("CA", "US", "SF Bay Area", ["sf", "san fran", "sfo"]),
+    "Oakland": ("CA", "US", "SF Bay Area", []),
+    "Berkeley": ("CA", "US", "SF Bay Area", []),
+    "San Jose": ("CA", "US", "SF Bay Area", []),
+    "Palo Alto": ("CA", "US", "SF Bay Area", []),
+    "Mountain View": ("CA", "US", "SF Bay Area", []),
+    "Menlo Park": ("CA", "US", "SF Bay Area", []),
+    "Sunnyvale": ("CA", "US", "SF Bay Area", []),
+    "Redwood City": ("CA", "US", "SF Bay Area", []),
+    "South San Francisco": ("CA", "US", "SF Bay Area", ["ssf"]),
+    "San Mateo": ("CA", "US", "SF Bay Area", []),
+    "Santa Clara": ("CA", "US", "SF Bay Area", []),
+    "Los Angeles": ("CA", "US", "Los Angeles", ["l.a."]),
+    "Santa Monica": ("CA", "US", "Los Angeles", []),
+    "San Diego": ("CA", "US", "San Diego", []),
+    "Seattle": ("WA", "US", "Seattle", []),
+    "Bellevue": ("WA", "US", "Seattle", []),
+    "Redmond": ("WA", "US", "Seattle", []),
+    "Portland": ("OR", "US", "Portland", []),
+    "New York": ("NY", "US", "New York", ["nyc", "new york city", "manhattan", "brooklyn"]),
+    "Jersey City": ("NJ", "US", "New York", []),
+    "Boston": ("MA", "US", "Boston", []),
+    "Cambridge": ("MA", "US", "Boston", []),
+    "Washington DC": ("DC", "US", "Washington DC", ["washington d.c.", "washington dc", "d.c."]),
+    "Arlington": ("VA", "US", "Washington DC", []),
+    "Chicago": ("IL", "US", "Chicago", []),
+    "Austin": ("TX", "US", "Austin", []),
+    "Dallas": ("TX", "US", "Dallas", []),
+    "Houston": ("TX", "US", "Houston", []),
+    "Denver": ("CO", "US", "Denver", []),
+    "Boulder": ("CO", "US", "Denver", []),
+    "Atlanta": ("GA", "US", "Atlanta", []),
+    "Miami": ("FL", "US", "Miami", []),
+    "Philadelphia": ("PA", "US", "Philadelphia", ["philly"]),
+    "Pittsburgh": ("PA", "US", "Pittsburgh", []),
+    "Salt Lake City": ("UT", "US", "Salt Lake City", ["slc"]),
+    "Minneapolis": ("MN", "US", "Minneapolis", []),
+    "Raleigh": ("NC", "US", "Research Triangle", []),
+    "Durham": ("NC", "US", "Research Triangle", []),
+    "Phoenix": ("AZ", "US", "Phoenix", []),
+    "Toronto": ("ON", "CA", "Toronto", []),
+    "Vancouver": ("BC", "CA", "Vancouver", []),
+    "Montreal": ("QC", "CA", "Montreal", ["montréal"]),
+    "London": (None, "GB", "London", []),
+    "Dublin": (None, "IE", "Dublin", []),
+    "Berlin": (None, "DE", "Berlin", []),
+    "Munich": (None, "DE", "Munich", ["münchen"]),
+    "Paris": (None, "FR", "Paris", []),
+    "Amsterdam": (None, "NL", "Amsterdam", []),
+    "Zurich": (None, "CH", "Zurich", ["zürich"]),
+    "Tel Aviv": (None, "IL", "Tel Aviv", []),
+    "Bangalore": (None, "IN", "Bangalore", ["bengaluru"]),
+    "Singapore": (None, "SG", "Singapore", []),
+    "Tokyo": (None, "JP", "Tokyo", []),
+    "Sydney": (None, "AU", "Sydney", []),
+}
+
+# Metro names that stand for the whole metro, not one city
+METROS = {
+    "sf bay area": "SF Bay Area",
+    "san francisco bay area": "SF Bay Area",
+    "bay area": "SF Bay Area",
+    "silicon valley": "SF Bay Area",
+    "greater new york": "New York",
+    "new york metro": "New York",
+    "tri-state area": "New York",
+    "greater boston": "Boston",
+    "greater seattle": "Seattle",
+    "greater london": "London",
+    "research triangle": "Research Triangle",
+}
+
+
+def _key(alias: str) -> str:
+    # Same normalization _lookup applies to fragments ("U.S." -> "u.s")
+    return " ".join(alias.lower().strip(" .-").split())
+
+
+def _build_lookup() -> tuple[dict, dict, dict]:
+    cities = {}
+    for name, (state, country, metro, aliases) in CITIES.items():
+        place = Place(city=name, state=state, country=country, metro=metro)
+        for alias in [name] + aliases:
+            cities[_key(alias)] = place
+    states = {}
+    for code, name in US_STATES.items():
+        states[_key(code)] = states[_key(name)] = Place(state=code, country="US")
+    for code, name in CA_PROVINCES.items():
+        states.setdefault(_key(code), Place(state=code, country="CA"))
+        states[_key(name)] = Place(state=code, country="CA")
+    countries = {_key(alias): Place(country=code)
+                 for code, aliases in COUNTRIES.items() for alias in aliases}
+    return cities, states, countries
+
+
+_CITIES, _STATES, _COUNTRIES = _build_lookup()
+
+_ALTERNATIVES_RE = re.compile(r"\s+or\s+|\s*[;|/]\s*|\s+&\s+|\s+and\s+")
+_REMOTE_RE = re.compile(r"\b(?:remote|work from home|wfh|anywhere|distributed)\b")
+_PIECES_RE = re.compile(r"\s*[,()\[\]]\s*|\s+[-–—]\s+|\s*:\s*")
+_QUALIFIERS_RE = re.compile(r"\b(?:hybrid|on-?site|in-?office|office|hq|greater|area|metro|based)\b")
+
+
+def _lookup(piece: str, prefer_region: bool = False) -> Optional[Place]:
+    """
+    Look a fragment up in the gazetteer.
+
+    Cities win for the first fragment ("New York, NY"), states and
+    countries for later ones ("Albany, New York").
+    """
+    piece = _key(piece)
+    if not piece:
+        return None
+    if piece in METROS:
+        return Place(metro=METROS[piece])
+    tables = (_STATES, _COUNTRIES, _CITIES) if prefer_region else (_CITIES, _STATES, _COUNTRIES)
+    for table in tables:
+        if piece in table:
+            return table[piece]
+    stripped = " ".join(_QUALIFIERS_RE.sub(" ", piece).split())
+    if stripped != piece:
+        return _lookup(stripped, prefer_region)
+    return None
+
+
+def _parse_alternative(text: str) -> Optional[Place]:
+    remote = bool(_REMOTE_RE.search(text))
+    if remote:
+        text = _REMOTE_RE.sub(" ", text)
+
+    whole = _lookup(text.replace(",", " "))
+    if whole is not None:
+        found = [whole]
+    else:
+        pieces = [piece for piece in _PIECES_RE.split(text) if piece.strip(" .-")]
+        found = [place for i, piece in enumerate(pieces)
+                 if (place := _lookup(piece, prefer_region=i > 0)) is not None]
+
+    if not found:
+        return Place(remote=True) if remote else None
+
+    regions = [p for p in found if not p.city and (p.state or p.country)]
+    state = next((p.state for p in regions if p.state), None)
+    country = next((p.country for p in regions if p.country), None)
+
+    # A gazetteer city only counts if it agrees with any stated state/country
+    # ("Portland, ME" is not Portland, OR)
+    for place in found:
+        if place.city and state in (None, place.state) and country in (None, place.country):
+            return place._replace(remote=remote)
+
+    metro = next((p.metro for p in found if p.metro and not p.city), None)
+    if metro and not country:
+        # Metro-only strings ("Bay Area") take state/country from a city in it
+        for c_state, c_country, c_metro, _ in CITIES.values():
+            if c_metro == metro:
+                state, country = state or c_state, c_country
+                break
+
+    return Place(state=state, country=country, metro=metro, remote=remote)
+
+
+@lru_cache(maxsize=8192)
+def parse_location(text: str) -> tuple[Place, ...]:
+    """
+    Parse a free-text location into one Place per alternative.
+
+    "New York or Remote" -> (Place(city="New York", ...), Place(remote=True)).
+    Parts that aren't in the gazetteer are dropped; an empty tuple means
+    nothing was recognized.
+    """
+    if not text:
+        return ()
+    places = []
+    for alternative in _ALTERNATIVES_RE.split(text.lower()):
+        place = _parse_alternative(alternative)
+        if place is not None and place not in places:
+            places.append(place)
+    return tuple(places)
+
+
+def place_keys(place: Place) -> set[str]:
+    """Index keys a job at `place` can be found under."""
+    keys = set()
+    if place.remote:
+        # "Remote - US" is also a US job: geographic keys follow
+        keys.add("remote:*")
+        keys.add(f"remote:{place.country}" if place.country else "remote:any")
+    if place.city:
+        keys.add(f"city:{place.city}")
+    if place.metro:
+        keys.add(f"metro:{place.metro}")
+    if place.state:
+        keys.add(f"state:{place.country}-{place.state}")
+    if place.country:
+        keys.add(f"country:{place.country}")
+    return keys
+
+
+def wanted_keys(place: Place) -> set[str]:
+    """Keys that satisfy a preference for `place` (its most specific level)."""
+    if place.remote:
+        # "Remote - US" also accepts postings that are just "Remote"
+        return {f"remote:{place.country}", "remote:any"} if place.country else {"remote:*"}
+    if place.metro:
+        return {f"metro:{place.metro}"}
+    if place.city:
+        return {f"city:{place.city}"}
+    if place.state:
+        return {f"state:{place.country}-{place.state}"}
+    if place.country:
+        return {f"country:{place.country}"}
+    return set()
+
+
+@lru_cache(maxsize=8192)
+def location_keys(text: str) -> frozenset:
+    """Memoized index keys for every place in a location string."""
+    keys = set()
+    for place in parse_location(text):
+        keys |= place_keys(place)
+    return frozenset(keys)
+
+
+class LocationMatcher:
+    """
+    Match job locations against a set of preferred locations.
+
+    Recognized preferences are compiled into a key set; each job location
+    is parsed once (memoized) and matched by set intersection.
+    Preferences the gazetteer doesn't know fall back to substring matching.
+    """
+
+    def __init__(self, preferences: Iterable[str]):
+        self.wanted = set()
+        self.fallback = []
+        for preference in preferences:
+            places = parse_location(preference)
+            keys = set().union(*(wanted_keys(p) for p in places)) if places else set()
+            if keys:
+                self.wanted |= keys
+            else:
+                self.fallback.append(preference.lower().strip())
+
+    @property
+    def accepts_remote(self) -> bool:
+        return any(key.startswith("remote:") for key in self.wanted)
+
+    def matches(self, job_location: str) -> bool:
+        if not job_location:
+            return False
+        if self.wanted & location_keys(job_location):
+            return True
+        lowered = job_location.lower()
+        return any(text in lowered for text in self.fallback)
+
+
+@lru_cache(maxsize=256)
+def _matcher(query: str) -> LocationMatcher:
+    return LocationMatcher([query])
+
+
+def location_matches(query: str, job_location: str) -> bool:
+    """True if `job_location` satisfies a single location query (e.g. --location)."""
+    return _matcher(query).matches(job_location)
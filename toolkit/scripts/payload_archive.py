@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Raw Payload Archive
+
+Every Greenhouse board and JobSpy result set the toolkit fetches is
+saved as a compressed, content-addressed snapshot, with a small per-day
+index. `--replay DATE` in greenhouse_search.py and job_search.py reruns
+filtering and formatting against these snapshots without touching the
+network.
+
+Layout (under the local cache directory):
+    archive/objects/ab/abcdef....json.zst   (or .json.gz without zstandard)
+    archive/index/2026-01-21.tsv            fetched_at, source, key, sha256, codec
+
+Compression uses zstandard when installed (pip install zstandard) and
+falls back to gzip.
+"""
+
+import gzip
+import hashlib
+import mmap
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional
+
+from local_cache import CACHE_DIR
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+ARCHIVE_DIR = CACHE_DIR / "archive"
+DEFAULT_CODEC = "zst" if zstandard is not None else "gz"
+
+# Set to False (e.g. via --no-archive) to skip saving fetched payloads
+ENABLED = True
+
+
+class ArchiveEntry(NamedTuple):
+    fetched_at: str
+    source: str
+    key: str
+    sha256: str
+    codec: str
+
+
+def _object_path(sha256: str, codec: str) -> Path:
+    return ARCHIVE_DIR / "objects" / sha256[:2] / f"{sha256}.json.{codec}"
+
+
+def _index_path(date: str) -> Path:
+    return ARCHIVE_DIR / "index" / f"{date}.tsv"
+
+
+def _compressor(f, codec: str):
+    if codec == "zst":
+        return zstandard.ZstdCompressor(level=10).stream_writer(f, closefd=False)
+    return gzip.GzipFile(fileobj=f, mode="wb", compresslevel=6, mtime=0)
+
+
+def _append_index(source: str, key: str, sha256: str, codec: str):
+    now = datetime.now()
+    path = _index_path(now.strftime("%Y-%m-%d"))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Tabs/newlines would break the index; keys are board tokens or queries
+    key = key.replace("\t", " ").replace("\n", " ")
+    line = f"{now.isoformat(timespec='seconds')}\t{source}\t{key}\t{sha256}\t{codec}\n"
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(line)
+
+
+class ArchiveWriter:
+    """
+    Incrementally archive a payload that is being streamed.
+
+    Bytes are compressed and hashed as they are written; the snapshot is
+    only published (and indexed) by commit(). Abandoned writers leave
+    nothing behind.
+    """
+
+    def __init__(self, source: str, key: str, codec: str = DEFAULT_CODEC):
+        self.source = source
+        self.key = key
+        self.codec = codec
+        self._hash = hashlib.sha256()
+        tmp_dir = ARCHIVE_DIR / "objects"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp = tempfile.mkstemp(dir=tmp_dir, prefix=".incoming.")
+        self._file = os.fdopen(fd, "wb")
+        self._writer = _compressor(self._file, codec)
+
+    def write(self, data: bytes):
+        self._hash.update(data)
+        self._writer.write(data)
+
+    def commit(self) -> str:
+        """Publish the snapshot and return its SHA-256."""
+        self._writer.close()
+        self._file.close()
+        sha256 = self._hash.hexdigest()
+        path = _object_path(sha256, self.codec)
+        if path.exists():
+            os.unlink(self._tmp)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(self._tmp, path)
+        _append_index(self.source, self.key, sha256, self.codec)
+        return sha256
+
+    def discard(self):
+        self._writer.close()
+        self._file.close()
+        if os.path.exists(self._tmp):
+            os.unlink(self._tmp)
+
+
+def archive_payload(source: str, key: str, data: bytes) -> Optional[str]:
+    """
+    Save a raw payload (e.g. a Greenhouse response body).
+
+    `source` is the fetcher ("greenhouse", "jobspy"), `key` what was
+    fetched (board token, query). Returns the SHA-256, or None when
+    archiving is disabled.
+    """
+    if not ENABLED:
+        return None
+    writer = ArchiveWriter(source, key)
+    writer.write(data)
+    return writer.commit()
+
+
+def iter_index(date: str) -> Iterator[ArchiveEntry]:
+    """Yield index entries for a YYYY-MM-DD date, oldest first."""
+    path = _index_path(date)
+    if not path.exists() or path.stat().st_size == 0:
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for line in iter(mm.readline, b""):
+            fields = line.decode("utf-8").rstrip("\n").split("\t")
+            if len(fields) == 5:
+                yield ArchiveEntry(*fields)
+
+
+def latest_entries(date: str, source: str) -> dict[str, ArchiveEntry]:
+    """Most recent snapshot per key for one source on a given date."""
+    latest = {}
+    for entry in iter_index(date):
+        if entry.source == source:
+            latest[entry.key] = entry
+    return latest
+
+
+def load_payload(entry: ArchiveEntry) -> bytes:
+    """Decompress an archived payload."""
+    path = _object_path(entry.sha256, entry.codec)
+    with open(path, "rb") as f:
+        if entry.codec == "zst":
+            if zstandard is None:
+                raise RuntimeError("Snapshot is zstd-compressed: pip install zstandard")
+            return zstandard.ZstdDecompressor().stream_reader(f).read()
+        return gzip.decompress(f.read())
+
+
+def archived_dates() -> list[str]:
+    """Dates that have an index, sorted."""
+    index_dir = ARCHIVE_DIR / "index"
+    if not index_dir.exists():
+        return []
+    return sorted(p.stem for p in index_dir.glob("*.tsv"))
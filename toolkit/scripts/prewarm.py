@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Cache Pre-warming
+
+Fetches everything an outreach day is likely to need for the companies
+in profile.json's job_search.target_companies, so later
+greenhouse_search.py and email_finder.py calls answer from the local
+cache without touching the network:
+
+  - each company's job board (Greenhouse, or "lever:"/"ashby:" specs)
+  - the Hunter.io email pattern for each company's domain
+
+Entries in target_companies can be plain names ("Anthropic"), board
+specs ("lever:palantir"), domains ("stripe.com") or objects with
+explicit fields: {"name": "Scale AI", "board": "scaleai", "domain": "scale.com"}.
+Without a domain, "<board token>.com" is assumed.
+
+Hunter domain searches count against your monthly quota: at most
+--hunter-budget of them are spent per run (never more than the account
+has left), and domains looked up in the last 30 days cost nothing.
+
+Usage:
+    python prewarm.py
+    python prewarm.py --config ../../profile.json --hunter-budget 10
+    python prewarm.py --refresh          # refetch even if cached
+    python prewarm.py --no-email         # job boards only
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+import requests
+
+import ats_sources
+from email_finder import cached_domain_pattern, get_domain_pattern
+from greenhouse_search import resolve_board
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Hunter domain searches spent per run unless --hunter-budget says otherwise
+DEFAULT_HUNTER_BUDGET = 10
+
+
+class Target(NamedTuple):
+    name: str
+    board: str
+    domain: str
+
+
+def resolve_target(entry) -> Target:
+    """Board spec and email domain for one target_companies entry."""
+    if isinstance(entry, dict):
+        name = entry.get("name") or entry.get("board") or entry.get("domain", "")
+        spec = entry.get("board") or name
+        domain = entry.get("domain")
+    else:
+        name = spec = entry.strip()
+        domain = None
+        if "." in name and ":" not in name:
+            # "stripe.com": the board is usually named after the domain
+            domain, spec = name.lower(), name.split(".")[0]
+
+    adapter, token = resolve_board(spec)
+    if not domain:
+        bare = ats_sources.split_spec(spec)[1]
+        domain = f"{bare.lower().replace(' ', '').replace('-', '')}.com"
+    return Target(name, ats_sources.board_key(adapter, token), domain.lower())
+
+
+def hunter_searches_left(api_key: str) -> Optional[int]:
+    """Domain searches left this month on the Hunter account (None if unknown)."""
+    try:
+        response = requests.get("https://api.hunter.io/v2/account",
+                                params={"api_key": api_key}, timeout=10)
+        response.raise_for_status()
+        searches = response.json()["data"]["requests"]["searches"]
+        return max(0, searches["available"] - searches["used"])
+    except (requests.exceptions.RequestException, KeyError, TypeError, ValueError):
+        return None
+
+
+def warm_board(spec: str, refresh: bool = False) -> str:
+    """Make sure a board is cached; returns a status line."""
+    adapter, token = resolve_board(spec)
+    if not refresh and ats_sources.cached_board(adapter, token) is not None:
+        return f"  = {spec}: already cached"
+    data = ats_sources.fetch_board(adapter, token)
+    if data.get("error"):
+        return f"  ✗ {spec}: {data['error']}"
+    return f"  ✓ {spec}: {len(data.get('jobs', []))} jobs"
+
+
+def warm_pattern(domain: str, api_key: str) -> str:
+    """Look up (and cache) a domain's email pattern; returns a status line."""
+    pattern = get_domain_pattern(domain, api_key, refresh=True)
+    if cached_domain_pattern(domain) is None:
+        return f"  ✗ {domain}: Hunter lookup failed"
+    return f"  ✓ {domain}: {pattern or 'no known pattern'}"
+
+
+def prewarm(
+    targets: list[Target],
+    api_key: str = None,
+    hunter_budget: int = DEFAULT_HUNTER_BUDGET,
+    refresh: bool = False,
+    boards: bool = True,
+    emails: bool = True,
+    workers: int = ats_sources.DEFAULT_WORKERS,
+) -> list[str]:
+    """
+    Fetch boards and email patterns for `targets` concurrently.
+
+    Prints a status line per board/domain as each finishes and returns
+    all lines (plus budget notes).
+    """
+    lines = []
+
+    def emit(line: str):
+        lines.append(line)
+        print(line, flush=True)
+
+    board_specs = list(dict.fromkeys(t.board for t in targets)) if boards else []
+
+    domains = []
+    if emails:
+        domains = list(dict.fromkeys(t.domain for t in targets))
+        if not refresh:
+            cached = [d for d in domains if cached_domain_pattern(d) is not None]
+            for domain in cached:
+                emit(f"  = {domain}: already cached")
+            domains = [d for d in domains if d not in cached]
+
+        if domains and not api_key:
+            emit(f"  Skipped {len(domains)} email pattern lookups: no HUNTER_API_KEY")
+            domains = []
+        elif domains:
+            left = hunter_searches_left(api_key)
+            budget = hunter_budget if left is None else min(hunter_budget, left)
+            if len(domains) > budget:
+                reason = f"{left} searches left on account" if budget == left else "--hunter-budget"
+                emit(f"  Hunter budget: looking up {budget} of {len(domains)} domains ({reason})")
+                domains = domains[:budget]
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [pool.submit(warm_board, spec, refresh) for spec in board_specs]
+        futures += [pool.submit(warm_pattern, domain, api_key) for domain in domains]
+        for future in as_completed(futures):
+            emit(future.result())
+
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-fetch job boards and email patterns for target companies")
+    parser.add_argument("--config", "-c", default=str(REPO_ROOT / "profile.json"), help="Path to profile.json")
+    parser.add_argument("--hunter-budget", type=int, default=DEFAULT_HUNTER_BUDGET,
+                        help=f"Max Hunter.io domain searches to spend (default: {DEFAULT_HUNTER_BUDGET})")
+    parser.add_argument("--refresh", action="store_true", help="Refetch even if already cached")
+    parser.add_argument("--no-boards", action="store_true", help="Skip job boards")
+    parser.add_argument("--no-email", action="store_true", help="Skip email pattern lookups")
+    parser.add_argument("--workers", type=int, default=ats_sources.DEFAULT_WORKERS,
+                        help=f"Parallel fetches (default: {ats_sources.DEFAULT_WORKERS})")
+
+    args = parser.parse_args()
+
+    with open(args.config) as f:
+        profile = json.load(f)
+    entries = profile.get("job_search", {}).get("target_companies", [])
+    if not entries:
+        print(f"No job_search.target_companies in {args.config}")
+        sys.exit(1)
+
+    targets = [resolve_target(entry) for entry in entries]
+    print(f"Pre-warming {len(targets)} companies...")
+    for target in targets:
+        print(f"  {target.name}: board {target.board}, domain {target.domain}")
+    print()
+
+    lines = prewarm(
+        targets,
+        api_key=os.environ.get("HUNTER_API_KEY"),
+        hunter_budget=args.hunter_budget,
+        refresh=args.refresh,
+        boards=not args.no_boards,
+        emails=not args.no_email,
+        workers=args.workers,
+    )
+
+    ready = sum(line.startswith(("  ✓", "  =")) for line in lines)
+    failed = sum(line.startswith("  ✗") for line in lines)
+    print(f"\nDone: {ready} ready, {failed} failed. "
+          f"Boards stay warm for {ats_sources.BOARD_CACHE_TTL // 3600}h, email patterns for 30 days.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Progress Line
+
+A single self-updating status line on stderr for long sweeps:
+
+    [ 37/150 boards] 212 matches | 4.1 boards/s | 9.0s
+
+While active (use it as a context manager), anything printed to stdout
+appears above the line, so results can be printed as they arrive. The
+line is only drawn when stderr is a terminal; pipes and log files get
+plain output.
+
+    with ProgressLine(len(boards)) as progress:
+        for board in boards:
+            print(results_for(board))
+            progress.update(matched=len(results))
+"""
+
+import sys
+import threading
+import time
+
+
+class ProgressLine:
+    """Units done, matches found and throughput for one sweep."""
+
+    def __init__(self, total: int, unit: str = "boards", stream=None):
+        self.total = total
+        self.unit = unit
+        self.stream = stream or sys.stderr
+        self.enabled = hasattr(self.stream, "isatty") and self.stream.isatty()
+        self.done = 0
+        self.matched = 0
+        self.started = time.monotonic()
+        self.drawn = False
+        self.stdout = None
+        self.lock = threading.RLock()
+
+    def __enter__(self):
+        if self.enabled:
+            self.stdout = sys.stdout
+            sys.stdout = self
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _erase(self):
+        if self.drawn:
+            self.stream.write("\r\033[K")
+            self.stream.flush()
+            self.drawn = False
+
+    def draw(self):
+        # Nothing to show until the first unit finishes (keeps headers clean)
+        if not self.enabled or not self.done:
+            return
+        with self.lock:
+            elapsed = time.monotonic() - self.started
+            rate = self.done / elapsed if elapsed > 0 else 0.0
+            width = len(str(self.total))
+            self._erase()
+            self.stream.write(f"[{self.done:>{width}}/{self.total} {self.unit}] {self.matched} matches"
+                              f" | {rate:.1f} {self.unit}/s | {elapsed:.1f}s")
+            self.stream.flush()
+            self.drawn = True
+
+    # Stands in for sys.stdout while active: output goes above the line
+    def write(self, text: str) -> int:
+        with self.lock:
+            self._erase()
+            self.stdout.write(text)
+            if text.endswith("\n"):
+                self.stdout.flush()
+                self.draw()
+        return len(text)
+
+    def flush(self):
+        if self.stdout is not None:
+            self.stdout.flush()
+
+    def isatty(self) -> bool:
+        return self.stdout is not None and self.stdout.isatty()
+
+    def update(self, matched: int = 0):
+        """Record one finished unit and `matched` new matches."""
+        with self.lock:
+            self.done += 1
+            self.matched += matched
+            self.draw()
+
+    def close(self):
+        """Leave the final status on its own line and restore stdout."""
+        if not self.enabled:
+            return
+        with self.lock:
+            if self.stdout is not None:
+                self.stdout.flush()
+                sys.stdout, self.stdout = self.stdout, None
+            self.draw()
+            self.stream.write("\n")
+            self.stream.flush()
+            self.drawn = False
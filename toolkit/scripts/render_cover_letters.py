@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Batch Cover Letter Renderer
+
+Fills templates/cover_letter.tex for a batch of applications and compiles
+the letters in parallel. Each generated .tex is hashed together with the
+LaTeX engine; if a PDF for that exact source and engine was built before,
+it is reused instead of recompiled.
+
+Applications come from applications/pending/*.json (one application per
+file) or from a history file's "applications" list. Each needs
+"company", "role" and the letter text in "cover_letter" (paragraphs
+separated by blank lines, see templates/history_template.json); entries
+without text are skipped and listed.
+
+Usage:
+    python render_cover_letters.py
+    python render_cover_letters.py --history applications/history.json --jobs 8
+    python render_cover_letters.py --engine tectonic --output-dir applications/letters
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+from local_cache import atomic_write_bytes, cache_path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+TEMPLATE_PATH = REPO_ROOT / "templates" / "cover_letter.tex"
+
+_LATEX_ESCAPES = {
+    "\\": r"\textbackslash{}",
+    "&": r"\&",
+    "%": r"\%",
+    "$": r"\$",
+    "#": r"\#",
+    "_": r"\_",
+    "{": r"\{",
+    "}": r"\}",
+    "~": r"\textasciitilde{}",
+    "^": r"\textasciicircum{}",
+}
+_LATEX_RE = re.compile("|".join(re.escape(c) for c in _LATEX_ESCAPES))
+
+
+def latex_escape(text: str) -> str:
+    """Escape LaTeX special characters in plain text."""
+    return _LATEX_RE.sub(lambda m: _LATEX_ESCAPES[m.group()], text or "")
+
+
+def url_escape(url: str) -> str:
+    """Escape the characters that break \\href arguments."""
+    return (url or "").replace("%", r"\%").replace("#", r"\#")
+
+
+def load_applications(pending_dir: Path = None, history_path: Path = None) -> list[dict]:
+    """Collect applications from a pending directory and/or a history file."""
+    applications = []
+    if pending_dir and pending_dir.is_dir():
+        for path in sorted(pending_dir.glob("*.json")):
+            with open(path) as f:
+                app = json.load(f)
+            app.setdefault("id", path.stem)
+            applications.append(app)
+    if history_path:
+        with open(history_path) as f:
+            applications.extend(json.load(f).get("applications", []))
+    return applications
+
+
+def application_slug(app: dict) -> str:
+    """File-name-safe identifier for an application."""
+    raw = app.get("id") or f"{app.get('company', '')}-{app.get('role', '')}"
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", raw).strip("_") or "letter"
+
+
+def render_letter(template: str, profile: dict, app: dict, letter_date: str) -> str:
+    """Fill the cover letter template for one application."""
+    personal = profile.get("personal", {})
+    loc = personal.get("location", {})
+    location = ", ".join(p for p in (loc.get("city"), loc.get("state")) if p)
+
+    paragraphs = re.split(r"\n\s*\n", app["cover_letter"].strip())
+    body = "\n\n".join(latex_escape(" ".join(p.split())) for p in paragraphs)
+
+    replacements = [
+        ("YOUR_GITHUB_URL", url_escape(personal.get("github"))),
+        ("YOUR_LINKEDIN_URL", url_escape(personal.get("linkedin"))),
+        ("YOUR_NAME", latex_escape(personal.get("name"))),
+        ("YOUR_LOCATION", latex_escape(location)),
+        ("YOUR_EMAIL", latex_escape(personal.get("email"))),
+        ("YOUR_PHONE", latex_escape(personal.get("phone"))),
+        ("ROLE_PLACEHOLDER", latex_escape(app.get("role"))),
+        ("COMPANY_PLACEHOLDER", latex_escape(app.get("company"))),
+        ("BODY_PLACEHOLDER", body),
+        # Pin the date so identical letters hash identically within a day
+        ("\\today", letter_date),
+    ]
+    tex = template
+    for placeholder, value in replacements:
+        tex = tex.replace(placeholder, value)
+    return tex
+
+
+def tex_hash(tex: str, engine: str) -> str:
+    """Content hash of a rendered letter and its engine (the PDF cache key)."""
+    return hashlib.sha256(f"{engine}\0{tex}".encode("utf-8")).hexdigest()
+
+
+def find_engine(preferred: str = None) -> Optional[str]:
+    """Pick a LaTeX engine: the requested one, else tectonic, else pdflatex."""
+    candidates = [preferred] if preferred else ["tectonic", "pdflatex"]
+    for engine in candidates:
+        if shutil.which(engine):
+            return engine
+    return None
+
+
+def compile_tex(tex: str, engine: str, pdf_path: str) -> Optional[str]:
+    """
+    Compile LaTeX source to `pdf_path` (runs in a worker process).
+
+    Returns None on success or an error message.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / "letter.tex"
+        src.write_text(tex, encoding="utf-8")
+        if engine == "tectonic":
+            cmd = ["tectonic", "--chatter", "minimal", str(src)]
+        else:
+            cmd = [engine, "-interaction=nonstopmode", "-halt-on-error", src.name]
+        try:
+            result = subprocess.run(cmd, cwd=tmp, capture_output=True, text=True, timeout=120)
+        except subprocess.TimeoutExpired:
+            return f"{engine} timed out"
+
+        pdf = Path(tmp) / "letter.pdf"
+        if result.returncode != 0 or not pdf.exists():
+            log = (result.stdout + result.stderr).strip().splitlines()
+            return "\n".join(log[-5:]) or f"{engine} exited with {result.returncode}"
+        atomic_write_bytes(Path(pdf_path), pdf.read_bytes())
+    return None
+
+
+def render_batch(
+    applications: list[dict],
+    profile: dict,
+    output_dir: Path,
+    engine: str,
+    jobs: int = None,
+    letter_date: str = None,
+) -> tuple[int, int, list[str], list[str]]:
+    """
+    Render and compile cover letters for a batch of applications.
+
+    Returns (compiled, reused, skipped, errors): `skipped` names the
+    applications without "cover_letter" text.
+    """
+    template = TEMPLATE_PATH.read_text(encoding="utf-8")
+    if letter_date is None:
+        today = date.today()
+        letter_date = f"{today:%B} {today.day}, {today.year}"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Render every letter, then group by source hash so duplicates compile once
+    targets: dict[str, list[Path]] = {}
+    sources: dict[str, str] = {}
+    errors = []
+    skipped = []
+    used_slugs = set()
+    for app in applications:
+        if not app.get("cover_letter"):
+            skipped.append(application_slug(app))
+            continue
+        tex = render_letter(template, profile, app, letter_date)
+        # Two applications to the same company/role get "-2", "-3", ... in input order
+        slug = base = application_slug(app)
+        n = 1
+        while slug in used_slugs:
+            n += 1
+            slug = f"{base}-{n}"
+        used_slugs.add(slug)
+        (output_dir / f"{slug}.tex").write_text(tex, encoding="utf-8")
+        digest = tex_hash(tex, engine)
+        sources[digest] = tex
+        targets.setdefault(digest, []).append(output_dir / f"{slug}.pdf")
+
+    cached_pdf = {digest: cache_path("cover_letters", f"{digest}.pdf") for digest in sources}
+    to_build = [digest for digest in sources if not cached_pdf[digest].exists()]
+    reused = len(sources) - len(to_build)
+
+    compiled = 0
+    if to_build:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {
+                pool.submit(compile_tex, sources[digest], engine, str(cached_pdf[digest])): digest
+                for digest in to_build
+            }
+            for future in as_completed(futures):
+                digest = futures[future]
+                error = future.result()
+                if error:
+                    names = ", ".join(p.stem for p in targets[digest])
+                    errors.append(f"{names}: {error}")
+                else:
+                    compiled += 1
+
+    for digest, paths in targets.items():
+        if cached_pdf[digest].exists():
+            for path in paths:
+                shutil.copyfile(cached_pdf[digest], path)
+
+    return compiled, reused, skipped, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render and compile cover letters in batch")
+    parser.add_argument("--pending", default=str(REPO_ROOT / "applications" / "pending"),
+                        help="Directory of pending application JSON files")
+    parser.add_argument("--history", help="History file whose applications to render instead")
+    parser.add_argument("--profile", default=str(REPO_ROOT / "profile.json"), help="Path to profile.json")
+    parser.add_argument("--output-dir", "-o", default=str(REPO_ROOT / "applications" / "cover_letters"),
+                        help="Where to write .tex and .pdf files")
+    parser.add_argument("--engine", choices=["tectonic", "pdflatex", "xelatex", "lualatex"],
+                        help="LaTeX engine (default: tectonic if installed, else pdflatex)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count(),
+                        help="Parallel LaTeX builds (default: CPU count)")
+
+    args = parser.parse_args()
+
+    engine = find_engine(args.engine)
+    if not engine:
+        print(f"No LaTeX engine found ({args.engine or 'tectonic or pdflatex'}).")
+        print("Install tectonic (https://tectonic-typesetting.github.io/) or TeX Live.")
+        sys.exit(1)
+
+    with open(args.profile) as f:
+        profile = json.load(f)
+
+    if args.history:
+        applications = load_applications(history_path=Path(args.history))
+    else:
+        applications = load_applications(pending_dir=Path(args.pending))
+    if not applications:
+        print("No applications to render.")
+        return
+
+    compiled, reused, skipped, errors = render_batch(
+        applications, profile, Path(args.output_dir), engine, jobs=args.jobs,
+    )
+
+    for error in errors:
+        print(f"  ✗ {error}")
+    if skipped:
+        print(f"  Skipped (no cover_letter text): {', '.join(skipped)}")
+    print(f"\n{compiled} compiled, {reused} unchanged (reused cached PDF), "
+          f"{len(skipped)} skipped, {len(errors)} failed")
+    if skipped and not compiled + reused + len(errors):
+        print('Nothing to render: add the letter text to each application as "cover_letter" '
+              "(see templates/history_template.json).")
+        return
+    print(f"Output: {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Salary Parsing
+
+Backfills missing salaries from posting descriptions. Shared by
+job_search.py (JobSpy results) and analyze.py (the archived corpus), and
+needs only pandas, so offline analysis works without JobSpy installed.
+"""
+
+import re
+
+import pandas as pd
+
+# "$150,000 - $200,000 per year", "$150k-$200k", "$55 to $70/hr", "$120K+"
+# `context` captures salary wording shortly before the amount (no other $ in
+# between); amounts scaled by M/B ("raised $40M") are captured so they can be
+# rejected.
+_AMOUNT = r'\d{1,3}(?:,\d{3})+|\d+(?:\.\d+)?'
+_SCALE = r'\s*(?:[mMbB]{1,2}\b|(?i:million|billion)\b)'
+_SALARY_CONTEXT = r'salary|compensation|pay range|base pay|pay rate|\bwage'
+_SALARY_RE = re.compile(
+    r'(?=[$sScCpPbBwW])'  # Cheap first-character check before the alternatives
+    rf'(?P<context>(?i:{_SALARY_CONTEXT})[^$]{{0,60}})?'
+    rf'\$\s?(?P<lo>{_AMOUNT})\s*(?P<lo_k>[kK])?(?P<lo_scale>{_SCALE})?'
+    rf'(?:\s*(?:-|–|—|to)\s*\$?\s?(?P<hi>{_AMOUNT})\s*(?P<hi_k>[kK])?(?P<hi_scale>{_SCALE})?)?'
+    r'(?:\s*(?:/|per|an|a)\s*(?P<unit>hour|hr|year|yr|annum|month|mo|week|wk)\b'
+    r'|\s*(?P<annual>annually|hourly|monthly|weekly)\b)?'
+)
+
+# Multipliers from a posted interval to an annual amount
+_ANNUALIZE = {"hourly": 2080, "weekly": 52, "monthly": 12, "yearly": 1}
+_UNIT_INTERVALS = {
+    "hour": "hourly", "hr": "hourly", "hourly": "hourly",
+    "week": "weekly", "wk": "weekly", "weekly": "weekly",
+    "month": "monthly", "mo": "monthly", "monthly": "monthly",
+    "year": "yearly", "yr": "yearly", "annum": "yearly", "annually": "yearly",
+}
+
+
+def backfill_salaries(jobs: pd.DataFrame) -> pd.DataFrame:
+    """
+    Fill in min_amount/max_amount/interval from descriptions where missing.
+
+    Parses every description lacking a salary in one vectorized pass,
+    expands k-notation, annualizes hourly/weekly/monthly pay and discards
+    implausible amounts. Of several $ amounts, the first one next to
+    salary wording wins; funding-style amounts ("$40M") are skipped, and
+    pay is only treated as hourly/weekly/monthly when the posting says so.
+    Adds a `salary_confidence` column: 1.0 for
+    salaries the job board provided, 0.3-0.9 for parsed ones (higher for
+    ranges, explicit intervals and salary wording nearby), NaN if none.
+    """
+    if jobs.empty or 'description' not in jobs.columns:
+        return jobs
+
+    jobs = jobs.copy()
+    for col in ('min_amount', 'max_amount'):
+        if col not in jobs.columns:
+            jobs[col] = float('nan')
+        jobs[col] = pd.to_numeric(jobs[col], errors='coerce')
+    if 'interval' not in jobs.columns:
+        jobs['interval'] = None
+    # An all-empty column (e.g. one site's cached results) reads back as float
+    jobs['interval'] = jobs['interval'].astype(object)
+
+    listed = jobs['min_amount'].notna() | jobs['max_amount'].notna()
+    jobs['salary_confidence'] = listed.astype(float).where(listed)
+
+    missing = ~listed & jobs['description'].notna()
+    if not missing.any():
+        return jobs
+
+    desc = jobs.loc[missing, 'description'].astype(str)
+    # One row per $ amount, indexed by (job, match number)
+    found = desc.str.extractall(_SALARY_RE)
+    if found.empty:
+        return jobs
+
+    lo = pd.to_numeric(found['lo'].str.replace(',', '', regex=False), errors='coerce')
+    hi = pd.to_numeric(found['hi'].str.replace(',', '', regex=False), errors='coerce')
+    hi_k = found['hi_k'].notna()
+    # "$150-200k": the k on the upper bound applies to both
+    lo_k = found['lo_k'].notna() | (hi_k & (lo < 1000))
+    lo = lo.where(~lo_k, lo * 1000)
+    hi = hi.where(~hi_k, hi * 1000)
+
+    unit = found['unit'].fillna(found['annual']).str.lower()
+    interval = unit.map(_UNIT_INTERVALS)
+    # No stated interval: only amounts that can't be anything but a year's pay
+    interval = interval.where(interval.notna() | (lo < 20000), 'yearly')
+
+    factor = interval.map(_ANNUALIZE)
+    lo_annual = lo * factor
+    hi_annual = hi * factor
+    scaled = found['lo_scale'].notna() | found['hi_scale'].notna()
+    plausible = (lo_annual.between(20000, 2_000_000) & (hi_annual.isna() | (hi_annual >= lo_annual))
+                 & ~scaled)
+    if not plausible.any():
+        return jobs
+
+    near_wording = found['context'].notna()
+    confidence = 0.3 + 0.2 * hi.notna() + 0.2 * unit.notna() + 0.2 * near_wording
+
+    # Per job: the first amount next to salary wording, else the first plausible one
+    candidates = pd.DataFrame({
+        'min_amount': lo_annual.round(),
+        'max_amount': hi_annual.round(),
+        'salary_confidence': confidence,
+        'rank': (~near_wording).astype(int),
+    })[plausible]
+    best = candidates.sort_values('rank', kind='stable').groupby(level=0).head(1).droplevel(1)
+
+    jobs.loc[best.index, 'min_amount'] = best['min_amount']
+    jobs.loc[best.index, 'max_amount'] = best['max_amount']
+    jobs.loc[best.index, 'interval'] = 'yearly'  # Amounts are annualized, like enforce_annual_salary
+    jobs.loc[best.index, 'salary_confidence'] = best['salary_confidence']
+
+    return jobs
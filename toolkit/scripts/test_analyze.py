@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Test suite for analyze.py
+
+Grouping and salary percentiles on small hand-built frames; no archive
+or network needed.
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+import pandas as pd
+
+from analyze import add_dimensions, load_result_file, salary_table
+
+# ============================================================
+# TESTS
+# ============================================================
+
+def test_add_dimensions():
+    """Titles map to families, locations to canonical metros, ranges to midpoints."""
+    print("\n" + "=" * 60)
+    print("Title Families and Metros")
+    print("=" * 60)
+
+    corpus = add_dimensions(pd.DataFrame({
+        "title": ["Senior Machine Learning Engineer", "Research Engineer", "Data Scientist",
+                  "Software Engineer II", "Account Executive", "Chef"],
+        "location": ["San Francisco, CA", "Oakland, CA", "Remote - US", "New York, NY", "Atlantis", ""],
+        "min_salary": [200000, 150000, np.nan, 100000, np.nan, np.nan],
+        "max_salary": [300000, np.nan, 180000, 140000, np.nan, np.nan],
+    }))
+
+    checks = [
+        ("title families", corpus["title_family"].tolist() == [
+            "ML / AI Engineer", "Research Scientist", "Data Scientist",
+            "Software Engineer", "Sales / GTM", "Other"]),
+        ("canonical metros", corpus["metro"].tolist() == [
+            "SF Bay Area", "SF Bay Area", "Remote (US)", "New York", "Atlantis", "Unknown"]),
+        ("salary midpoints", corpus["salary"].tolist()[:4] == [250000, 150000, 180000, 120000]
+         and corpus["salary"].iloc[4:].isna().all()),
+    ]
+
+    passed = 0
+    for name, ok in checks:
+        passed += ok
+        print(f"  {'✓' if ok else '✗'} {name}")
+
+    print(f"\n  Passed: {passed}/{len(checks)}")
+    assert passed == len(checks)
+    return passed == len(checks)
+
+
+def test_salary_table():
+    """Percentiles per group, groups with too few salaries dropped, highest median first."""
+    print("\n" + "=" * 60)
+    print("Salary Table")
+    print("=" * 60)
+
+    rows = ([("ML Engineer", s) for s in (150000, 175000, 200000, 225000, 250000)]
+            + [("Software Engineer", s) for s in (100000, 120000, 140000)]
+            + [("Software Engineer", np.nan)] * 2
+            + [("Data Scientist", 300000)])  # Too few salaries for min_count=3
+    corpus = add_dimensions(pd.DataFrame({
+        "title": [title for title, _ in rows],
+        "location": ["Remote"] * len(rows),
+        "min_salary": [salary for _, salary in rows],
+        "max_salary": [salary for _, salary in rows],
+    }))
+    table = salary_table(corpus, "title_family", min_count=3)
+
+    checks = [
+        ("groups by median, sparse dropped", table.index.tolist() == ["ML / AI Engineer", "Software Engineer"]),
+        ("postings and salary counts", table["postings"].tolist() == [5, 5]
+         and table["with_salary"].tolist() == [5, 3]),
+        ("percentiles", table.loc["ML / AI Engineer", ["p10", "p50", "p90"]].tolist() == [160000, 200000, 240000]),
+    ]
+
+    passed = 0
+    for name, ok in checks:
+        passed += ok
+        print(f"  {'✓' if ok else '✗'} {name}")
+
+    print(f"\n  Passed: {passed}/{len(checks)}")
+    assert passed == len(checks)
+    return passed == len(checks)
+
+
+def test_result_file_salaries():
+    """Salaries only stated in a saved job's description are backfilled."""
+    print("\n" + "=" * 60)
+    print("Result File Backfill")
+    print("=" * 60)
+
+    jobs = [
+        {"id": 1, "title": "Research Engineer", "absolute_url": "https://example.com/1",
+         "location": {"name": "San Francisco, CA"}, "_company": "example",
+         "content": "&lt;p&gt;We raised $40M. Salary: $180,000 - $220,000.&lt;/p&gt;"},
+        {"id": 2, "title": "Recruiter", "absolute_url": "https://example.com/2",
+         "location": {"name": "Remote"}, "_company": "example", "content": "&lt;p&gt;No numbers.&lt;/p&gt;"},
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "matches.json"
+        path.write_text(json.dumps(jobs))
+        frame = load_result_file(str(path))
+
+    got = [(None if pd.isna(lo) else int(lo), None if pd.isna(hi) else int(hi))
+           for lo, hi in zip(frame["min_salary"], frame["max_salary"])]
+    ok = got == [(180000, 220000), (None, None)] and frame["company"].tolist() == ["example", "example"]
+    print(f"  {'✓' if ok else '✗'} salaries: {got}")
+    assert ok
+    return ok
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("\n" + "#" * 60)
+    print("# Analytics Test Suite - Salary Tables")
+    print("#" * 60)
+
+    results = []
+    for name, test in [
+        ("Title Families and Metros", test_add_dimensions),
+        ("Salary Table", test_salary_table),
+        ("Result File Backfill", test_result_file_salaries),
+    ]:
+        try:
+            results.append((name, test()))
+        except AssertionError:
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print("=" * 60)
+
+    all_passed = True
+    for name, passed in results:
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"  {status}: {name}")
+        if not passed:
+            all_passed = False
+
+    print()
+    return all_passed
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
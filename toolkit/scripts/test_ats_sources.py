@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Test suite for ats_sources.py
+
+Parses local fixture payloads (trimmed copies of real public board
+responses), so no network access is needed.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import ats_sources
+from ats_sources import ADAPTERS, board_key, rate_limited_get, split_spec
+from greenhouse_search import extract_salary_from_description, filter_jobs, format_job, job_text
+
+# ============================================================
+# FIXTURES
+# ============================================================
+
+GREENHOUSE_PAYLOAD = {
+    "jobs": [
+        {
+            "id": 4012345,
+            "title": "Research Engineer, Interpretability",
+            "absolute_url": "https://job-boards.greenhouse.io/anthropic/jobs/4012345",
+            "location": {"name": "San Francisco, CA"},
+            "departments": [{"id": 1, "name": "Research"}],
+            "updated_at": "2026-01-20T12:00:00-05:00",
+            "content": "&lt;p&gt;The expected salary range is $315,000 - $560,000 USD.&lt;/p&gt;",
+        }
+    ],
+    "meta": {"total": 1},
+}
+
+LEVER_PAYLOAD = [
+    {
+        "id": "8f2c1d3e-0000-4000-8000-000000000001",
+        "text": "Forward Deployed Software Engineer",
+        "hostedUrl": "https://jobs.lever.co/palantir/8f2c1d3e-0000-4000-8000-000000000001",
+        "createdAt": 1768953600000,
+        "categories": {
+            "commitment": "Full-time",
+            "department": "Business Development",
+            "team": "Dev",
+            "location": "New York, NY",
+            "allLocations": ["New York, NY", "Washington, D.C."],
+        },
+        "description": "<div>Work with customers on their hardest problems.</div>",
+        "lists": [{"text": "Requirements", "content": "<li>Python or Java</li>"}],
+        "additional": "<div>We offer great benefits.</div>",
+        "salaryRange": {"min": 135000, "max": 200000, "currency": "USD", "interval": "per-year-salary"},
+    },
+    {
+        "id": "8f2c1d3e-0000-4000-8000-000000000002",
+        "text": "Warehouse Associate",
+        "hostedUrl": "https://jobs.lever.co/palantir/8f2c1d3e-0000-4000-8000-000000000002",
+        "createdAt": 1768953600000,
+        "categories": {"location": "Denver, CO"},
+        "description": "<div>Hourly role.</div>",
+        "salaryRange": {"min": 25, "max": 30, "currency": "USD", "interval": "per-hour-wage"},
+    },
+]
+
+ASHBY_PAYLOAD = {
+    "apiVersion": "1",
+    "jobs": [
+        {
+            "id": "1b6d2f4a-0000-4000-8000-000000000001",
+            "title": "Senior Product Engineer",
+            "department": "Engineering",
+            "team": "Product",
+            "employmentType": "FullTime",
+            "location": "San Francisco",
+            "secondaryLocations": [{"location": "New York"}],
+            "isRemote": True,
+            "isListed": True,
+            "publishedAt": "2026-01-19T18:02:54.874+00:00",
+            "jobUrl": "https://jobs.ashbyhq.com/linear/1b6d2f4a-0000-4000-8000-000000000001",
+            "descriptionHtml": "<p>Build the product.</p>",
+            "compensation": {"scrapeableCompensationSalarySummary": "$180K - $240K"},
+        },
+        {
+            "id": "1b6d2f4a-0000-4000-8000-000000000002",
+            "title": "Unlisted Role",
+            "isListed": False,
+            "location": "Remote",
+        },
+    ],
+}
+
+
+def _payload(data) -> bytes:
+    return json.dumps(data).encode("utf-8")
+
+
+# ============================================================
+# TESTS
+# ============================================================
+
+def test_normalized_schema():
+    """Every adapter yields jobs with the Greenhouse fields filters rely on."""
+    print("\n" + "=" * 60)
+    print("Normalized Job Schema")
+    print("=" * 60)
+
+    fixtures = [
+        ("greenhouse", GREENHOUSE_PAYLOAD, 1),
+        ("lever", LEVER_PAYLOAD, 2),
+        ("ashby", ASHBY_PAYLOAD, 1),  # Unlisted job dropped
+    ]
+    required = ["id", "title", "absolute_url", "location", "departments", "updated_at", "content"]
+
+    passed = 0
+    for source, payload, expected_count in fixtures:
+        jobs = ADAPTERS[source].parse(_payload(payload))["jobs"]
+        missing = [field for job in jobs for field in required if field not in job]
+        ok = len(jobs) == expected_count and not missing and all("name" in job["location"] for job in jobs)
+        passed += ok
+        status = "✓" if ok else "✗"
+        print(f"  {status} {source}: {len(jobs)} jobs" + (f", missing {missing}" if missing else ""))
+
+    print(f"\n  Passed: {passed}/{len(fixtures)}")
+    assert passed == len(fixtures)
+    return passed == len(fixtures)
+
+
+def test_field_mapping():
+    """Source-specific fields land where filter_jobs and format_job look."""
+    print("\n" + "=" * 60)
+    print("Field Mapping")
+    print("=" * 60)
+
+    lever = ADAPTERS["lever"].parse(_payload(LEVER_PAYLOAD))["jobs"]
+    ashby = ADAPTERS["ashby"].parse(_payload(ASHBY_PAYLOAD))["jobs"]
+
+    checks = [
+        ("lever title", lever[0]["title"], "Forward Deployed Software Engineer"),
+        ("lever locations", lever[0]["location"]["name"], "New York, NY; Washington, D.C."),
+        ("lever department", lever[0]["departments"], [{"name": "Business Development"}]),
+        ("lever updated_at", lever[0]["updated_at"], "2026-01-21T00:00:00+00:00"),
+        ("lever salary", extract_salary_from_description(job_text(lever[0])), (135000, 200000)),
+        ("lever hourly salary skipped", extract_salary_from_description(job_text(lever[1])), (None, None)),
+        ("lever requirements kept", "Python or Java" in job_text(lever[0]), True),
+        ("ashby location", ashby[0]["location"]["name"], "San Francisco; New York; Remote"),
+        ("ashby department", ashby[0]["departments"], [{"name": "Engineering"}]),
+        ("ashby salary", extract_salary_from_description(job_text(ashby[0])), (180000, 240000)),
+        ("ashby url", ashby[0]["absolute_url"].startswith("https://jobs.ashbyhq.com/linear/"), True),
+    ]
+
+    passed = 0
+    for name, got, expected in checks:
+        ok = got == expected
+        passed += ok
+        print(f"  {'✓' if ok else '✗'} {name}: {got!r}" + ("" if ok else f" (expected {expected!r})"))
+
+    print(f"\n  Passed: {passed}/{len(checks)}")
+    assert passed == len(checks)
+    return passed == len(checks)
+
+
+def test_shared_filters():
+    """The Greenhouse filters and formatter work on every source."""
+    print("\n" + "=" * 60)
+    print("Shared Filters")
+    print("=" * 60)
+
+    jobs = []
+    for source, payload in [("greenhouse", GREENHOUSE_PAYLOAD), ("lever", LEVER_PAYLOAD),
+                            ("ashby", ASHBY_PAYLOAD)]:
+        jobs.extend(ADAPTERS[source].parse(_payload(payload))["jobs"])
+
+    checks = [
+        ("keyword", [j["title"] for j in filter_jobs(jobs, keyword="engineer")],
+         ["Research Engineer, Interpretability", "Forward Deployed Software Engineer",
+          "Senior Product Engineer"]),
+        ("location", [j["title"] for j in filter_jobs(jobs, location="New York")],
+         ["Forward Deployed Software Engineer", "Senior Product Engineer"]),
+        ("min salary", [j["title"] for j in filter_jobs(jobs, keyword="engineer", min_salary=150000)],
+         ["Research Engineer, Interpretability", "Senior Product Engineer"]),
+        ("format label", format_job(jobs[-1], "linear").splitlines()[1], "[ASHBY] Senior Product Engineer"),
+    ]
+
+    passed = 0
+    for name, got, expected in checks:
+        ok = got == expected
+        passed += ok
+        print(f"  {'✓' if ok else '✗'} {name}: {got!r}" + ("" if ok else f" (expected {expected!r})"))
+
+    print(f"\n  Passed: {passed}/{len(checks)}")
+    assert passed == len(checks)
+    return passed == len(checks)
+
+
+def test_board_specs():
+    """Source prefixes pick the adapter; bare names stay on Greenhouse."""
+    print("\n" + "=" * 60)
+    print("Board Specs")
+    print("=" * 60)
+
+    checks = [
+        ("anthropic", "greenhouse", "anthropic", "anthropic"),
+        ("lever:palantir", "lever", "palantir", "lever:palantir"),
+        ("ashby:Linear", "ashby", "Linear", "ashby:Linear"),
+        ("unknown:thing", "greenhouse", "unknown:thing", "unknown:thing"),
+    ]
+
+    passed = 0
+    for spec, source, token, key in checks:
+        adapter, name = split_spec(spec)
+        ok = adapter.name == source and name == token and board_key(adapter, name) == key
+        passed += ok
+        print(f"  {'✓' if ok else '✗'} {spec} -> {adapter.name}:{name}")
+
+    print(f"\n  Passed: {passed}/{len(checks)}")
+    assert passed == len(checks)
+    return passed == len(checks)
+
+
+def test_retry_releases_connections():
+    """Each 429 response is closed before the retry, so pooled connections aren't leaked."""
+    print("\n" + "=" * 60)
+    print("Rate Limit Retries")
+    print("=" * 60)
+
+    responses = []
+
+    class Response:
+        def __init__(self, status_code):
+            self.status_code = status_code
+            self.headers = {"Retry-After": "2"}
+            self.closed = False
+
+        def close(self):
+            self.closed = True
+
+    def get(url, **kwargs):
+        responses.append(Response(429 if len(responses) < 2 else 200))
+        return responses[-1]
+
+    sleeps = []
+    real_get, real_sleep = ats_sources.requests.get, ats_sources.time.sleep
+    ats_sources.requests.get, ats_sources.time.sleep = get, sleeps.append
+    try:
+        final = rate_limited_get("https://boards-api.example.com/v1/boards/acme/jobs", stream=True)
+    finally:
+        ats_sources.requests.get, ats_sources.time.sleep = real_get, real_sleep
+
+    checks = [
+        ("retried until success", final is responses[-1] and final.status_code == 200 and len(responses) == 3),
+        ("429 responses closed before waiting", [r.closed for r in responses] == [True, True, False]),
+        ("Retry-After honored", sleeps == [2.0, 2.0]),
+    ]
+
+    passed = 0
+    for name, ok in checks:
+        passed += ok
+        print(f"  {'✓' if ok else '✗'} {name}")
+
+    print(f"\n  Passed: {passed}/{len(checks)}")
+    assert passed == len(checks)
+    return passed == len(checks)
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("\n" + "#" * 60)
+    print("# ATS Source Adapter Test Suite - Fixture Payloads")
+    print("#" * 60)
+
+    results = []
+    for name, test in [
+        ("Normalized Schema", test_normalized_schema),
+        ("Field Mapping", test_field_mapping),
+        ("Shared Filters", test_shared_filters),
+        ("Board Specs", test_board_specs),
+        ("Rate Limit Retries", test_retry_releases_connections),
+    ]:
+        try:
+            results.append((name, test()))
+        except AssertionError:
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print("=" * 60)
+
+    all_passed = True
+    for name, passed in results:
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"  {status}: {name}")
+        if not passed:
+            all_passed = False
+
+    print()
+    return all_passed
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Test suite for checkpoints.py
+
+Interrupted and resumed sweeps, against canned Greenhouse boards and a
+stand-in JobSpy scraper in a temporary cache directory; no network
+access needed.
+"""
+
+import json
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import pandas as pd
+
+import ats_sources
+import checkpoints
+import job_search
+import local_cache
+import payload_archive
+from checkpoints import SweepCheckpoint
+from greenhouse_search import resume_stream_output, stream_search_companies
+from job_search import iter_site_results
+
+BOARDS = {
+    token: {"jobs": [
+        {"id": n * 10 + i, "title": f"Research Engineer {i}", "absolute_url": f"https://example.com/{token}/{i}",
+         "location": {"name": "Remote"}, "departments": [], "content": "&lt;p&gt;Research.&lt;/p&gt;"}
+        for i in range(2)
+    ]}
+    for n, token in enumerate(["alpha", "beta", "gamma"], start=1)
+}
+
+
+@contextmanager
+def temp_cache():
+    """Point checkpoints and caches at a fresh temporary directory (archive off)."""
+    saved = (local_cache.CACHE_DIR, checkpoints.CACHE_DIR, payload_archive.ENABLED)
+    with tempfile.TemporaryDirectory() as tmp:
+        local_cache.CACHE_DIR = checkpoints.CACHE_DIR = Path(tmp)
+        payload_archive.ENABLED = False
+        try:
+            yield Path(tmp)
+        finally:
+            local_cache.CACHE_DIR, checkpoints.CACHE_DIR, payload_archive.ENABLED = saved
+
+
+@contextmanager
+def fake_boards(fail_on: str = None):
+    """Serve BOARDS over a stand-in rate_limited_get; `fail_on` interrupts at that board."""
+    fetched = []
+
+    class Response:
+        def __init__(self, raw):
+            self.raw = raw
+            self.status_code = 200
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            pass
+
+        def raise_for_status(self):
+            pass
+
+        def iter_content(self, chunk_size):
+            for i in range(0, len(self.raw), 16):
+                yield self.raw[i:i + 16]
+
+    def get(url, **kwargs):
+        token = url.split("/boards/")[1].split("/")[0]
+        if token == fail_on:
+            raise KeyboardInterrupt
+        fetched.append(token)
+        return Response(json.dumps(BOARDS[token]).encode("utf-8"))
+
+    real_get = ats_sources.rate_limited_get
+    ats_sources.rate_limited_get = get
+    try:
+        yield fetched
+    finally:
+        ats_sources.rate_limited_get = real_get
+
+
+def stream(path: Path, checkpoint: SweepCheckpoint, resume: bool = False) -> int:
+    output_file = resume_stream_output(str(path), checkpoint) if resume else open(path, "w")
+    with output_file:
+        return stream_search_companies(list(BOARDS), keyword="research",
+                                       output_file=output_file, checkpoint=checkpoint)
+
+
+def _report(checks: list) -> bool:
+    passed = 0
+    for name, ok in checks:
+        passed += ok
+        print(f"  {'✓' if ok else '✗'} {name}")
+    print(f"\n  Passed: {passed}/{len(checks)}")
+    assert passed == len(checks)
+    return passed == len(checks)
+
+
+# ============================================================
+# TESTS
+# ============================================================
+
+def test_stream_resume():
+    """An interrupted --stream sweep resumes without refetching or duplicating."""
+    print("\n" + "=" * 60)
+    print("Streamed Sweep Resume")
+    print("=" * 60)
+
+    with temp_cache() as tmp:
+        with fake_boards():
+            stream(tmp / "clean.ndjson", SweepCheckpoint("greenhouse", {"run": "clean"}))
+        clean = (tmp / "clean.ndjson").read_text()
+
+        path = tmp / "matches.ndjson"
+        checkpoint = SweepCheckpoint("greenhouse", {"run": "interrupted"})
+        with fake_boards(fail_on="gamma") as fetched:
+            try:
+                stream(path, checkpoint)
+                interrupted = False
+            except KeyboardInterrupt:
+                interrupted = True
+        first_run = list(fetched)
+        finished = sorted(unit for unit, _ in checkpoint.completed())
+
+        # A crash mid-board leaves a partial line behind
+        with open(path, "a") as f:
+            f.write('{"id": 30, "title": "Research Eng')
+
+        with fake_boards() as fetched:
+            total = stream(path, checkpoint, resume=True)
+        resumed = path.read_text()
+
+    return _report([
+        ("interrupted at the third board", interrupted and first_run == ["alpha", "beta"]),
+        ("finished boards checkpointed", finished == ["alpha", "beta"]),
+        ("resume fetches only the unfinished board", fetched == ["gamma"]),
+        ("restored matches counted", total == 6),
+        ("partial line truncated, nothing duplicated", resumed == clean and len(clean.splitlines()) == 6),
+    ])
+
+
+def test_truncate_to_checkpoint():
+    """resume_stream_output cuts the file back to the last recorded offset."""
+    print("\n" + "=" * 60)
+    print("Output Truncation")
+    print("=" * 60)
+
+    with temp_cache() as tmp:
+        path = tmp / "out.ndjson"
+        path.write_text('{"id": 1}\n{"id": 2}\n{"id": 3, "tit')
+        checkpoint = SweepCheckpoint("greenhouse", {"run": "truncate"})
+        checkpoint.save("alpha", {"matched": 1, "offset": len('{"id": 1}\n')})
+        checkpoint.save("beta", {"matched": 1, "offset": len('{"id": 1}\n{"id": 2}\n')})
+        with resume_stream_output(str(path), checkpoint) as f:
+            f.write('{"id": 3}\n')
+        appended = path.read_text()
+
+        fresh = SweepCheckpoint("greenhouse", {"run": "fresh"})
+        path.write_text('{"id": 9, "partial')
+        with resume_stream_output(str(path), fresh):
+            pass
+        emptied = path.read_text()
+
+        missing = tmp / "missing.ndjson"
+        with resume_stream_output(str(missing), checkpoint) as f:
+            f.write("x")
+        created = missing.read_text()
+
+    return _report([
+        ("truncated to the furthest offset, then appended",
+         appended == '{"id": 1}\n{"id": 2}\n{"id": 3}\n'),
+        ("no finished boards: file emptied", emptied == ""),
+        ("missing file created", created == "x"),
+    ])
+
+
+def test_parameters_invalidate():
+    """A checkpoint only applies to a sweep with the same parameters."""
+    print("\n" + "=" * 60)
+    print("Checkpoint Parameters")
+    print("=" * 60)
+
+    with temp_cache() as tmp:
+        params = {"keyword": "research", "location": None}
+        SweepCheckpoint("greenhouse", params).save("alpha", {"matched": 2, "offset": 10})
+
+        # Key order doesn't matter; any changed value or sweep kind does
+        same = SweepCheckpoint("greenhouse", dict(reversed(list(params.items())))).load("alpha")
+        other = SweepCheckpoint("greenhouse", dict(params, keyword="recruiter"))
+        other_before = other.load("alpha")
+        other_kind = list(SweepCheckpoint("jobspy", params).completed())
+
+        with fake_boards() as fetched:
+            with open(tmp / "other.ndjson", "w") as f:
+                stream_search_companies(["alpha"], keyword="recruiter", output_file=f, checkpoint=other)
+
+        cleared = SweepCheckpoint("greenhouse", params)
+        cleared.clear()
+        after_clear = list(cleared.completed())
+
+    return _report([
+        ("same parameters resume", same == {"matched": 2, "offset": 10}),
+        ("changed filter starts fresh", other_before is None),
+        ("changed filter refetches", fetched == ["alpha"]),
+        ("other sweep kind starts fresh", other_kind == []),
+        ("clear forgets finished units", after_clear == []),
+    ])
+
+
+def test_site_resume():
+    """An interrupted job_search resumes from the sites that finished."""
+    print("\n" + "=" * 60)
+    print("JobSpy Site Resume")
+    print("=" * 60)
+
+    scraped = []
+
+    def scrape_jobs(site_name, **kwargs):
+        site = site_name[0]
+        if site == "linkedin" and not scraped_ok[0]:
+            raise KeyboardInterrupt
+        scraped.append(site)
+        return pd.DataFrame({"site": [site], "title": [f"ML Engineer ({site})"],
+                             "job_url": [f"https://example.com/{site}"], "min_amount": [None]})
+
+    scraped_ok = [False]
+    real_scrape = job_search.scrape_jobs
+    job_search.scrape_jobs = scrape_jobs
+    try:
+        with temp_cache():
+            checkpoint = SweepCheckpoint("jobspy", {"search_term": "ML engineer"})
+            results = {}
+            try:
+                # One site at a time, so the interrupt lands after indeed finished
+                for site in ["indeed", "linkedin"]:
+                    for name, frame in iter_site_results("ML engineer", sites=[site], checkpoint=checkpoint):
+                        results[name] = frame
+                interrupted = False
+            except KeyboardInterrupt:
+                interrupted = True
+
+            scraped_ok[0] = True
+            first = list(scraped)
+            resumed = dict(iter_site_results("ML engineer", sites=["indeed", "linkedin"],
+                                             refresh=True, checkpoint=checkpoint))
+    finally:
+        job_search.scrape_jobs = real_scrape
+
+    return _report([
+        ("interrupted after the first site", interrupted and first == ["indeed"] and list(results) == ["indeed"]),
+        ("resume scrapes only the unfinished site", scraped == ["indeed", "linkedin"]),
+        ("checkpointed site restored", resumed["indeed"]["title"].tolist() == ["ML Engineer (indeed)"]),
+        ("both sites returned", sorted(resumed) == ["indeed", "linkedin"]),
+    ])
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("\n" + "#" * 60)
+    print("# Checkpoint Test Suite - Resumable Sweeps")
+    print("#" * 60)
+
+    results = []
+    for name, test in [
+        ("Streamed Sweep Resume", test_stream_resume),
+        ("Output Truncation", test_truncate_to_checkpoint),
+        ("Checkpoint Parameters", test_parameters_invalidate),
+        ("JobSpy Site Resume", test_site_resume),
+    ]:
+        try:
+            results.append((name, test()))
+        except AssertionError:
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print("=" * 60)
+
+    all_passed = True
+    for name, passed in results:
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"  {status}: {name}")
+        if not passed:
+            all_passed = False
+
+    print()
+    return all_passed
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Test suite for greenhouse_search.py
+
+Incremental parsing of streamed board responses, and department/office
+index filtering. Responses are fed in as hand-split chunks or served by
+a stand-in API in a temporary cache directory, so no network access is
+needed.
+"""
+
+import json
+import sys
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import ats_sources
+import local_cache
+import payload_archive
+from greenhouse_search import (iter_greenhouse_jobs, iter_json_array, load_archived_jobs,
+                               search_companies, select_job_ids)
+
+BOARD = {
+    "jobs": [
+        {"id": 1, "title": "Research Engineer", "location": {"name": "San Francisco, CA"}},
+        {"id": 2, "title": "Ingénieur ML — Zürich 🚀", "location": {"name": "Zürich"}},
+        {"id": 3, "title": "Engineer, \"jobs\" [platform]", "location": {"name": "Remote"}},
+    ],
+    "meta": {"total": 3},
+}
+
+
+def _split(text: str, size: int) -> list:
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+# Board with nested departments (Engineering > Infrastructure > Compilers,
+# Engineering > ML Research) and offices (San Francisco > SoMa). Jobs list
+# only their own department, as Greenhouse does.
+INDEXED_JOBS = [
+    (1, "Software Engineer", "Engineering", "San Francisco, CA", 10),
+    (2, "SRE", "Infrastructure", "New York, NY", 12),
+    (3, "Research Scientist", "ML Research", "New York, NY", 12),
+    (4, "Account Executive", "Sales", "San Francisco, CA", 11),
+    (5, "Recruiter", "People", "San Francisco, CA", 12),
+    (6, "Compiler Engineer", "Compilers", "New York, NY", 12),
+]
+DEPARTMENTS = [
+    (100, "Engineering", None, [101, 102]),
+    (101, "Infrastructure", 100, [103]),
+    (102, "ML Research", 100, []),
+    (103, "Compilers", 101, []),
+    (104, "Sales", None, []),
+    (105, "People", None, []),
+]
+OFFICES = [
+    (10, "San Francisco", "San Francisco, CA", None, [11]),
+    (11, "SoMa", "", 10, []),
+    (12, "New York", "New York, NY", None, []),
+]
+
+
+def _indexed_job(job_id: int, content: bool = True) -> dict:
+    _, title, department, location, _ = INDEXED_JOBS[job_id - 1]
+    job = {"id": job_id, "title": title, "absolute_url": f"https://example.com/{job_id}",
+           "location": {"name": location}, "departments": [{"name": department}],
+           "updated_at": "2026-10-18T12:00:00Z"}
+    if content:
+        job["content"] = f"&lt;p&gt;{title} role.&lt;/p&gt;"
+    return job
+
+
+def _indexed_api(url: str, params: dict = None) -> tuple[int, dict]:
+    """Stand-in boards-api.greenhouse.io: (status, payload) for a board URL."""
+    path = url.split("/boards/acme")[-1] if "/boards/acme" in url else None
+
+    def stub(job_id: int) -> dict:
+        return {k: v for k, v in _indexed_job(job_id, content=False).items() if k != "departments"}
+
+    if path == "/jobs":
+        content = (params or {}).get("content") == "true"
+        return 200, {"jobs": [_indexed_job(job[0], content) for job in INDEXED_JOBS], "meta": {"total": 6}}
+    if path == "/departments":
+        return 200, {"departments": [
+            {"id": dept_id, "name": name, "parent_id": parent, "child_ids": children,
+             "jobs": [stub(job[0]) for job in INDEXED_JOBS if job[2] == name]}
+            for dept_id, name, parent, children in DEPARTMENTS
+        ]}
+    if path == "/offices":
+        return 200, {"offices": [
+            {"id": office_id, "name": name, "location": location, "parent_id": parent, "child_ids": children,
+             "departments": [{"id": 0, "name": "All", "jobs": [stub(job[0]) for job in INDEXED_JOBS
+                                                                 if job[4] == office_id]}]}
+            for office_id, name, location, parent, children in OFFICES
+        ]}
+    if path and path.startswith("/jobs/"):
+        return 200, _indexed_job(int(path.rsplit("/", 1)[1]))
+    return 404, {"status": 404, "error": "Job not found"}
+
+
+@contextmanager
+def indexed_board():
+    """Serve the indexed "acme" board from a temporary cache and archive; yields requested URLs."""
+    requested = []
+
+    class Response:
+        def __init__(self, url, status, payload):
+            self.url = url
+            self.status_code = status
+            self.content = json.dumps(payload).encode("utf-8")
+
+        def json(self):
+            return json.loads(self.content)
+
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise requests.exceptions.HTTPError(f"{self.status_code} for {self.url}", response=self)
+
+    def get(url, params=None, **kwargs):
+        requested.append(url.split("/boards/")[-1])
+        return Response(url, *_indexed_api(url, params))
+
+    saved = (local_cache.CACHE_DIR, payload_archive.ARCHIVE_DIR, payload_archive.ENABLED,
+             ats_sources.rate_limited_get)
+    with tempfile.TemporaryDirectory() as tmp:
+        local_cache.CACHE_DIR = Path(tmp)
+        payload_archive.ARCHIVE_DIR = Path(tmp) / "archive"
+        payload_archive.ENABLED = True
+        ats_sources.rate_limited_get = get
+        try:
+            yield requested
+        finally:
+            (local_cache.CACHE_DIR, payload_archive.ARCHIVE_DIR, payload_archive.ENABLED,
+             ats_sources.rate_limited_get) = saved
+
+
+# ============================================================
+# TESTS
+# ============================================================
+
+def test_iter_json_array():
+    """Elements come out whole however the body is split into chunks."""
+    print("\n" + "=" * 60)
+    print("Incremental JSON Array Parsing")
+    print("=" * 60)
+
+    body = json.dumps(BOARD)
+    expected = BOARD["jobs"]
+
+    def parse(chunks):
+        try:
+            return list(iter_json_array(chunks, "jobs"))
+        except ValueError as e:
+            return f"ValueError: {e}"
+
+    checks = [
+        ("single chunk", parse([body]), expected),
+        ("one character per chunk", parse(list(body)), expected),
+        ('"jobs" marker split', parse(['{"jo', 'bs"', ': [', body[body.index("[") + 1:]]), expected),
+        ("element split mid-string", parse(_split(body, 7)), expected),
+        ("empty array", parse(['{"jobs": [', ' ]', ', "meta": {"total": 0}}']), []),
+        ("missing key", parse(['{"meta": {"total": 0}}']), []),
+        ("truncated body", parse([body[:body.index('"id": 2') + 12]]),
+         "ValueError: Truncated JSON: 'jobs' array was never closed"),
+    ]
+
+    passed = 0
+    for name, got, want in checks:
+        ok = got == want
+        passed += ok
+        print(f"  {'✓' if ok else '✗'} {name}" + ("" if ok else f": {got!r}"))
+
+    print(f"\n  Passed: {passed}/{len(checks)}")
+    assert passed == len(checks)
+    return passed == len(checks)
+
+
+def test_streamed_utf8():
+    """Multibyte characters split across network chunks decode intact."""
+    print("\n" + "=" * 60)
+    print("Streamed UTF-8 Boundaries")
+    print("=" * 60)
+
+    raw = json.dumps(BOARD, ensure_ascii=False).encode("utf-8")
+
+    class Response:
+        def __init__(self, chunk_size):
+            self.chunk_size = chunk_size
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            pass
+
+        def raise_for_status(self):
+            pass
+
+        def iter_content(self, chunk_size):
+            for i in range(0, len(raw), self.chunk_size):
+                yield raw[i:i + self.chunk_size]
+
+    real_get = ats_sources.rate_limited_get
+    passed = 0
+    sizes = [1, 2, 3, 5]  # Every size splits some character mid-sequence
+    try:
+        for size in sizes:
+            ats_sources.rate_limited_get = lambda url, **kwargs: Response(size)
+            jobs = list(iter_greenhouse_jobs("example", content=False))
+            ok = jobs == BOARD["jobs"]
+            passed += ok
+            print(f"  {'✓' if ok else '✗'} {size}-byte chunks: {jobs[1]['title'] if len(jobs) > 1 else jobs}")
+    finally:
+        ats_sources.rate_limited_get = real_get
+
+    print(f"\n  Passed: {passed}/{len(sizes)}")
+    assert passed == len(sizes)
+    return passed == len(sizes)
+
+
+def test_select_job_ids():
+    """Department and office filters include child nodes."""
+    print("\n" + "=" * 60)
+    print("Department/Office Index")
+    print("=" * 60)
+
+    with indexed_board():
+        checks = [
+            # (filters, expected job IDs)
+            ({"department": "Engineering"}, {1, 2, 3, 6}),   # Children and grandchildren
+            ({"department": "infrastructure"}, {2, 6}),
+            ({"department": "Legal"}, set()),
+            ({"location": "San Francisco"}, {1, 4, 5}),      # SoMa office; job 5's own location
+            ({"location": "SF"}, {1, 4, 5}),
+            ({"department": "Engineering", "location": "New York"}, {2, 3, 6}),
+        ]
+        results = [(filters, expected, select_job_ids("acme", **filters)) for filters, expected in checks]
+
+    passed = 0
+    for filters, expected, (got, total) in results:
+        ok = got == expected and total == len(INDEXED_JOBS)
+        passed += ok
+        print(f"  {'✓' if ok else '✗'} {filters}: {sorted(got)} of {total}"
+              + ("" if ok else f" (expected {sorted(expected)})"))
+
+    print(f"\n  Passed: {passed}/{len(checks)}")
+    assert passed == len(checks)
+    return passed == len(checks)
+
+
+def test_filtered_replay():
+    """--replay of a --department/--location search selects the same jobs."""
+    print("\n" + "=" * 60)
+    print("Filtered Replay")
+    print("=" * 60)
+
+    today = datetime.now().strftime("%Y-%m-%d")
+    checks = []
+    with indexed_board() as requested:
+        # Engineering: 4 of 6 jobs, so the whole board is fetched; San Francisco: 3 jobs, one by one
+        for filters, expected, whole_board in [
+            ({"department": "Engineering"}, [1, 2, 3, 6], True),
+            ({"location": "San Francisco"}, [1, 4, 5], False),
+        ]:
+            requested.clear()
+            live_jobs, live_lines = search_companies(["acme"], **filters)
+            live_ids = [job.id for job in live_jobs]
+            fetched_board = "acme/jobs" in requested
+            replay_jobs, replay_lines = search_companies(["acme"], fetch=load_archived_jobs(today, **filters),
+                                                         **filters)
+
+            name = ", ".join(f"{k}={v}" for k, v in filters.items())
+            checks.append((f"{name}: live run selects {expected}", sorted(live_ids) == expected
+                           and fetched_board == whole_board))
+            checks.append((f"{name}: replay selects the same jobs",
+                           [job.to_dict() for job in replay_jobs] == [job.to_dict() for job in live_jobs]))
+            checks.append((f"{name}: replay output matches", replay_lines == live_lines))
+
+    passed = 0
+    for name, ok in checks:
+        passed += ok
+        print(f"  {'✓' if ok else '✗'} {name}")
+
+    print(f"\n  Passed: {passed}/{len(checks)}")
+    assert passed == len(checks)
+    return passed == len(checks)
+
+
+def test_cached_board_filters():
+    """A board cached by prewarm selects the same jobs as a live department/location search."""
+    print("\n" + "=" * 60)
+    print("Cached Board Filters")
+    print("=" * 60)
+
+    checks = []
+    with indexed_board() as requested:
+        ats_sources.fetch_board(ats_sources.ADAPTERS["greenhouse"], "acme")  # What prewarm.py does
+        for filters, expected in [
+            ({"department": "Engineering"}, [1, 2, 3, 6]),
+            ({"location": "San Francisco"}, [1, 4, 5]),
+            ({"department": "Engineering", "location": "New York"}, [2, 3, 6]),
+        ]:
+            live_jobs, _ = search_companies(["acme"], **filters)
+            requested.clear()
+            cached_jobs, cached_lines = search_companies(["acme"], max_age=ats_sources.BOARD_CACHE_TTL, **filters)
+
+            name = ", ".join(f"{k}={v}" for k, v in filters.items())
+            checks.append((f"{name}: cached board selects {expected}",
+                           sorted(job.id for job in cached_jobs) == expected
+                           and [job.to_dict() for job in cached_jobs] == [job.to_dict() for job in live_jobs]))
+            checks.append((f"{name}: served from cache", requested == []
+                           and any("(cached" in line for line in cached_lines)))
+
+    passed = 0
+    for name, ok in checks:
+        passed += ok
+        print(f"  {'✓' if ok else '✗'} {name}")
+
+    print(f"\n  Passed: {passed}/{len(checks)}")
+    assert passed == len(checks)
+    return passed == len(checks)
+
+
+def test_unreadable_board():
+    """An unreadable response or cache entry fails only its own board."""
+    print("\n" + "=" * 60)
+    print("Unreadable Boards")
+    print("=" * 60)
+
+    class Garbage:
+        status_code = 200
+        content = b"<html>Service Unavailable</html>"
+
+        def json(self):
+            return json.loads(self.content)
+
+        def raise_for_status(self):
+            pass
+
+    with indexed_board() as requested:
+        serve = ats_sources.rate_limited_get
+
+        def get(url, **kwargs):
+            if url.endswith("/boards/acme/jobs/4"):
+                return Garbage()
+            return serve(url.replace("/boards/mirror/", "/boards/acme/"), **kwargs)
+
+        ats_sources.rate_limited_get = get
+        jobs, lines = search_companies(["acme", "mirror"], location="San Francisco")
+        sweep_ok = (sorted(job.id for job in jobs) == [1, 4, 5] and {job.company for job in jobs} == {"mirror"}
+                    and any(line.startswith("  Error: Unreadable job for 'acme'") for line in lines))
+
+        def fetch(key):
+            if key == "acme":
+                raise ValueError("corrupt archive entry")
+            return {"jobs": [_indexed_job(1)]}
+
+        replayed, replay_lines = search_companies(["acme", "mirror"], fetch=fetch)
+        replay_ok = ([job.company for job in replayed] == ["mirror"]
+                     and "  Error: corrupt archive entry" in replay_lines)
+
+        adapter = ats_sources.ADAPTERS["greenhouse"]
+        cache_key = ats_sources._cache_key(adapter, "acme")
+        local_cache.store_cached("ats_boards", cache_key, b"not a board")
+        unparsable = ats_sources.cached_board(adapter, "acme")
+        local_cache._entry_path("ats_boards", cache_key).write_bytes(b"\x1f\x8b truncated")
+        undecodable = ats_sources.cached_board(adapter, "acme")
+        requested.clear()
+        refetched, _ = search_companies(["acme"], keyword="engineer", max_age=ats_sources.BOARD_CACHE_TTL)
+
+    checks = [
+        ("bad job page fails its board, the sweep goes on", sweep_ok),
+        ("failing fetch reported as that board's error", replay_ok),
+        ("unparsable cache entry is a miss", unparsable is None),
+        ("damaged cache file is a miss", undecodable is None),
+        ("board refetched live", requested == ["acme/jobs"] and len(refetched) == 2),
+    ]
+
+    passed = 0
+    for name, ok in checks:
+        passed += ok
+        print(f"  {'✓' if ok else '✗'} {name}")
+
+    print(f"\n  Passed: {passed}/{len(checks)}")
+    assert passed == len(checks)
+    return passed == len(checks)
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("\n" + "#" * 60)
+    print("# Greenhouse Search Test Suite - Streaming Parser and Board Index")
+    print("#" * 60)
+
+    results = []
+    for name, test in [
+        ("Incremental JSON Array Parsing", test_iter_json_array),
+        ("Streamed UTF-8 Boundaries", test_streamed_utf8),
+        ("Department/Office Index", test_select_job_ids),
+        ("Filtered Replay", test_filtered_replay),
+        ("Cached Board Filters", test_cached_board_filters),
+        ("Unreadable Boards", test_unreadable_board),
+    ]:
+        try:
+            results.append((name, test()))
+        except AssertionError:
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print("=" * 60)
+
+    all_passed = True
+    for name, passed in results:
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"  {status}: {name}")
+        if not passed:
+            all_passed = False
+
+    print()
+    return all_passed
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Test suite for job_records.py
+
+Round trips between raw Greenhouse job dicts and compact JobRecords.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from job_records import DescriptionStore, JobRecord
+
+JOBS = [
+    {
+        "id": 1,
+        "title": "Research Engineer",
+        "absolute_url": "https://boards.greenhouse.io/example/jobs/1",
+        "location": {"name": "San Francisco, CA"},
+        "metadata": None,
+        "updated_at": "2026-10-18T12:00:00-04:00",
+        "departments": [{"id": 10, "name": "Research", "parent_id": None, "child_ids": []}],
+        "offices": [{"id": 20, "name": "SF", "location": "San Francisco, CA"}],
+        "content": "&lt;p&gt;Build things — Zürich 🚀&lt;/p&gt;",
+        "internal_job_id": 100,
+    },
+    {
+        # Same categorical values, keys in a different order
+        "internal_job_id": 101,
+        "content": "",
+        "offices": [{"location": "San Francisco, CA", "name": "SF", "id": 20}],
+        "departments": [{"child_ids": [], "parent_id": None, "name": "Research", "id": 10}],
+        "updated_at": "2026-10-18T12:00:00-04:00",
+        "location": {"name": "San Francisco, CA"},
+        "id": 2,
+        "title": "Research Engineer",
+        "absolute_url": "https://boards.greenhouse.io/example/jobs/2",
+        "_company": "example",
+    },
+    {
+        # Lever/Ashby shape: no offices, no content key
+        "id": "abc-123",
+        "title": "ML Engineer",
+        "absolute_url": "https://jobs.lever.co/example/abc-123",
+        "location": {"name": "Remote"},
+        "departments": [],
+        "updated_at": None,
+        "source": "lever",
+    },
+]
+
+
+# ============================================================
+# TESTS
+# ============================================================
+
+def test_round_trip():
+    """to_dict() rebuilds the original dict, key order included."""
+    print("\n" + "=" * 60)
+    print("JobRecord Round Trip")
+    print("=" * 60)
+
+    store = DescriptionStore()
+    records = [JobRecord.from_dict(job, store=store) for job in JOBS]
+
+    passed = 0
+    for job, record in zip(JOBS, records):
+        rebuilt = record.to_dict()
+        ok = rebuilt == job and json.dumps(rebuilt) == json.dumps(job)
+        passed += ok
+        print(f"  {'✓' if ok else '✗'} {job['id']}" + ("" if ok else f": {list(rebuilt)} != {list(job)}"))
+
+    tagged = JobRecord.from_dict(JOBS[0], company="example", store=store).to_dict()
+    tag_ok = json.dumps(tagged) == json.dumps(dict(JOBS[0], _company="example"))
+    print(f"  {'✓' if tag_ok else '✗'} company tag appended as _company")
+
+    store.close()
+    print(f"\n  Passed: {passed}/{len(JOBS)}")
+    assert passed == len(JOBS) and tag_ok
+    return passed == len(JOBS) and tag_ok
+
+
+def test_shared_values():
+    """Identical categorical values are shared between records."""
+    print("\n" + "=" * 60)
+    print("Shared Categorical Values")
+    print("=" * 60)
+
+    store = DescriptionStore()
+    first, second = (JobRecord.from_dict(job, store=store) for job in JOBS[:2])
+    checks = [
+        ("same location shared", first.location is second.location),
+        ("reordered departments kept apart", first.departments is not second.departments),
+        ("description read back from store", first.content == JOBS[0]["content"]),
+        ("empty description kept", second.content == ""),
+    ]
+    store.close()
+
+    passed = 0
+    for name, ok in checks:
+        passed += ok
+        print(f"  {'✓' if ok else '✗'} {name}")
+
+    print(f"\n  Passed: {passed}/{len(checks)}")
+    assert passed == len(checks)
+    return passed == len(checks)
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("\n" + "#" * 60)
+    print("# Job Record Test Suite - Compact Records")
+    print("#" * 60)
+
+    results = []
+    for name, test in [
+        ("JobRecord Round Trip", test_round_trip),
+        ("Shared Categorical Values", test_shared_values),
+    ]:
+        try:
+            results.append((name, test()))
+        except AssertionError:
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print("=" * 60)
+
+    all_passed = True
+    for name, passed in results:
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"  {status}: {name}")
+        if not passed:
+            all_passed = False
+
+    print()
+    return all_passed
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Test suite for job_search.py
+
+Salary backfilling from posting descriptions, and the per-site query
+cache (scraping is replaced by a canned frame); no network access needed.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import pandas as pd
+
+import job_search
+import local_cache
+import payload_archive
+from job_search import backfill_salaries, filter_by_salary, iter_site_results
+
+SCRAPED = pd.DataFrame({
+    "id": ["in-1", "in-2"],
+    "site": ["indeed", "indeed"],
+    "job_url": ["https://example.com/1", "https://example.com/2"],
+    "title": ["ML Engineer", "Data Scientist"],
+    "company": ["Example", "Example"],
+    "location": ["San Francisco, CA", "Remote"],
+    "date_posted": [date(2026, 10, 18), None],
+    "interval": [None, "yearly"],
+    "min_amount": [None, 150000.0],
+    "max_amount": [None, 200000.0],
+    "is_remote": [False, True],
+    "description": ["Base salary $180k-$220k", "Remote role"],
+    "emails": [None, None],
+    "company_addresses": ["01234", "94105"],  # Numeric-looking strings stay strings
+})
+
+
+@contextmanager
+def fake_scraper():
+    """Temporary cache directory and a counting stand-in for jobspy.scrape_jobs."""
+    calls = []
+
+    def scrape_jobs(site_name, **kwargs):
+        calls.append(site_name[0])
+        return SCRAPED.copy()
+
+    saved = (local_cache.CACHE_DIR, payload_archive.ENABLED, job_search.scrape_jobs)
+    with tempfile.TemporaryDirectory() as tmp:
+        local_cache.CACHE_DIR = Path(tmp)
+        payload_archive.ENABLED = False
+        job_search.scrape_jobs = scrape_jobs
+        try:
+            yield calls
+        finally:
+            local_cache.CACHE_DIR, payload_archive.ENABLED, job_search.scrape_jobs = saved
+
+
+def run_search(**kwargs) -> dict:
+    return dict(iter_site_results("ML engineer", sites=["indeed"], **kwargs))
+
+# ============================================================
+# TESTS
+# ============================================================
+
+def test_backfill_salaries():
+    """Descriptions become annual (min, max) amounts; non-salary $ amounts don't."""
+    print("\n" + "=" * 60)
+    print("Salary Backfill")
+    print("=" * 60)
+
+    cases = [
+        # (description, expected (min, max))
+        ("Base salary: $150,000 - $200,000 per year", (150000, 200000)),
+        ("$150-200k DOE", (150000, 200000)),
+        ("Pay rate: $55 to $70/hr", (114400, 145600)),
+        ("We raised $40M. Base pay $180,000 - $220,000", (180000, 220000)),
+        ("Backed by a $1.2 billion fund. Compensation: $200k-$250k", (200000, 250000)),
+        ("Enjoy a $500 home office budget", (None, None)),
+        ("$45 - $60 DOE", (None, None)),  # No stated interval: not assumed hourly
+        ("$300/month wellness stipend. Salary $130,000", (130000, None)),
+        ("No salary listed", (None, None)),
+    ]
+
+    jobs = backfill_salaries(pd.DataFrame({
+        "description": [description for description, _ in cases],
+        "min_amount": [None] * len(cases),
+        "max_amount": [None] * len(cases),
+    }))
+
+    passed = 0
+    for (description, expected), (_, job) in zip(cases, jobs.iterrows()):
+        got = tuple(None if pd.isna(job[col]) else int(job[col]) for col in ("min_amount", "max_amount"))
+        ok = got == expected
+        passed += ok
+        print(f"  {'✓' if ok else '✗'} {description!r} -> {got}" + ("" if ok else f" (expected {expected})"))
+
+    print(f"\n  Passed: {passed}/{len(cases)}")
+    assert passed == len(cases)
+    return passed == len(cases)
+
+
+def test_min_salary_filter():
+    """A funding amount earlier in the description doesn't sink a real salary."""
+    print("\n" + "=" * 60)
+    print("Min Salary Filter")
+    print("=" * 60)
+
+    jobs = pd.DataFrame({
+        "title": ["ML Engineer", "Data Analyst", "Research Scientist"],
+        "description": [
+            "We raised $40M. Base pay $180,000 - $220,000",
+            "Salary: $90,000 - $110,000 per year",
+            "Competitive pay and a $500 learning budget",
+        ],
+        "min_amount": [None, None, None],
+    })
+    kept = filter_by_salary(backfill_salaries(jobs), 160000)["title"].tolist()
+    expected = ["ML Engineer", "Research Scientist"]  # Unknown salaries are kept by default
+
+    ok = kept == expected
+    print(f"  {'✓' if ok else '✗'} kept: {kept}" + ("" if ok else f" (expected {expected})"))
+    assert ok
+    return ok
+
+
+def test_query_cache():
+    """Cached sites come back unchanged until they expire or --refresh."""
+    print("\n" + "=" * 60)
+    print("Query Cache")
+    print("=" * 60)
+
+    with fake_scraper() as calls:
+        live = run_search()["indeed"]
+        cached = run_search()["indeed"]
+        scraped_once = calls == ["indeed"]
+
+        # Same search, differently spelled: same cache entry
+        dict(iter_site_results("  ml   ENGINEER ", sites=["indeed"]))
+        normalized = calls == ["indeed"]
+
+        refreshed = run_search(refresh=True)["indeed"]
+        refresh_scrapes = calls == ["indeed", "indeed"]
+
+        # Age the entry past its TTL (an hour for a 72-hour window)
+        stale = time.time() - job_search.query_cache_ttl(72) - 60
+        for path in (local_cache.CACHE_DIR / "jobspy_queries").glob("*.gz"):
+            os.utime(path, (stale, stale))
+        run_search()
+        expired_scrapes = calls == ["indeed"] * 3
+
+        run_search(hours_old=24)
+        other_window_scrapes = len(calls) == 4
+
+    checks = [
+        ("second search served from cache", scraped_once),
+        ("search term normalized", normalized),
+        ("same columns after read_json", list(cached.columns) == list(SCRAPED.columns)),
+        ("same values", cached.drop(columns="date_posted").equals(live.drop(columns="date_posted"))
+         and cached["date_posted"].tolist()[0].startswith("2026-10-18")),
+        ("numeric-looking strings kept", cached["company_addresses"].tolist() == ["01234", "94105"]),
+        ("--refresh re-scrapes", refresh_scrapes and refreshed.equals(live)),
+        ("expired entry re-scraped", expired_scrapes),
+        ("different window, different entry", other_window_scrapes),
+    ]
+
+    passed = 0
+    for name, ok in checks:
+        passed += ok
+        print(f"  {'✓' if ok else '✗'} {name}")
+
+    print(f"\n  Passed: {passed}/{len(checks)}")
+    assert passed == len(checks)
+    return passed == len(checks)
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("\n" + "#" * 60)
+    print("# Job Search Test Suite - Salary Parsing and Query Cache")
+    print("#" * 60)
+
+    results = []
+    for name, test in [
+        ("Salary Backfill", test_backfill_salaries),
+        ("Min Salary Filter", test_min_salary_filter),
+        ("Query Cache", test_query_cache),
+    ]:
+        try:
+            results.append((name, test()))
+        except AssertionError:
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print("=" * 60)
+
+    all_passed = True
+    for name, passed in results:
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"  {status}: {name}")
+        if not passed:
+            all_passed = False
+
+    print()
+    return all_passed
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test suite for locations.py
+
+Parsing and matching against the offline gazetteer; no network needed.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from locations import LocationMatcher, Place, location_matches, parse_location
+
+# ============================================================
+# TESTS
+# ============================================================
+
+def test_parse_location():
+    """Free-text locations become canonical Places."""
+    print("\n" + "=" * 60)
+    print("Location Parsing")
+    print("=" * 60)
+
+    sf = Place(city="San Francisco", state="CA", country="US", metro="SF Bay Area")
+    checks = [
+        ("San Francisco, CA", (sf,)),
+        ("SF", (sf,)),
+        ("New York or Remote", (Place(city="New York", state="NY", country="US", metro="New York"),
+                                Place(remote=True))),
+        ("Remote - US", (Place(country="US", remote=True),)),
+        ("Remote - California", (Place(state="CA", country="US", remote=True),)),
+        ("Bay Area", (Place(state="CA", country="US", metro="SF Bay Area"),)),
+        ("Portland, ME", (Place(state="ME", country="US"),)),  # Not Portland, OR
+        ("London, UK", (Place(city="London", country="GB", metro="London"),)),
+        ("Hybrid - Seattle office", (Place(city="Seattle", state="WA", country="US", metro="Seattle"),)),
+        ("Atlantis", ()),
+    ]
+
+    passed = 0
+    for text, expected in checks:
+        got = parse_location(text)
+        ok = got == expected
+        passed += ok
+        print(f"  {'✓' if ok else '✗'} {text!r}" + ("" if ok else f": {got} (expected {expected})"))
+
+    print(f"\n  Passed: {passed}/{len(checks)}")
+    assert passed == len(checks)
+    return passed == len(checks)
+
+
+def test_location_matching():
+    """Preferences match jobs at the same or a more specific place."""
+    print("\n" + "=" * 60)
+    print("Location Matching")
+    print("=" * 60)
+
+    checks = [
+        # (preference, job location, should match)
+        ("San Francisco, CA", "Oakland, CA", True),       # Same metro
+        ("SF", "San Francisco Bay Area", True),
+        ("New York", "Albany, New York", False),           # City, not the state
+        ("CA", "Chicago, IL", False),                      # No substring over-match
+        ("US", "Remote - US", True),
+        ("California", "Remote - California", True),
+        ("US", "Austin, TX", True),
+        ("Remote", "Remote - US", True),
+        ("Remote - US", "Remote", True),
+        ("Remote - US", "Remote - Canada", False),
+        ("New York", "Remote - US", False),
+        ("Atlantis", "Lost City of Atlantis", True),       # Unknown: substring fallback
+    ]
+
+    passed = 0
+    for preference, job_location, expected in checks:
+        got = location_matches(preference, job_location)
+        ok = got == expected
+        passed += ok
+        print(f"  {'✓' if ok else '✗'} {preference!r} ~ {job_location!r}: {got}")
+
+    matcher = LocationMatcher(["Remote", "Seattle"])
+    multi_ok = (matcher.accepts_remote and matcher.matches("Bellevue, WA")
+                and matcher.matches("Remote (EMEA)") and not matcher.matches("Boston, MA"))
+    print(f"  {'✓' if multi_ok else '✗'} multiple preferences")
+
+    print(f"\n  Passed: {passed}/{len(checks)}")
+    assert passed == len(checks) and multi_ok
+    return passed == len(checks) and multi_ok
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("\n" + "#" * 60)
+    print("# Location Test Suite - Offline Gazetteer")
+    print("#" * 60)
+
+    results = []
+    for name, test in [
+        ("Location Parsing", test_parse_location),
+        ("Location Matching", test_location_matching),
+    ]:
+        try:
+            results.append((name, test()))
+        except AssertionError:
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print("=" * 60)
+
+    all_passed = True
+    for name, passed in results:
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"  {status}: {name}")
+        if not passed:
+            all_passed = False
+
+    print()
+    return all_passed
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Test suite for payload_archive.py
+
+Archives into a temporary directory and replays a canned Greenhouse
+board, so no network access is needed.
+"""
+
+import json
+import sys
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import ats_sources
+import local_cache
+import payload_archive
+from greenhouse_search import load_archived_jobs, search_companies
+
+BOARD = {
+    "jobs": [
+        {"id": 1, "title": "Research Engineer", "absolute_url": "https://example.com/1",
+         "location": {"name": "San Francisco, CA"}, "departments": [{"name": "Research"}],
+         "updated_at": "2026-10-18T12:00:00Z",
+         "content": "&lt;p&gt;Salary: $200,000 - $250,000. Zürich welcome.&lt;/p&gt;"},
+        {"id": 2, "title": "Recruiter", "absolute_url": "https://example.com/2",
+         "location": {"name": "Remote"}, "departments": [{"name": "People"}],
+         "updated_at": "2026-10-17T12:00:00Z", "content": "&lt;p&gt;Hiring research teams.&lt;/p&gt;"},
+    ],
+    "meta": {"total": 2},
+}
+
+
+@contextmanager
+def temp_archive():
+    """Point the archive and the board cache at a fresh temporary directory."""
+    saved = (local_cache.CACHE_DIR, payload_archive.ARCHIVE_DIR, payload_archive.ENABLED)
+    with tempfile.TemporaryDirectory() as tmp:
+        local_cache.CACHE_DIR = Path(tmp)
+        payload_archive.ARCHIVE_DIR = Path(tmp) / "archive"
+        payload_archive.ENABLED = True
+        try:
+            yield Path(tmp) / "archive"
+        finally:
+            local_cache.CACHE_DIR, payload_archive.ARCHIVE_DIR, payload_archive.ENABLED = saved
+
+
+# ============================================================
+# TESTS
+# ============================================================
+
+def test_dedupe_and_index():
+    """Identical payloads share one object; the index keeps the latest per key."""
+    print("\n" + "=" * 60)
+    print("Content-Addressed Archive")
+    print("=" * 60)
+
+    today = datetime.now().strftime("%Y-%m-%d")
+    with temp_archive() as archive_dir:
+        first = payload_archive.archive_payload("greenhouse", "example", b'{"jobs": [1]}')
+        second = payload_archive.archive_payload("greenhouse", "example", b'{"jobs": [1]}')
+        other = payload_archive.archive_payload("greenhouse", "example", b'{"jobs": [2]}')
+        payload_archive.archive_payload("lever", "example", b'[]')
+
+        abandoned = payload_archive.ArchiveWriter("greenhouse", "abandoned")
+        abandoned.write(b'{"jobs": [')
+        abandoned.discard()
+
+        objects = sorted(p for p in (archive_dir / "objects").rglob("*") if p.is_file())
+        entries = list(payload_archive.iter_index(today))
+        latest = payload_archive.latest_entries(today, "greenhouse")
+
+        checks = [
+            ("same bytes, same hash", first == second != other),
+            ("one object per distinct payload", len(objects) == 3),
+            ("every fetch indexed", len(entries) == 4),
+            ("latest snapshot per key", list(latest) == ["example"] and latest["example"].sha256 == other),
+            ("payload round trip", payload_archive.load_payload(latest["example"]) == b'{"jobs": [2]}'),
+            ("abandoned writer leaves nothing", not any("abandoned" in e.key for e in entries)),
+            ("archived dates", payload_archive.archived_dates() == [today]),
+            ("no index for other dates", list(payload_archive.iter_index("1999-01-01")) == []),
+        ]
+
+    passed = 0
+    for name, ok in checks:
+        passed += ok
+        print(f"  {'✓' if ok else '✗'} {name}")
+
+    print(f"\n  Passed: {passed}/{len(checks)}")
+    assert passed == len(checks)
+    return passed == len(checks)
+
+
+def test_replay_matches_live():
+    """--replay of an archived board produces the live run's output."""
+    print("\n" + "=" * 60)
+    print("Offline Replay")
+    print("=" * 60)
+
+    raw = json.dumps(BOARD).encode("utf-8")
+
+    class Response:
+        status_code = 200
+        content = raw
+
+        def raise_for_status(self):
+            pass
+
+    real_get = ats_sources.rate_limited_get
+    today = datetime.now().strftime("%Y-%m-%d")
+    with temp_archive():
+        ats_sources.rate_limited_get = lambda url, **kwargs: Response()
+        try:
+            live_jobs, live_lines = search_companies(["example"], keyword="research", verbose=True)
+        finally:
+            ats_sources.rate_limited_get = real_get
+
+        fetch = load_archived_jobs(today)
+        replay_jobs, replay_lines = search_companies(["example"], keyword="research", verbose=True,
+                                                     fetch=fetch)
+        missing_jobs, missing_lines = search_companies(["other"], fetch=fetch)
+
+    checks = [
+        ("board listed for replay", fetch.boards == ["example"]),
+        ("same matches", [j.to_dict() for j in replay_jobs] == [j.to_dict() for j in live_jobs]
+         and len(live_jobs) == 2),
+        ("same output", replay_lines == live_lines),
+        ("unarchived board reported", not missing_jobs
+         and any("No archived snapshot of 'other'" in line for line in missing_lines)),
+    ]
+
+    passed = 0
+    for name, ok in checks:
+        passed += ok
+        print(f"  {'✓' if ok else '✗'} {name}")
+
+    print(f"\n  Passed: {passed}/{len(checks)}")
+    assert passed == len(checks)
+    return passed == len(checks)
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("\n" + "#" * 60)
+    print("# Payload Archive Test Suite - Offline Replay")
+    print("#" * 60)
+
+    results = []
+    for name, test in [
+        ("Content-Addressed Archive", test_dedupe_and_index),
+        ("Offline Replay", test_replay_matches_live),
+    ]:
+        try:
+            results.append((name, test()))
+        except AssertionError:
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print("=" * 60)
+
+    all_passed = True
+    for name, passed in results:
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"  {status}: {name}")
+        if not passed:
+            all_passed = False
+
+    print()
+    return all_passed
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
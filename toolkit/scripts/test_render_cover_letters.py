@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Test suite for render_cover_letters.py
+
+PDF cache keys and output file names. The PDF cache is seeded in a
+temporary directory, so no LaTeX engine is needed.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import local_cache
+from render_cover_letters import TEMPLATE_PATH, render_batch, render_letter, tex_hash
+
+LETTER_DATE = "October 19, 2026"
+
+APPLICATIONS = [
+    {"company": "Acme", "role": "ML", "cover_letter": "First letter."},
+    {"company": "Acme", "role": "ML", "cover_letter": "Second letter, same role."},
+    {"id": "Acme-ML-2", "company": "Acme", "role": "ML", "cover_letter": "Third letter."},
+    {"company": "Acme", "role": "Recruiter"},  # No text: skipped
+]
+
+
+# ============================================================
+# TESTS
+# ============================================================
+
+def test_cache_key():
+    """The PDF cache key covers both the source and the engine."""
+    print("\n" + "=" * 60)
+    print("PDF Cache Key")
+    print("=" * 60)
+
+    checks = [
+        ("same source and engine", tex_hash("tex", "pdflatex") == tex_hash("tex", "pdflatex")),
+        ("engine changes the key", tex_hash("tex", "pdflatex") != tex_hash("tex", "tectonic")),
+        ("source changes the key", tex_hash("tex", "pdflatex") != tex_hash("tex2", "pdflatex")),
+    ]
+
+    passed = 0
+    for name, ok in checks:
+        passed += ok
+        print(f"  {'✓' if ok else '✗'} {name}")
+
+    print(f"\n  Passed: {passed}/{len(checks)}")
+    assert passed == len(checks)
+    return passed == len(checks)
+
+
+def test_unique_file_names():
+    """Applications with the same slug get their own .tex/.pdf."""
+    print("\n" + "=" * 60)
+    print("Unique File Names")
+    print("=" * 60)
+
+    template = TEMPLATE_PATH.read_text(encoding="utf-8")
+    saved_cache = local_cache.CACHE_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        local_cache.CACHE_DIR = Path(tmp) / "cache"
+        try:
+            # Seed the cache with a stand-in PDF per letter, so nothing is compiled
+            for app in APPLICATIONS[:3]:
+                digest = tex_hash(render_letter(template, {}, app, LETTER_DATE), "pdflatex")
+                local_cache.atomic_write_bytes(local_cache.cache_path("cover_letters", f"{digest}.pdf"),
+                                               app["cover_letter"].encode())
+
+            output_dir = Path(tmp) / "letters"
+            compiled, reused, skipped, errors = render_batch(
+                APPLICATIONS, {}, output_dir, "pdflatex", letter_date=LETTER_DATE)
+            names = sorted(path.name for path in output_dir.iterdir())
+            pdfs = {name: (output_dir / name).read_bytes() for name in names if name.endswith(".pdf")}
+        finally:
+            local_cache.CACHE_DIR = saved_cache
+
+    expected = ["Acme-ML-2-2.pdf", "Acme-ML-2-2.tex", "Acme-ML-2.pdf", "Acme-ML-2.tex",
+                "Acme-ML.pdf", "Acme-ML.tex"]
+    checks = [
+        ("cached PDFs reused", (compiled, reused, errors) == (0, 3, [])),
+        ("letter without text skipped", skipped == ["Acme-Recruiter"]),
+        ("one file pair per letter", names == expected),
+        ("each PDF is its own letter", [pdfs["Acme-ML.pdf"], pdfs["Acme-ML-2.pdf"], pdfs["Acme-ML-2-2.pdf"]]
+         == [app["cover_letter"].encode() for app in APPLICATIONS[:3]]),
+    ]
+
+    passed = 0
+    for name, ok in checks:
+        passed += ok
+        print(f"  {'✓' if ok else '✗'} {name}")
+
+    print(f"\n  Passed: {passed}/{len(checks)}")
+    assert passed == len(checks)
+    return passed == len(checks)
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("\n" + "#" * 60)
+    print("# Cover Letter Test Suite - Batch Rendering")
+    print("#" * 60)
+
+    results = []
+    for name, test in [
+        ("PDF Cache Key", test_cache_key),
+        ("Unique File Names", test_unique_file_names),
+    ]:
+        try:
+            results.append((name, test()))
+        except AssertionError:
+            results.append((name, False))
+
+    print("\n" + "=" * 60)
+    print("Summary")
+    print("=" * 60)
+
+    all_passed = True
+    for name, passed in results:
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"  {status}: {name}")
+        if not passed:
+            all_passed = False
+
+    print()
+    return all_passed
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)